@@ -0,0 +1,427 @@
+# Copyright 2026 Niklas Glienke
+
+"""Load test the bot commands against a simulated discord gateway.
+
+The bot is set up with a temporary config directory and the default brevity
+terms, but never connects to discord. Instead, fake messages are passed to
+the command processing like messages from the gateway, and the replies are
+sent to stand-in channels which simulate the latency of the discord API:
+
+    uv run python benchmarks/load_test.py --requests 5000 --concurrency 500
+
+The results contain the throughput, the latency percentiles of every
+command and the lag of the event loop while the load test ran.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import discord
+import yaml
+from discord.ext import commands
+
+from cvw22_operations_officer.__main__ import DB_FILE, setup_config_dir
+from cvw22_operations_officer.bot import DiscordBot
+from cvw22_operations_officer.cogs.brevity_term_cog import BrevityTermCog
+from cvw22_operations_officer.cogs.config_cog import ConfigCog
+from cvw22_operations_officer.utils.rate_limiter import (
+    BUCKET_TYPES,
+    RateLimitExceeded,
+)
+
+DEFAULT_REQUESTS = 5000
+DEFAULT_CONCURRENCY = 500
+DEFAULT_CONFIG_RATIO = 0.1
+DEFAULT_MISS_RATIO = 0.1
+DEFAULT_SEND_LATENCY_MS = 50.0
+DEFAULT_SEED = 22
+LAG_INTERVAL_SECONDS = 0.01
+
+ADMIN_ID = 123456789012345678
+BOT_USER_ID = 1
+FIRST_USER_ID = 1000
+NUMBER_OF_USERS = 200
+NUMBER_OF_CHANNELS = 20
+
+
+@dataclass(frozen=True)
+class FakeUser:
+    """Stand in for the author of a message."""
+
+    id: int
+    bot: bool = False
+
+
+@dataclass
+class FakeChannel:
+    """Stand in for a text channel, which simulates the send latency."""
+
+    id: int
+    send_latency: float
+    sent_messages: int = 0
+
+    async def send(self, content: str) -> None:
+        """Simulate sending a message to discord.
+
+        Args:
+            content: The content of the message.
+
+        """
+        await asyncio.sleep(self.send_latency)
+        self.sent_messages += 1
+
+
+@dataclass
+class FakeMessage:
+    """Stand in for a message received from the gateway."""
+
+    id: int
+    content: str
+    author: FakeUser
+    channel: FakeChannel
+    guild: None = None
+    attachments: list[Any] = field(default_factory=list)
+    _state: None = field(default=None, repr=False)
+
+
+class LoadTestContext(commands.Context):
+    """A context which sends its replies to the stand-in channel."""
+
+    async def send(self, content: str | None = None, **kwargs: Any) -> None:
+        """Send a reply to the stand-in channel of the message.
+
+        Args:
+            content: The content of the reply.
+            **kwargs: Any further arguments, which are ignored.
+
+        """
+        await self.message.channel.send(content)
+
+
+class LoadTestBot(DiscordBot):
+    """A discord bot which creates load test contexts for its commands."""
+
+    async def get_context(
+        self, origin: Any, /, *, cls: type = LoadTestContext
+    ) -> Any:
+        """Get the load test context of a fake message.
+
+        Args:
+            origin: The fake message.
+            cls: The class of the context.
+
+        Returns:
+            The context of the fake message.
+
+        """
+        return await super().get_context(origin, cls=cls)
+
+
+class EventLoopLagMonitor:
+    """Measure how late the event loop wakes up a sleeping task."""
+
+    def __init__(self, interval: float = LAG_INTERVAL_SECONDS) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval: Interval between two measurements in seconds.
+
+        """
+        self.INTERVAL = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        """Sleep for the interval and record the delay of every wakeup."""
+        while True:
+            started_at = time.perf_counter()
+            await asyncio.sleep(self.INTERVAL)
+            self.lags.append(time.perf_counter() - started_at - self.INTERVAL)
+
+    def start(self) -> None:
+        """Start measuring the lag of the running event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop measuring."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+def get_percentiles(values: list[float]) -> dict[str, float]:
+    """Get the percentiles of durations in milliseconds.
+
+    Args:
+        values: The durations in seconds.
+
+    Returns:
+        The 50th, 95th and 99th percentile and the maximum in milliseconds.
+
+    """
+    if not values:
+        return {}
+
+    values = sorted(values)
+
+    def percentile(fraction: float) -> float:
+        return values[math.ceil(len(values) * fraction) - 1] * 1000
+
+    return {
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": values[-1] * 1000,
+    }
+
+
+def setup_load_test_config_dir(
+    config_dir: Path, rate_limits: bool
+) -> list[str]:
+    """Set up a config directory for the load test.
+
+    The digest and config watcher are disabled, so only the commands put
+    load on the bot.
+
+    Args:
+        config_dir: Path to the empty configuration directory.
+        rate_limits: Whether to keep the default rate limits.
+
+    Returns:
+        A list of all stored terms.
+
+    """
+    setup_config_dir(config_dir)
+    config_path = config_dir / "config.yaml"
+    config = yaml.safe_load(config_path.read_text(encoding="UTF-8"))
+    config["commands"] = {"config": True, "brevity_term": True}
+    config["tasks"]["brevity_term_digest"]["enabled"] = False
+    config["tasks"]["config_watcher"]["enabled"] = False
+    config["admins"] = [{"name": "Load Test", "id": ADMIN_ID}]
+
+    if not rate_limits:
+        config.pop("rate_limits", None)
+
+    config_path.write_text(yaml.safe_dump(config), encoding="UTF-8")
+
+    with sqlite3.connect(config_dir / DB_FILE) as connection:
+        rows = connection.execute("SELECT term FROM brevity_term").fetchall()
+
+    return [term for (term,) in rows]
+
+
+def get_messages(
+    terms: list[str], args: argparse.Namespace, channels: list[FakeChannel]
+) -> list[tuple[str, FakeMessage]]:
+    """Get the fake messages of the load test.
+
+    Args:
+        terms: All stored terms.
+        args: The parsed arguments.
+        channels: The stand-in channels to send the messages in.
+
+    Returns:
+        A list of tuples with the command name and the fake message.
+
+    """
+    generator = random.Random(args.seed)
+    messages = []
+
+    for message_id in range(args.requests):
+        channel = generator.choice(channels)
+
+        if generator.random() < args.config_ratio:
+            author = FakeUser(ADMIN_ID)
+            command, content = "config", "!config show"
+        else:
+            author = FakeUser(
+                generator.randrange(
+                    FIRST_USER_ID, FIRST_USER_ID + NUMBER_OF_USERS
+                )
+            )
+            term = (
+                f"NO MATCH {message_id}"
+                if generator.random() < args.miss_ratio
+                else generator.choice(terms)
+            )
+            command, content = "brevity_term", f'!brevity_term "{term}"'
+
+        messages.append(
+            (command, FakeMessage(message_id, content, author, channel))
+        )
+
+    return messages
+
+
+async def run_load_test(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test against a bot with a temporary config directory.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The results of the load test.
+
+    """
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        config_dir = Path(temporary_dir)
+        terms = setup_load_test_config_dir(config_dir, args.rate_limits)
+        bot = LoadTestBot(
+            config_dir, intents=discord.Intents.none(), command_prefix="!"
+        )
+        bot._connection.user = FakeUser(BOT_USER_ID, bot=True)  # type: ignore
+        errors: Counter[str] = Counter()
+
+        async def on_command_error(
+            ctx: commands.Context, error: commands.CommandError
+        ) -> None:
+            if not isinstance(error, RateLimitExceeded):
+                errors[type(error).__name__] += 1
+
+        bot.add_listener(on_command_error)
+        channels = [
+            FakeChannel(channel_id, args.send_latency_ms / 1000)
+            for channel_id in range(NUMBER_OF_CHANNELS)
+        ]
+        messages = get_messages(terms, args, channels)
+        latencies: defaultdict[str, list[float]] = defaultdict(list)
+        semaphore = asyncio.Semaphore(args.concurrency)
+        lag_monitor = EventLoopLagMonitor()
+
+        async def process(command: str, message: FakeMessage) -> None:
+            async with semaphore:
+                started_at = time.perf_counter()
+                await bot.process_commands(message)  # type: ignore
+                latencies[command].append(time.perf_counter() - started_at)
+
+        # Entering the bot sets up its event loop without logging in, which
+        # dispatching the command events requires.
+        async with bot:
+            await bot.add_cog(ConfigCog(bot))
+            await bot.add_cog(BrevityTermCog(bot))
+            await bot.setup_hook()
+            lag_monitor.start()
+            started_at = time.perf_counter()
+
+            try:
+                await asyncio.gather(
+                    *(
+                        process(command, message)
+                        for command, message in messages
+                    )
+                )
+            finally:
+                duration = time.perf_counter() - started_at
+                await lag_monitor.stop()
+
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "send_latency_ms": args.send_latency_ms,
+        "duration_seconds": duration,
+        "requests_per_second": args.requests / duration,
+        "sent_messages": sum(channel.sent_messages for channel in channels),
+        "errors": dict(errors),
+        "rate_limited": {
+            scope: bot._rate_limited.get(scope) for scope in BUCKET_TYPES
+        },
+        "latency": {
+            command: get_percentiles(values)
+            for command, values in latencies.items()
+        },
+        "event_loop_lag": get_percentiles(lag_monitor.lags),
+        "search_cache": bot.search_cache.cache_info()._asdict(),
+    }
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get parsed arguments.
+
+    Returns:
+        The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help="Total number of command invocations.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of concurrently processed invocations.",
+    )
+    parser.add_argument(
+        "--config-ratio",
+        type=float,
+        default=DEFAULT_CONFIG_RATIO,
+        help="Share of '!config show' among the invocations.",
+    )
+    parser.add_argument(
+        "--miss-ratio",
+        type=float,
+        default=DEFAULT_MISS_RATIO,
+        help="Share of brevity term searches which find nothing.",
+    )
+    parser.add_argument(
+        "--send-latency-ms",
+        type=float,
+        default=DEFAULT_SEND_LATENCY_MS,
+        help="Simulated latency of sending a message to discord.",
+    )
+    parser.add_argument(
+        "--rate-limits",
+        action="store_true",
+        help="Keep the default rate limits of the config template.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed of the generated invocations.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="File to write the results to as JSON.",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the load test and print its results.
+
+    Returns:
+        The exit code, which is 1 if any command failed.
+
+    """
+    args = get_arguments()
+    results = asyncio.run(run_load_test(args))
+    output = json.dumps(results, indent=4)
+
+    if args.output is not None:
+        args.output.write_text(output + "\n")
+
+    print(output)
+
+    return 1 if results["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+# Copyright 2026 Niklas Glienke
+
+"""Benchmark the brevity term search, digest pick and message formatting.
+
+The benchmarks run against synthetic databases of a given number of brevity
+terms, which are generated reproducibly from a fixed seed. Results are
+written as JSON and can be compared against a recorded baseline:
+
+    uv run python benchmarks/run_benchmarks.py --sizes 250 10000 \\
+        --baseline benchmarks/baseline.json
+
+Pass --output to record new results, e.g. to update the baseline after an
+intended change. The 1M database takes a long time to generate and index,
+so it is only benchmarked if requested with --sizes 1000000, ideally
+together with --data-dir to keep the generated database between runs.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from cvw22_operations_officer.cogs.brevity_term_cog import BrevityTermCog
+from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.services.brevity_term_service import (
+    BrevityTermService,
+)
+from cvw22_operations_officer.utils.database import (
+    DatabaseManager,
+    ReplicatedDatabaseManager,
+)
+from cvw22_operations_officer.utils.migrations import migrate
+
+DEFAULT_SIZES = (250, 10_000)
+DEFAULT_SEED = 22
+DEFAULT_MIN_SECONDS = 0.5
+DEFAULT_MAX_ITERATIONS = 10_000
+DEFAULT_MAX_REGRESSION = 0.25
+WARMUP_ITERATIONS = 5
+INSERT_BATCH_SIZE = 10_000
+
+SYLLABLES = (
+    "BA", "BO", "DA", "GE", "KI", "LO", "MA", "NE", "PI", "RA",
+    "SA", "TE", "VO", "WI", "ZU", "CH", "ST", "TR", "AN", "OR",
+)  # fmt: skip
+WORDS = (
+    "aircraft", "contact", "radar", "target", "weapons", "release",
+    "threat", "bearing", "range", "altitude", "friendly", "hostile",
+    "orbit", "point", "maneuver", "intercept", "launch", "mission",
+    "surface", "missile", "fighter", "sector", "tactics", "visual",
+)  # fmt: skip
+TAGS = ("[A/A]", "[A/S]", "[S/A]", "[MAR]", "[EW]", "[SO]")
+
+
+def generate_brevity_terms(size: int, seed: int) -> Iterator[BrevityTerm]:
+    """Generate reproducible, unique synthetic brevity terms.
+
+    Args:
+        size: Number of brevity terms.
+        seed: Seed of the random generator.
+
+    Yields:
+        Each synthetic brevity term.
+
+    """
+    generator = random.Random(seed)
+    seen_terms: set[str] = set()
+
+    while len(seen_terms) < size:
+        term = " ".join(
+            "".join(generator.choices(SYLLABLES, k=generator.randint(2, 4)))
+            for _ in range(generator.choice((1, 1, 2, 2, 3)))
+        )
+
+        if term in seen_terms:
+            continue
+
+        seen_terms.add(term)
+        descriptions = [
+            " ".join(
+                [
+                    *generator.sample(TAGS, k=generator.randint(0, 2)),
+                    *generator.choices(WORDS, k=generator.randint(6, 16)),
+                ]
+            ).capitalize()
+            + "."
+            for _ in range(generator.randint(1, 3))
+        ]
+
+        yield BrevityTerm(term, " & ".join(descriptions))
+
+
+def create_database(db_path: Path, size: int, seed: int) -> None:
+    """Create a synthetic database with the current schema.
+
+    Args:
+        db_path: Path to the database file.
+        size: Number of brevity terms.
+        seed: Seed of the random generator.
+
+    """
+    migrate(db_path)
+    brevity_terms = generate_brevity_terms(size, seed)
+
+    with sqlite3.connect(db_path) as connection:
+        while batch := [
+            (brevity_term.term, brevity_term.description, 0)
+            for brevity_term, _ in zip(brevity_terms, range(INSERT_BATCH_SIZE))
+        ]:
+            connection.executemany(
+                "INSERT INTO brevity_term (term, description, used_in_digest) "
+                "VALUES (?, ?, ?)",
+                batch,
+            )
+
+
+def measure(
+    function: Callable[[], object],
+    min_seconds: float,
+    max_iterations: int,
+    warmup_iterations: int = WARMUP_ITERATIONS,
+) -> dict[str, float]:
+    """Measure the latency of a function.
+
+    The function is called until the minimum time has passed or the maximum
+    number of iterations is reached, but at least once.
+
+    Args:
+        function: The function to measure.
+        min_seconds: Minimum total time to measure.
+        max_iterations: Maximum number of measured calls.
+        warmup_iterations: Number of unmeasured calls before the measurement.
+
+    Returns:
+        The number of calls, the median and 95th percentile latency in
+        microseconds and the throughput in calls per second.
+
+    """
+    for _ in range(warmup_iterations):
+        function()
+
+    latencies: list[int] = []
+    deadline = time.perf_counter() + min_seconds
+
+    while len(latencies) < max_iterations and (
+        time.perf_counter() < deadline or not latencies
+    ):
+        started_at = time.perf_counter_ns()
+        function()
+        latencies.append(time.perf_counter_ns() - started_at)
+
+    latencies.sort()
+
+    return {
+        "iterations": len(latencies),
+        "median_us": statistics.median(latencies) / 1000,
+        "p95_us": latencies[math.ceil(len(latencies) * 0.95) - 1] / 1000,
+        "ops_per_second": len(latencies) * 1e9 / sum(latencies),
+    }
+
+
+def get_benchmarks(
+    service: BrevityTermService,
+    replica_service: BrevityTermService,
+    sample: list[BrevityTerm],
+) -> dict[str, Callable[[], object]]:
+    """Get all benchmarks against a loaded service.
+
+    Args:
+        service: The service of the synthetic database.
+        replica_service: The service of the in-memory replica of the
+            synthetic database.
+        sample: Some brevity terms of the synthetic database.
+
+    Returns:
+        A dict with the name of the benchmark as key and the measured
+        function as value.
+
+    """
+    exact_term = sample[0].term
+    prefix = sample[1].term[:3]
+    description_words = " ".join(sample[2].description.split()[1:3])
+    misspelled_term = sample[3].term[:-1] + "X"
+
+    def search_database(
+        term: str, service: BrevityTermService = service
+    ) -> Callable[[], object]:
+        def function() -> object:
+            return service._search_database(term, 5)
+
+        return function
+
+    return {
+        "search_index_exact": lambda: service.get_brevity_terms_by_term(
+            exact_term
+        ),
+        "search_index_prefix": lambda: service.get_brevity_terms_by_term(
+            prefix
+        ),
+        "search_index_full_text": lambda: service.get_brevity_terms_by_term(
+            description_words
+        ),
+        "search_index_miss": lambda: service.get_brevity_terms_by_term(
+            "NOTHING MATCHES THIS"
+        ),
+        "search_database_exact": search_database(exact_term),
+        "search_database_prefix": search_database(prefix),
+        "search_database_full_text": search_database(description_words),
+        "search_replica_exact": search_database(exact_term, replica_service),
+        "search_replica_prefix": search_database(prefix, replica_service),
+        "search_replica_full_text": search_database(
+            description_words, replica_service
+        ),
+        "suggest": lambda: service.suggest_brevity_terms(misspelled_term),
+        "complete": lambda: service.complete_brevity_terms(prefix),
+        "digest_pick": service.get_brevity_term_for_digest,
+        "format_brevity_term": lambda: BrevityTermCog.format_brevity_term(
+            sample[4]
+        ),
+    }
+
+
+def run_size(
+    data_dir: Path, size: int, seed: int, min_seconds: float
+) -> dict[str, dict[str, float]]:
+    """Run all benchmarks against a synthetic database of a size.
+
+    Args:
+        data_dir: Directory of the synthetic databases.
+        size: Number of brevity terms.
+        seed: Seed of the random generator.
+        min_seconds: Minimum total time of every benchmark.
+
+    Returns:
+        A dict with the name of the benchmark as key and its results as
+        value.
+
+    """
+    db_path = data_dir / f"brevity_terms_{size}_{seed}.db"
+
+    if not db_path.exists():
+        print(f"Generating {size} brevity terms ...", file=sys.stderr)
+        create_database(db_path, size, seed)
+
+    database_manager = DatabaseManager(db_path)
+    service = BrevityTermService(database_manager)
+    replica_database_manager = ReplicatedDatabaseManager(db_path)
+    replica_service = BrevityTermService(replica_database_manager)
+    generator = random.Random(seed)
+    sample = generator.sample(list(generate_brevity_terms(size, seed)), 5)
+    results = {
+        "load_term_index": measure(service.load_term_index, 0, 1, 0),
+    }
+
+    benchmarks = get_benchmarks(service, replica_service, sample)
+
+    for name, function in benchmarks.items():
+        print(f"Running {name} on {size} brevity terms ...", file=sys.stderr)
+        results[name] = measure(function, min_seconds, DEFAULT_MAX_ITERATIONS)
+
+    database_manager.close()
+    replica_database_manager.close()
+
+    return results
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Print the change of every median latency against a baseline.
+
+    Args:
+        results: The results of this run.
+        baseline: The recorded baseline results.
+        max_regression: Maximum relative increase of a median latency.
+
+    Returns:
+        A list of the benchmarks which regressed beyond the maximum.
+
+    """
+    regressions = []
+
+    for size, benchmarks in results["results"].items():
+        for name, result in benchmarks.items():
+            baseline_result = baseline["results"].get(size, {}).get(name)
+
+            if baseline_result is None:
+                continue
+
+            change = result["median_us"] / baseline_result["median_us"] - 1
+            print(
+                f"{size:>9} {name:<28} {result['median_us']:>12.1f} us "
+                f"{change:>+8.1%}"
+            )
+
+            if change > max_regression:
+                regressions.append(f"{size}/{name}")
+
+    return regressions
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get parsed arguments.
+
+    Returns:
+        The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        metavar="number_of_terms",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Numbers of brevity terms of the synthetic databases.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed of the synthetic databases.",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=DEFAULT_MIN_SECONDS,
+        help="Minimum time every benchmark is measured.",
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help="Directory to keep the synthetic databases in between runs.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="File to write the results to as JSON.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="File with baseline results to compare against.",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Maximum relative increase of a median latency.",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmarks and compare them against a baseline.
+
+    Returns:
+        The exit code, which is 1 if a benchmark regressed.
+
+    """
+    args = get_arguments()
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        data_dir = args.data_dir or Path(temporary_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        for size in args.sizes:
+            results["results"][str(size)] = run_size(
+                data_dir, size, args.seed, args.min_seconds
+            )
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=4) + "\n")
+
+    if args.baseline is None:
+        print(json.dumps(results, indent=4))
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline, args.max_regression)
+
+    if regressions:
+        print(f"Regressed: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,42 +2,83 @@
 
 import argparse
 import asyncio
+import contextlib
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
 import shutil
 import sqlite3
+import sys
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 
-import discord
 from dotenv import load_dotenv
 
-from cvw22_operations_officer.bot import DiscordBot
-from cvw22_operations_officer.cogs import brevity_term_cog, config_cog
+from cvw22_operations_officer.services.brevity_term_service import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    BrevityTermService,
+    ImportSummary,
+)
+from cvw22_operations_officer.utils.brevity_term_files import (
+    read_brevity_terms,
+    write_brevity_terms,
+)
+from cvw22_operations_officer.utils.database import DatabaseManager
+from cvw22_operations_officer.utils.database_template import (
+    SEED_PATH,
+    restore_database_template,
+)
+from cvw22_operations_officer.utils.log_handlers import (
+    JsonFormatter,
+    RateLimitFilter,
+    SuppressedFormatter,
+    start_queue_logging,
+)
+from cvw22_operations_officer.utils.metrics import MetricsServer
+from cvw22_operations_officer.utils.migrations import migrate
+from cvw22_operations_officer.utils.startup_profile import StartupProfile
 
 DEFAULT_CONFIG_DIR = Path(__file__).resolve().parent / "config"
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_FORMAT = "text"
 DEFAULT_LOG_ROTATION_DAYS = 7
 DEFAULT_LOG_BACKUP_COUNT = 1
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_METRICS_PORT = 9464
 
 CONFIG_FILES = ("config.yaml",)
+DB_FILE = "cvw22_operations_officer.db"
 
 
 def setup_logging(
-    config_dir: str, log_level: str, log_rotate_days: int
+    config_dir: str,
+    log_level: str,
+    log_rotate_days: int,
+    log_format: str,
+    worker: int | None = None,
 ) -> logging.Logger:  # pragma: no cover
     """Set up the logging of the discord bot.
 
+    The log file is written by a background thread, so logging does not block
+    the event loop. Call sites which log too often are rate limited.
+
     Args:
         config_dir: Path to the configuration directory.
         log_level: Log level on which the logger minimum logs.
         log_rotate_days: Number of days until the log file rotates.
+        log_format: Either "text" or "json" for one JSON object per line.
+        worker: Number of the worker process, which gets its own log file.
 
     Returns:
         The configured logger object.
 
     """
-    log_file = Path(config_dir) / "cvw22_operations_officer.log"
+    log_file = Path(config_dir) / (
+        "cvw22_operations_officer.log"
+        if worker is None
+        else f"cvw22_operations_officer.worker-{worker}.log"
+    )
 
     if log_file.exists():
         log_file.unlink()
@@ -48,9 +89,13 @@ def setup_logging(
     # the log level can only be "INFO" or "DEBUG"
     logger.setLevel(logging.INFO if log_level == "INFO" else logging.DEBUG)
 
-    formatter = logging.Formatter(
-        "[%(filename)s:%(lineno)s] %(asctime)s: %(levelname)s: %(message)s"
-    )
+    if log_format == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = SuppressedFormatter(
+            "[%(filename)s:%(lineno)s] %(asctime)s: %(levelname)s: %(message)s"
+        )
+
     handler = TimedRotatingFileHandler(
         log_file,
         when="D",
@@ -58,7 +103,7 @@ def setup_logging(
         backupCount=DEFAULT_LOG_BACKUP_COUNT,
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    start_queue_logging(logger, handler, RateLimitFilter())
 
     return logger
 
@@ -66,6 +111,11 @@ def setup_logging(
 def setup_config_dir(config_dir: Path) -> None:
     """Set up the configuration directory with all required files.
 
+    A new database is created from the prebuilt template, or if the template
+    does not match its SQL sources, migrated and seeded with the default
+    brevity terms. The schema of an existing database is migrated to the
+    latest version.
+
     Args:
         config_dir: Path to the configuration directory.
 
@@ -75,8 +125,7 @@ def setup_config_dir(config_dir: Path) -> None:
 
     """
     config_templates_dir = Path(__file__).resolve().parent / "config_templates"
-    database_templates_dir = config_templates_dir / "database"
-    db_path = config_dir / "cvw22_operations_officer.db"
+    db_path = config_dir / DB_FILE
 
     if not config_dir.exists():
         config_dir.mkdir(parents=True)
@@ -92,24 +141,92 @@ def setup_config_dir(config_dir: Path) -> None:
             shutil.copyfile(config_templates_dir / file, file_path)
 
     if db_path.exists():
-        return
+        migrate(db_path)
+    elif not restore_database_template(db_path):
+        migrate(db_path)
+
+        with contextlib.closing(sqlite3.connect(db_path)) as connection:
+            connection.executescript(SEED_PATH.read_text(encoding="UTF-8"))
+
+
+def import_brevity_terms(
+    config_dir: Path,
+    file_path: Path,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+) -> ImportSummary:
+    """Import brevity terms from a file into the database.
+
+    Args:
+        config_dir: Path to the configuration directory.
+        file_path: Path to the CSV, JSON, JSON Lines or YAML file.
+        batch_size: Number of brevity terms written per transaction.
+
+    Returns:
+        The number of inserted and updated brevity terms.
+
+    """
+    database_manager = DatabaseManager(config_dir / DB_FILE)
+
+    try:
+        return BrevityTermService(database_manager).import_brevity_terms(
+            read_brevity_terms(file_path), batch_size
+        )
+    finally:
+        database_manager.close()
+
+
+def export_brevity_terms(config_dir: Path, file_path: Path) -> int:
+    """Export all brevity terms of the database into a file.
+
+    Args:
+        config_dir: Path to the configuration directory.
+        file_path: Path to the CSV, JSON, JSON Lines or YAML file.
+
+    Returns:
+        The number of exported brevity terms.
+
+    """
+    database_manager = DatabaseManager(config_dir / DB_FILE)
 
-    db_path.touch(exist_ok=False)
+    try:
+        return write_brevity_terms(
+            file_path,
+            BrevityTermService(database_manager).export_brevity_terms(),
+        )
+    finally:
+        database_manager.close()
 
-    with open(database_templates_dir / "schema.sql", "r") as f:
-        schema_script = f.read()
 
-    with open(database_templates_dir / "brevity_term.sql", "r") as f:
-        brevity_term_script = f.read()
+def get_shard_ranges(shard_count: int, processes: int) -> list[list[int]]:
+    """Split the shards into contiguous ranges for the worker processes.
 
-    connection = sqlite3.connect(db_path)
-    cursor = connection.cursor()
+    Args:
+        shard_count: Total number of shards.
+        processes: Number of worker processes.
 
-    cursor.executescript(schema_script)
-    cursor.executescript(brevity_term_script)
+    Returns:
+        A list with the shard IDs of every worker process, whose lengths
+        differ by at most one.
 
-    connection.commit()
-    connection.close()
+    Raises:
+        ValueError: If there are fewer shards than processes.
+
+    """
+    if processes < 1 or shard_count < processes:
+        raise ValueError(
+            f"Cannot split {shard_count} shards into {processes} processes."
+        )
+
+    size, remainder = divmod(shard_count, processes)
+    shard_ranges = []
+    start = 0
+
+    for worker in range(processes):
+        end = start + size + (worker < remainder)
+        shard_ranges.append(list(range(start, end)))
+        start = end
+
+    return shard_ranges
 
 
 def get_arguments() -> argparse.Namespace:  # pragma: no cover
@@ -145,39 +262,279 @@ def get_arguments() -> argparse.Namespace:  # pragma: no cover
         choices=["DEBUG", "INFO"],
         help="Log level the logger starts to log. Useful for troubleshooting.",
     )
+    parser.add_argument(
+        "--log-format",
+        metavar="log_format",
+        type=str,
+        default=DEFAULT_LOG_FORMAT,
+        choices=["text", "json"],
+        help="Format of the log file, either plain text or JSON lines.",
+    )
+    parser.add_argument(
+        "--metrics-host",
+        metavar="host",
+        type=str,
+        default=DEFAULT_METRICS_HOST,
+        help="Host the Prometheus /metrics endpoint listens on.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        metavar="port",
+        type=int,
+        default=DEFAULT_METRICS_PORT,
+        help="Port of the Prometheus /metrics endpoint, 0 to disable it.",
+    )
+    parser.add_argument(
+        "--sync-commands",
+        action="store_true",
+        help="Sync the slash commands with discord, e.g. after an update.",
+    )
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="Connect with the number of shards recommended by discord.",
+    )
+    parser.add_argument(
+        "--shard-count",
+        metavar="number_of_shards",
+        type=int,
+        help="Connect with a fixed number of shards.",
+    )
+    parser.add_argument(
+        "--processes",
+        metavar="number_of_processes",
+        type=int,
+        default=1,
+        help="Split the shards across worker processes, needs --shard-count.",
+    )
+    parser.add_argument(
+        "--in-memory-replica",
+        action="store_true",
+        help="Serve all database reads from an in-memory copy.",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print the timeline of the startup once the bot is ready.",
+    )
+
+    subparsers = parser.add_subparsers(
+        dest="command",
+        title="commands",
+        description="Without a command, the discord bot is started.",
+    )
+    import_parser = subparsers.add_parser(
+        "import-terms",
+        help="Insert or update brevity terms from a file.",
+    )
+    import_parser.add_argument(
+        "file",
+        type=Path,
+        help="CSV, JSON, JSON Lines or YAML file with brevity terms.",
+    )
+    import_parser.add_argument(
+        "--batch-size",
+        metavar="number_of_terms",
+        type=int,
+        default=DEFAULT_IMPORT_BATCH_SIZE,
+        help="Number of brevity terms written per transaction.",
+    )
+    export_parser = subparsers.add_parser(
+        "export-terms",
+        help="Write all brevity terms into a file.",
+    )
+    export_parser.add_argument(
+        "file",
+        type=Path,
+        help="CSV, JSON, JSON Lines or YAML file for the brevity terms.",
+    )
 
-    return parser.parse_args()
+    args = parser.parse_args()
 
+    if args.processes > 1 and args.shard_count is None:
+        parser.error("--processes requires --shard-count.")
+
+    return args
+
+
+async def main(
+    args: argparse.Namespace,
+    startup_profile: StartupProfile,
+    shard_ids: list[int] | None = None,
+    worker: int | None = None,
+) -> None:  # pragma: no cover
+    """Set up and run the discord bot.
+
+    The discord library and the cogs are only imported here, so the other
+    commands start without them. The cogs are loaded as extensions.
+
+    Args:
+        args: The parsed arguments.
+        startup_profile: The timeline to record the startup phases in.
+        shard_ids: IDs of the shards of this process, or None for all shards.
+        worker: Number of the worker process, or None without workers.
+
+    """
+    with startup_profile.phase("setup_logging"):
+        logger = setup_logging(
+            args.config_dir,
+            args.log_level,
+            args.log_rotate_days,
+            args.log_format,
+            worker,
+        )
 
-async def main() -> None:  # pragma: no cover
-    """Set up and run the discord bot."""
-    logger = setup_logging(
-        args.config_dir,
-        args.log_level,
-        args.log_rotate_days,
-    )
     discord_token = os.getenv("DISCORD_TOKEN")
 
     if discord_token is None:
         raise RuntimeError("No 'DISCORD_TOKEN' env variable found.")
 
+    with startup_profile.phase("import_discord"):
+        import discord
+
+        from cvw22_operations_officer.bot import DiscordBot, ShardedDiscordBot
+
     intents = discord.Intents.all()
-    discord_bot = DiscordBot(
-        Path(args.config_dir),
-        intents=intents,
-        command_prefix="!",
+    # Only one process syncs the slash commands.
+    sync_app_commands = args.sync_commands and not worker
+
+    with startup_profile.phase("init_bot"):
+        if args.sharded or args.shard_count is not None:
+            discord_bot: DiscordBot = ShardedDiscordBot(
+                Path(args.config_dir),
+                intents=intents,
+                command_prefix="!",
+                sync_app_commands=sync_app_commands,
+                startup_profile=startup_profile,
+                in_memory_replica=args.in_memory_replica,
+                shard_count=args.shard_count,
+                shard_ids=shard_ids,
+            )
+        else:
+            discord_bot = DiscordBot(
+                Path(args.config_dir),
+                intents=intents,
+                command_prefix="!",
+                sync_app_commands=sync_app_commands,
+                startup_profile=startup_profile,
+                in_memory_replica=args.in_memory_replica,
+            )
+
+    await discord_bot.load_extensions()
+
+    if args.profile_startup:
+
+        async def report_startup_profile() -> None:
+            discord_bot.remove_listener(report_startup_profile, "on_ready")
+            startup_profile.mark("ready")
+            report = startup_profile.report()
+            logger.info("Startup profile:\n%s", report)
+            print(report, file=sys.stderr)
+
+        discord_bot.add_listener(report_startup_profile, "on_ready")
+
+    metrics_server = None
+
+    if args.metrics_port:
+        # Every worker process serves its metrics on the next port.
+        metrics_server = MetricsServer(
+            discord_bot.metrics,
+            args.metrics_host,
+            args.metrics_port + (worker or 0),
+        )
+        await metrics_server.start()
+
+    logger.info(
+        "Starting CVW22 Operations Officer with shards %s ...",
+        "all" if shard_ids is None else shard_ids,
     )
 
-    await discord_bot.add_cog(config_cog.ConfigCog(discord_bot))
-    await discord_bot.add_cog(brevity_term_cog.BrevityTermCog(discord_bot))
+    try:
+        with startup_profile.phase("login"):
+            await discord_bot.login(discord_token)
+
+        await discord_bot.connect()
+    finally:
+        if metrics_server is not None:
+            await metrics_server.stop()
+
+
+def run_worker(
+    args: argparse.Namespace, shard_ids: list[int], worker: int
+) -> None:  # pragma: no cover
+    """Run the discord bot with a range of shards in a worker process.
+
+    Args:
+        args: The parsed arguments.
+        shard_ids: IDs of the shards of the worker process.
+        worker: Number of the worker process.
+
+    """
+    asyncio.run(main(args, StartupProfile(), shard_ids, worker))
+
+
+def launch_workers(args: argparse.Namespace) -> int:  # pragma: no cover
+    """Run the shards of the discord bot in multiple worker processes.
+
+    The workers share the config directory and therefore the database. If a
+    worker stops, all other workers are stopped as well, so a supervisor like
+    systemd or docker can restart the bot as a whole.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code, which is 1 if any worker failed.
+
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=run_worker,
+            args=(args, shard_ids, worker),
+            name=f"cvw22_operations_officer-worker-{worker}",
+        )
+        for worker, shard_ids in enumerate(
+            get_shard_ranges(args.shard_count, args.processes)
+        )
+    ]
+
+    for process in processes:
+        process.start()
+
+    try:
+        multiprocessing.connection.wait(
+            [process.sentinel for process in processes]
+        )
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+        for process in processes:
+            process.join()
 
-    logger.info("Starting CVW22 Operations Officer ...")
-    await discord_bot.start(discord_token)
+    return 0 if all(process.exitcode == 0 for process in processes) else 1
 
 
 if __name__ == "__main__":  # pragma: no cover
+    startup_profile = StartupProfile()
     args = get_arguments()
     load_dotenv()
-    setup_config_dir(Path(args.config_dir))
 
-    asyncio.run(main())
+    with startup_profile.phase("setup_config_dir"):
+        setup_config_dir(Path(args.config_dir))
+
+    match args.command:
+        case "import-terms":
+            inserted, updated = import_brevity_terms(
+                Path(args.config_dir), args.file, args.batch_size
+            )
+            print(f"Inserted {inserted} and updated {updated} brevity terms.")
+        case "export-terms":
+            count = export_brevity_terms(Path(args.config_dir), args.file)
+            print(f"Exported {count} brevity terms.")
+        case _ if args.processes > 1:
+            raise SystemExit(launch_workers(args))
+        case _:
+            asyncio.run(main(args, startup_profile))
@@ -1,14 +1,48 @@
 # Copyright 2025 Niklas Glienke
 
+import asyncio
+import datetime
 import logging
+import math
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import discord
 import yaml
 from discord.ext import commands
 
+from cvw22_operations_officer.models.config_model import (
+    BotConfig,
+    RateLimitsConfig,
+)
+from cvw22_operations_officer.services.async_brevity_term_service import (
+    AsyncBrevityTermService,
+)
 from cvw22_operations_officer.services.brevity_term_service import (
     BrevityTermService,
+    SearchPage,
+)
+from cvw22_operations_officer.services.job_run_service import JobRunService
+from cvw22_operations_officer.utils.cache import LRUCache
+from cvw22_operations_officer.utils.config_watcher import ConfigWatcher
+from cvw22_operations_officer.utils.database import (
+    DatabaseManager,
+    ReplicatedDatabaseManager,
+)
+from cvw22_operations_officer.utils.metrics import MetricsRegistry
+from cvw22_operations_officer.utils.rate_limiter import (
+    CommandRateLimiter,
+    RateLimitExceeded,
+)
+from cvw22_operations_officer.utils.scheduler import Scheduler
+from cvw22_operations_officer.utils.startup_profile import StartupProfile
+
+DEFAULT_TERM_WATCHER_INTERVAL_SECONDS = 5.0
+DEFAULT_EXTENSIONS = (
+    "cvw22_operations_officer.cogs.config_cog",
+    "cvw22_operations_officer.cogs.brevity_term_cog",
 )
 
 
@@ -20,47 +54,380 @@ class DiscordBot(commands.Bot):
     communication between the discord server and the bot itself.
     """
 
-    def __init__(self, config_dir: Path, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        config_dir: Path,
+        *args: Any,
+        sync_app_commands: bool = False,
+        startup_profile: StartupProfile | None = None,
+        in_memory_replica: bool = False,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the discord bot.
 
         Args:
             config_dir: Path to the configuration directory.
             *args: Any arguments for the parent class
+            sync_app_commands: Whether to sync the slash commands with discord
+                when the bot starts.
+            startup_profile: The timeline to record the startup phases of the
+                bot in.
+            in_memory_replica: Whether to serve all reads of the database from
+                an in-memory replica.
             **kwargs: Any key-word arguments for the parent class
 
         """
         super().__init__(*args, **kwargs)
 
         self.CONFIG_DIR = config_dir
+        self.SYNC_APP_COMMANDS = sync_app_commands
+        self.startup_profile = (
+            startup_profile
+            if startup_profile is not None
+            else StartupProfile()
+        )
         self.DB_PATH = config_dir / "cvw22_operations_officer.db"
         self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
-        self.config: dict = {}
-        self.brevity_term_service = BrevityTermService(self.DB_PATH)
+        self.config: BotConfig
+        self.scheduler = Scheduler(claim=self._claim_job_run)
+        self._config_listeners: list[Callable[[], None]] = []
+        self._fetched_channels: dict[int, Any] = {}
+        self._term_watcher_task: asyncio.Task | None = None
+        self._term_index_task: asyncio.Task | None = None
+        self.metrics = MetricsRegistry()
+        self.database_manager = (
+            ReplicatedDatabaseManager(self.DB_PATH)
+            if in_memory_replica
+            else DatabaseManager(self.DB_PATH)
+        )
+        self.job_run_service = JobRunService(self.database_manager)
+        self.brevity_term_service = BrevityTermService(
+            self.database_manager, self.metrics
+        )
+        self.search_cache: LRUCache[tuple[str, int], SearchPage] = LRUCache()
+        self.brevity_term_service.add_change_listener(self.search_cache.clear)
+        self.async_brevity_term_service = AsyncBrevityTermService(
+            self.brevity_term_service,
+            max_workers=self.database_manager.READ_POOL_SIZE,
+        )
+        self._command_duration = self.metrics.histogram(
+            "discord_command_duration_seconds",
+            "Duration of a command from its invocation to its completion.",
+            ("command", "status"),
+        )
+        self._rate_limited = self.metrics.counter(
+            "discord_command_rate_limited",
+            "Number of commands rejected by a rate limit.",
+            ("scope",),
+        )
+        self._register_gauges()
+
+        self.rate_limiter = CommandRateLimiter(RateLimitsConfig())
+        # Checked once per invocation, so listing the commands in the help
+        # does not take a token for every listed command.
+        self.add_check(self._check_rate_limits, call_once=True)
+        self.config_watcher = ConfigWatcher(
+            self.CONFIG_DIR / "config.yaml", self.get_config
+        )
 
         self.get_config()
 
+    def _register_gauges(self) -> None:
+        """Register the gauges which are computed when they are rendered."""
+        self.metrics.gauge(
+            "discord_gateway_latency_seconds",
+            "Latency between a gateway heartbeat and its acknowledgement.",
+        ).set_function(lambda: self.latency)
+
+        cache_counters = {
+            "hits": "Number of search cache hits.",
+            "misses": "Number of search cache misses.",
+            "evictions": "Number of evicted or expired search results.",
+        }
+
+        for field_name, documentation in cache_counters.items():
+            self.metrics.counter(
+                f"brevity_term_search_cache_{field_name}", documentation
+            ).set_function(
+                lambda field_name=field_name: getattr(
+                    self.search_cache.cache_info(), field_name
+                )
+            )
+
+        self.metrics.gauge(
+            "brevity_term_search_cache_current_size",
+            "Number of cached search results.",
+        ).set_function(lambda: self.search_cache.cache_info().current_size)
+
+    async def invoke(self, ctx: commands.Context) -> None:
+        """Invoke a command and record its duration.
+
+        Args:
+            ctx: The discord context of the command.
+
+        """
+        if ctx.command is None:
+            await super().invoke(ctx)
+            return
+
+        started_at = time.perf_counter()
+
+        try:
+            await super().invoke(ctx)
+        finally:
+            self._command_duration.observe(
+                time.perf_counter() - started_at,
+                ctx.command.qualified_name,
+                "failed" if ctx.command_failed else "succeeded",
+            )
+
+    async def _check_rate_limits(self, ctx: commands.Context) -> bool:
+        """Check whether a command is within the rate limits.
+
+        Admins are never limited, so they can still use the bot while it is
+        flooded with commands.
+
+        Args:
+            ctx: The discord context of the command.
+
+        Returns:
+            True if the command is within the rate limits.
+
+        Raises:
+            RateLimitExceeded: If a rate limit rejected the command.
+
+        """
+        if ctx.author.id in self.config.admin_ids:
+            return True
+
+        try:
+            self.rate_limiter.check(ctx.message)
+        except RateLimitExceeded as e:
+            self._rate_limited.inc(e.scope)
+            raise
+
+        return True
+
+    async def on_command_error(
+        self, ctx: commands.Context, error: commands.CommandError
+    ) -> None:
+        """Handle an error of a command.
+
+        A rejection by a rate limit is only answered once per period, so the
+        replies do not add to the flood.
+
+        Args:
+            ctx: The discord context of the command.
+            error: The error of the command.
+
+        """
+        if not isinstance(error, RateLimitExceeded):
+            await super().on_command_error(ctx, error)
+        elif error.is_first:
+            await ctx.send(
+                "Too many commands, please try again in "
+                f"{math.ceil(error.retry_after)} seconds."
+            )
+
+    async def load_extensions(
+        self, extensions: tuple[str, ...] = DEFAULT_EXTENSIONS
+    ) -> None:
+        """Load the extensions of the cogs concurrently.
+
+        Args:
+            extensions: The module names of the extensions.
+
+        """
+        with self.startup_profile.phase("load_extensions"):
+            await asyncio.gather(
+                *(self.load_extension(extension) for extension in extensions)
+            )
+
+    async def setup_hook(self) -> None:
+        """Start loading the brevity term index and the background tasks.
+
+        The index is loaded in the background, so the bot connects to discord
+        in the meantime. Until the index is loaded, searches are served by the
+        database. The config watcher is only started if it is enabled in the
+        config. The slash commands are only synced if requested, since
+        discord limits how often they may be synced.
+        """
+        self._term_index_task = asyncio.create_task(self._load_term_index())
+        self.scheduler.start()
+        self._term_watcher_task = asyncio.create_task(
+            self._watch_brevity_terms(DEFAULT_TERM_WATCHER_INTERVAL_SECONDS)
+        )
+
+        if self.SYNC_APP_COMMANDS:
+            app_commands = await self.tree.sync()
+            self.logger.info("Synced %d slash commands.", len(app_commands))
+
+        watcher_config = self.config.tasks.config_watcher
+
+        if watcher_config.enabled:
+            self.config_watcher.start(watcher_config.interval_seconds)
+
+    async def _load_term_index(self) -> None:
+        """Load the brevity term index and log if it fails."""
+        try:
+            with self.startup_profile.phase("load_term_index"):
+                await self.async_brevity_term_service.load_term_index()
+        except Exception:
+            self.logger.exception("Loading the brevity term index failed.")
+
+    async def _watch_brevity_terms(self, interval_seconds: float) -> None:
+        """Catch up with changes of the brevity terms on every interval.
+
+        Other processes which share the database, like further bot processes
+        or the import command, change the brevity terms without this process
+        noticing. The index and the search cache are refreshed once they did.
+
+        Args:
+            interval_seconds: Number of seconds between two checks.
+
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+
+            try:
+                await self.async_brevity_term_service.reload_if_changed()
+            except Exception:
+                self.logger.exception("Checking the brevity terms failed.")
+
+    async def _claim_job_run(
+        self, name: str, due_at: datetime.datetime
+    ) -> bool:
+        """Claim the run of a scheduled job in the shared database.
+
+        Args:
+            name: The unique name of the job.
+            due_at: The due time of the run.
+
+        Returns:
+            A bool which indicates whether this process runs the job.
+
+        """
+        return await asyncio.to_thread(
+            self.job_run_service.claim_job_run, name, due_at
+        )
+
     async def on_ready(self) -> None:  # pragma: no cover
         """Log message that the bot is ready."""
         self.logger.info("CVW22 Operations Officer is ready!")
 
+    async def close(self) -> None:
+        """Close the discord connection and the database connections.
+
+        The background tasks are cancelled and awaited first, so none of them
+        is still using the services once they are closed.
+        """
+        await super().close()
+        await self.config_watcher.stop()
+        await self.scheduler.stop()
+
+        for task in (self._term_index_task, self._term_watcher_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        self._term_index_task = None
+        self._term_watcher_task = None
+        await self.async_brevity_term_service.close()
+        self.database_manager.close()
+
+    async def resolve_channel(self, channel_id: int) -> Any | None:
+        """Get a channel from the cache or fetch it from discord.
+
+        Fetched channels are cached, so each unknown channel is only fetched
+        once.
+
+        Args:
+            channel_id: ID of the channel.
+
+        Returns:
+            The channel or None if it does not exist or is not accessible.
+
+        """
+        channel = self.get_channel(channel_id)
+
+        if channel is not None:
+            return channel
+        elif channel_id in self._fetched_channels:
+            return self._fetched_channels[channel_id]
+
+        try:
+            channel = await self.fetch_channel(channel_id)
+        except discord.HTTPException as e:
+            self.logger.error("Could not fetch channel %d: %s", channel_id, e)
+            return None
+
+        self._fetched_channels[channel_id] = channel
+
+        return channel
+
+    def add_config_listener(self, listener: Callable[[], None]) -> None:
+        """Register a function which is called after the config is loaded.
+
+        Args:
+            listener: The function to call.
+
+        """
+        self._config_listeners.append(listener)
+
+    def remove_config_listener(self, listener: Callable[[], None]) -> None:
+        """Remove a registered config listener.
+
+        Args:
+            listener: The function to remove.
+
+        """
+        if listener in self._config_listeners:
+            self._config_listeners.remove(listener)
+
     def get_config(self) -> None:
         """Get the config from the config.yaml file.
 
+        The config is validated before it replaces the current config, so an
+        invalid file keeps the current config. All config listeners are
+        called after the config has been replaced.
+
         Raises:
             FileNotFoundError: If the config.yaml could not be accessed.
             yaml.YAMLError: If the YAML content is invalid.
+            ValueError: If the config is invalid.
 
         """
         try:
             with open(
                 self.CONFIG_DIR / "config.yaml", "r", encoding="UTF-8"
             ) as f:
-                self.config = yaml.safe_load(f)
+                config = BotConfig.from_dict(yaml.safe_load(f))
         except FileNotFoundError:
             self.logger.critical(
                 "No 'config.yaml' found in the config directory."
             )
             raise
         except yaml.YAMLError as e:
-            self.logger.critical(f"Invalid 'config.yaml': {e}.")
+            self.logger.critical("Invalid 'config.yaml': %s.", e)
+            raise
+        except ValueError as e:
+            self.logger.critical("Invalid 'config.yaml': %s", e)
             raise
+
+        self.config = config
+
+        if config.rate_limits != self.rate_limiter.config:
+            self.rate_limiter = CommandRateLimiter(config.rate_limits)
+
+        for listener in self._config_listeners:
+            listener()
+
+
+class ShardedDiscordBot(DiscordBot, commands.AutoShardedBot):
+    """A discord bot which connects to discord with multiple shards.
+
+    Each shard has its own gateway connection for a part of the guilds. The
+    shards of a process share its state, and processes which run the other
+    shards share the database: Scheduled jobs are claimed, so they only run
+    once, and changes of the brevity terms are picked up by every process.
+    """
@@ -1,14 +1,45 @@
 # Copyright 2025 Niklas Glienke
 
-import datetime
+import asyncio
+import functools
 import logging
-from zoneinfo import ZoneInfo
+from collections import defaultdict
+from dataclasses import dataclass
 
-from discord import TextChannel
-from discord.ext import commands, tasks
+import discord
+from discord import TextChannel, app_commands
+from discord.ext import commands
 
 from cvw22_operations_officer.bot import DiscordBot
 from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.models.config_model import RENDER_EMBED
+from cvw22_operations_officer.services.brevity_term_index import (
+    SearchCursor,
+    SearchResult,
+)
+from cvw22_operations_officer.services.brevity_term_service import SearchPage
+from cvw22_operations_officer.utils.debouncer import Debouncer
+from cvw22_operations_officer.utils.single_flight import SingleFlight
+
+DIGEST_JOB_PREFIX = "brevity_term_digest@"
+DEFAULT_MAX_CONCURRENT_DIGEST_SENDS = 5
+SEARCH_PAGE_SIZE = 5
+PAGINATOR_TIMEOUT_SECONDS = 180.0
+MAX_MESSAGE_LENGTH = 2000
+MAX_EMBEDS_LENGTH = 6000
+MAX_EMBED_TITLE_LENGTH = 256
+MAX_EMBED_DESCRIPTION_LENGTH = 4096
+AUTOCOMPLETE_DEBOUNCE_SECONDS = 0.1
+MAX_AUTOCOMPLETE_CHOICES = 25
+MAX_CHOICE_LENGTH = 100
+
+
+@dataclass
+class DigestDeliveryStats:
+    """Count the outcomes of the digest for a single channel."""
+
+    sent: int = 0
+    failed: int = 0
 
 
 class BrevityTermCog(commands.Cog):
@@ -23,94 +54,354 @@ class BrevityTermCog(commands.Cog):
         """
         self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
         self.bot = discord_bot
+        self.digest_stats: defaultdict[int, DigestDeliveryStats] = defaultdict(
+            DigestDeliveryStats
+        )
+        self._digest_send_semaphore = asyncio.Semaphore(
+            DEFAULT_MAX_CONCURRENT_DIGEST_SENDS
+        )
+        self._search_flights: SingleFlight[
+            tuple[str, int, SearchCursor | None], SearchPage
+        ] = SingleFlight()
+        self.bot.metrics.gauge(
+            "brevity_term_search_shared_queries",
+            "Number of searches which shared the query of an identical "
+            "search in flight.",
+        ).set_function(lambda: self._search_flights.shared_calls)
+        self._autocomplete_debouncer: Debouncer[int] = Debouncer(
+            AUTOCOMPLETE_DEBOUNCE_SECONDS
+        )
+        self._autocompletions = self.bot.metrics.counter(
+            "brevity_term_autocompletions",
+            "Number of autocomplete interactions of the brevity_term command.",
+            ("status",),
+        )
+        self._send_duration = self.bot.metrics.histogram(
+            "discord_send_duration_seconds",
+            "Duration of sending a message to discord.",
+            ("kind",),
+        )
+        self._digest_fires = self.bot.metrics.counter(
+            "brevity_term_digest_fires",
+            "Number of times the 'Brevity Term Digest' task has fired.",
+        )
+        self._digest_misses = self.bot.metrics.counter(
+            "brevity_term_digest_misses",
+            "Number of fired digests which could not send a brevity term.",
+            ("reason",),
+        )
+        self._digest_deliveries = self.bot.metrics.counter(
+            "brevity_term_digest_deliveries",
+            "Number of digest deliveries to a single channel.",
+            ("status",),
+        )
+
+    async def cog_load(self) -> None:
+        """Schedule 'Brevity Term Digest' task when cog is loaded.
+
+        The task is rescheduled whenever the bot config is loaded again.
+        """
+        self.bot.add_config_listener(self._schedule_brevity_term_digest)
+        self._schedule_brevity_term_digest()
 
-    async def cog_load(self) -> None:  # pragma: no cover
-        """Start 'Brevity Term Digest' task when cog is loaded."""
-        if self.brevity_term_digest.is_running():
+    async def cog_unload(self) -> None:
+        """Unschedule 'Brevity Term Digest' task when cog is unloaded."""
+        self.bot.remove_config_listener(self._schedule_brevity_term_digest)
+        self._unschedule_brevity_term_digest()
+
+    def _unschedule_brevity_term_digest(self) -> None:
+        """Remove all schedules of the 'Brevity Term Digest' task."""
+        for name in self.bot.scheduler.jobs:
+            if name.startswith(DIGEST_JOB_PREFIX):
+                self.bot.scheduler.unschedule(name)
+
+    def _schedule_brevity_term_digest(self) -> None:
+        """Schedule 'Brevity Term Digest' task from the bot config.
+
+        All targets which are due at the same time in the same timezone share
+        one schedule, as grouped when the config was loaded.
+        """
+        self._unschedule_brevity_term_digest()
+
+        task_config = self.bot.config.tasks.brevity_term_digest
+
+        if not task_config.enabled:
+            self.logger.info("'Brevity Term Digest' task is disabled.")
             return
 
-        self.brevity_term_digest.start()
+        for schedule in task_config.schedules:
+            self.bot.scheduler.schedule(
+                f"{DIGEST_JOB_PREFIX}{schedule.name}",
+                schedule.at,
+                schedule.timezone,
+                functools.partial(
+                    self.brevity_term_digest, schedule.channel_ids
+                ),
+            )
 
-    @commands.command()
+    @commands.hybrid_command(description="Search for brevity terms.")
+    @app_commands.describe(search_term="The term or words to search for.")
     async def brevity_term(
         self, ctx: commands.Context, search_term: str
     ) -> None:
         """Coordinate all brevity term commands.
 
+        The command is available as prefix and as slash command. The found
+        brevity terms are replied as MARKDOWN text or as embeds, depending on
+        the render target in the config.
+
         Args:
             ctx: The discord context of the command.
             search_term: The term to search for.
 
         """
-        if not self.bot.config["commands"]["brevity_term"]:
+        if not self.bot.config.commands.brevity_term:
             await ctx.send("The `brevity_term` command has been disabled.")
             return
 
         self.logger.info(
-            f"Execute 'brevity_term' command with '{search_term}'."
+            "Execute 'brevity_term' command with '%s'.", search_term
+        )
+
+        page = await self._get_search_page(search_term)
+
+        if not page.results:
+            output_message = await self._get_not_found_message(search_term)
+
+            with self._send_duration.time("command"):
+                await ctx.send(output_message)
+
+            return
+
+        paginator = BrevityTermPaginator(
+            self,
+            ctx.author.id,
+            search_term,
+            self.bot.config.commands.brevity_term_render,
         )
+        content, embeds = paginator.render(page)
+
+        with self._send_duration.time("command"):
+            paginator.message = await ctx.send(
+                content,
+                embeds=embeds,
+                view=paginator if paginator.has_pages else None,
+            )
+
+    @brevity_term.autocomplete("search_term")
+    async def brevity_term_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        """Complete the search term of the slash command while it is typed.
+
+        Discord sends an interaction for every keystroke. Only the last
+        keystroke of a user within the debounce delay is completed, the
+        superseded interactions are answered without choices. The terms are
+        completed from the in-memory index, so no database query is made.
+
+        Args:
+            interaction: The autocomplete interaction.
+            current: The partially typed search term.
+
+        Returns:
+            A list of the completed terms as choices.
+
+        """
+        if not self.bot.config.commands.brevity_term:
+            return []
+
+        if not await self._autocomplete_debouncer.wait(interaction.user.id):
+            self._autocompletions.inc("superseded")
+            return []
+
+        self._autocompletions.inc("completed")
+        terms = self.bot.brevity_term_service.complete_brevity_terms(
+            current, MAX_AUTOCOMPLETE_CHOICES
+        )
+
+        return [
+            app_commands.Choice(
+                name=truncate(term, MAX_CHOICE_LENGTH),
+                value=term[:MAX_CHOICE_LENGTH],
+            )
+            for term in terms
+        ]
 
-        await ctx.send(self._search_brevity_term(search_term))
+    async def _get_search_page(
+        self, search_term: str, cursor: SearchCursor | None = None
+    ) -> SearchPage:
+        """Get a page of the matching brevity terms by a search term.
 
-    def _search_brevity_term(self, search_term: str) -> str:
-        """Get matching brevity terms by a search term.
+        Found first pages are cached by the normalized search term, so that
+        repeated lookups do not query the brevity terms again. Further pages
+        are seeked from the cursor of the previous page. Identical searches
+        which are in flight at the same time share a single query.
 
         Args:
             search_term: The search term to search for.
+            cursor: The next_cursor of the previous page, or None for the
+                first page.
 
         Returns:
-            The formatted result of the search.
+            The page of the matching brevity terms.
 
         """
-        response = self.bot.brevity_term_service.get_brevity_terms_by_term(
-            search_term
+        service = self.bot.async_brevity_term_service
+        cache_key = (
+            " ".join(search_term.split()).casefold(),
+            SEARCH_PAGE_SIZE,
         )
-        output_message = ""
 
-        if response:
-            for brevity_term in response:
-                output_message += BrevityTermCog.format_brevity_term(
-                    brevity_term
-                )
-                output_message += "\n"
-        else:
-            output_message = f"No brevity terms found with `{search_term}`."
+        if cursor is not None:
+            return await self._search_flights.run(
+                (*cache_key, cursor),
+                lambda: service.search_brevity_terms(
+                    search_term, SEARCH_PAGE_SIZE, cursor
+                ),
+            )
+
+        cached_page = self.bot.search_cache.get(cache_key)
+
+        if cached_page is not None:
+            return cached_page
+
+        # A search which started before the brevity terms changed must not
+        # be cached afterwards, nor be shared with searches started after.
+        generation = self.bot.search_cache.generation
+        page = await self._search_flights.run(
+            (*cache_key, None, generation),
+            lambda: service.search_brevity_terms(
+                search_term, SEARCH_PAGE_SIZE
+            ),
+        )
+
+        if page.results:
+            self.bot.search_cache.set(cache_key, page, generation)
+
+        return page
+
+    async def _get_not_found_message(self, search_term: str) -> str:
+        """Get the reply for a search term without matches.
+
+        Args:
+            search_term: The search term without matches.
+
+        Returns:
+            The reply, which suggests similar brevity terms if there are any.
+
+        """
+        output_message = f"No brevity terms found with `{search_term}`."
+        service = self.bot.async_brevity_term_service
+        suggestions = await service.suggest_brevity_terms(search_term)
+
+        if suggestions:
+            output_message += " Did you mean " + ", ".join(
+                f"`{suggestion}`" for suggestion in suggestions
+            )
+            output_message += "?"
 
         return output_message
 
-    @tasks.loop(minutes=1)
-    async def brevity_term_digest(self):
-        """Sends a brevity term at the specified time."""
-        task_config = self.bot.config["tasks"]["brevity_term_digest"]
-        time_zone = ZoneInfo(task_config["timezone"])
-        time_now = datetime.datetime.now(time_zone).strftime("%H:%M")
+    async def _send_brevity_term_digest(
+        self, channel: TextChannel, output_message: str
+    ) -> bool:
+        """Send the digest to a single channel.
 
-        if not time_now == task_config["time"]:
-            return
+        Args:
+            channel: The channel to send the digest to.
+            output_message: The formatted brevity term.
+
+        Returns:
+            A bool which indicates whether the digest has been sent.
 
-        if not task_config["enabled"]:
+        """
+        async with self._digest_send_semaphore:
+            try:
+                with self._send_duration.time("digest"):
+                    await channel.send(output_message)
+            except discord.HTTPException as e:
+                self.logger.error(
+                    "'Brevity Term Digest' failed for %d: %s", channel.id, e
+                )
+                return False
+
+        return True
+
+    async def brevity_term_digest(self, channel_ids: tuple[int, ...]) -> None:
+        """Sends a brevity term, called by the scheduler at the set time.
+
+        One brevity term is picked and sent to all channels concurrently,
+        limited by the maximum number of concurrent sends. The outcome for
+        every channel is counted in digest_stats.
+
+        Args:
+            channel_ids: IDs of the channels to send the digest to.
+
+        """
+        if not self.bot.config.tasks.brevity_term_digest.enabled:
             self.logger.info("'Brevity Term Digest' task is disabled.")
             return
 
         self.logger.info("Executing 'Brevity Term Digest' task...")
+        self._digest_fires.inc()
 
-        channel_id = task_config["channel_id"]
-        channel = self.bot.get_channel(channel_id)
-
-        if channel is None:
-            self.logger.critical("'Brevity Term Digest' channel not found.")
-            return
-        elif not isinstance(channel, TextChannel):
-            self.logger.critical(
-                "'Brevity Term Digest' channel is not a text channel."
+        resolved_channels = await asyncio.gather(
+            *(
+                self.bot.resolve_channel(channel_id)
+                for channel_id in channel_ids
             )
+        )
+        channels: list[TextChannel] = []
+
+        for channel_id, channel in zip(channel_ids, resolved_channels):
+            if channel is None:
+                self.logger.critical(
+                    "'Brevity Term Digest' channel %d not found.", channel_id
+                )
+                self.digest_stats[channel_id].failed += 1
+                self._digest_deliveries.inc("failed")
+            elif not isinstance(channel, TextChannel):
+                self.logger.critical(
+                    "'Brevity Term Digest' channel %d is not a text channel.",
+                    channel_id,
+                )
+                self.digest_stats[channel_id].failed += 1
+                self._digest_deliveries.inc("failed")
+            else:
+                channels.append(channel)
+
+        if not channels:
+            self._digest_misses.inc("no_channel")
             return
 
-        response = self.bot.brevity_term_service.get_brevity_term_for_digest()
+        service = self.bot.async_brevity_term_service
+
+        try:
+            response = await service.get_brevity_term_for_digest()
+        except LookupError as e:
+            self.logger.critical("'Brevity Term Digest' failed: %s", e)
+            self._digest_misses.inc("no_brevity_term")
+            return
 
         output_message = BrevityTermCog.format_brevity_term(response)
 
-        await channel.send(output_message)
+        results = await asyncio.gather(
+            *(
+                self._send_brevity_term_digest(channel, output_message)
+                for channel in channels
+            )
+        )
+
+        for channel, sent in zip(channels, results):
+            if sent:
+                self.digest_stats[channel.id].sent += 1
+                self._digest_deliveries.inc("sent")
+            else:
+                self.digest_stats[channel.id].failed += 1
+                self._digest_deliveries.inc("failed")
+
+        if not any(results):
+            self._digest_misses.inc("send_failed")
 
     @staticmethod
     def format_brevity_term(brevity_term: BrevityTerm) -> str:
@@ -123,9 +414,242 @@ class BrevityTermCog(commands.Cog):
             The formatted brevity term with MARKDOWN syntax as a string.
 
         """
-        output_message = f"### Brevity Term: `{brevity_term.term}`"
+        return brevity_term.markdown
+
+    @staticmethod
+    def fit_search_results(
+        results: list[SearchResult], render: str
+    ) -> list[SearchResult]:
+        """Get the leading search results which fit into a single message.
 
-        for description in brevity_term.description.split("&"):
-            output_message += f"\n> {description.strip()}"
+        Args:
+            results: The search results of a page.
+            render: The render target of the message.
 
-        return output_message
+        Returns:
+            The leading search results within the length limit of discord,
+            but at least the first search result.
+
+        """
+        max_length = (
+            MAX_EMBEDS_LENGTH if render == RENDER_EMBED else MAX_MESSAGE_LENGTH
+        )
+        length = 0
+
+        for count, result in enumerate(results):
+            brevity_term = result.brevity_term
+            length += (
+                len(BrevityTermCog.format_brevity_term_embed(brevity_term))
+                if render == RENDER_EMBED
+                else len(brevity_term.markdown) + 1
+            )
+
+            if length > max_length:
+                return results[: max(count, 1)]
+
+        return results
+
+    @staticmethod
+    def format_brevity_term_embed(brevity_term: BrevityTerm) -> discord.Embed:
+        """Format the brevity term as a discord embed.
+
+        Args:
+            brevity_term: A brevity term as a BrevityTerm object.
+
+        Returns:
+            The embed with the term as title and every meaning of the
+            description on its own line, both within the length limits of
+            discord.
+
+        """
+        return discord.Embed(
+            title=truncate(
+                f"Brevity Term: {brevity_term.term}", MAX_EMBED_TITLE_LENGTH
+            ),
+            description=truncate(
+                "\n".join(brevity_term.descriptions),
+                MAX_EMBED_DESCRIPTION_LENGTH,
+            ),
+        )
+
+
+class BrevityTermPaginator(discord.ui.View):
+    """Page through the brevity terms found by a search with buttons.
+
+    Every page is seeked from the cursor of the previous page. The cursors
+    of the visited pages are kept, so going back seeks from the stored
+    cursor instead of searching from the first page again.
+    """
+
+    def __init__(
+        self,
+        cog: BrevityTermCog,
+        author_id: int,
+        search_term: str,
+        render: str,
+        timeout: float = PAGINATOR_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the paginator.
+
+        Args:
+            cog: The cog which searches the pages.
+            author_id: ID of the user who may turn the pages.
+            search_term: The term to search for.
+            render: The render target of the pages.
+            timeout: Seconds without interaction until the buttons are
+                removed.
+
+        """
+        super().__init__(timeout=timeout)
+
+        self.cog = cog
+        self.AUTHOR_ID = author_id
+        self.SEARCH_TERM = search_term
+        self.RENDER = render
+        self.message: discord.Message | None = None
+        # The cursor every visited page has been seeked from.
+        self._page_cursors: list[SearchCursor | None] = [None]
+        self._next_cursor: SearchCursor | None = None
+
+    @property
+    def has_pages(self) -> bool:
+        """Whether there is more than one page to turn."""
+        return len(self._page_cursors) > 1 or self._next_cursor is not None
+
+    def render(
+        self, page: SearchPage
+    ) -> tuple[str | None, list[discord.Embed]]:
+        """Render a page and update the buttons.
+
+        Args:
+            page: The page to render.
+
+        Returns:
+            A tuple with the content and the embeds of the message.
+
+        """
+        results = BrevityTermCog.fit_search_results(page.results, self.RENDER)
+        self._next_cursor = (
+            results[-1].cursor
+            if results and (page.has_more or len(results) < len(page.results))
+            else None
+        )
+        self.previous_page.disabled = len(self._page_cursors) == 1
+        self.next_page.disabled = self._next_cursor is None
+
+        if not results:
+            return "No more brevity terms found.", []
+        elif self.RENDER == RENDER_EMBED:
+            return None, [
+                BrevityTermCog.format_brevity_term_embed(result.brevity_term)
+                for result in results
+            ]
+
+        return truncate(
+            "".join(f"{result.brevity_term.markdown}\n" for result in results),
+            MAX_MESSAGE_LENGTH,
+        ), []
+
+    async def _show_page(
+        self, interaction: discord.Interaction, cursor: SearchCursor | None
+    ) -> None:
+        """Search a page and show it in the message of the paginator.
+
+        Args:
+            interaction: The interaction of the pressed button.
+            cursor: The cursor to seek the page from.
+
+        """
+        page = await self.cog._get_search_page(self.SEARCH_TERM, cursor)
+        content, embeds = self.render(page)
+
+        await interaction.response.edit_message(
+            content=content, embeds=embeds, view=self
+        )
+
+    async def interaction_check(
+        self, interaction: discord.Interaction
+    ) -> bool:
+        """Check whether the user of an interaction may turn the pages.
+
+        Args:
+            interaction: The interaction of the pressed button.
+
+        Returns:
+            A bool which indicates whether the user is the author.
+
+        """
+        if interaction.user.id == self.AUTHOR_ID:
+            return True
+
+        await interaction.response.send_message(
+            "Only the author of the search can turn its pages.",
+            ephemeral=True,
+        )
+
+        return False
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ) -> None:
+        """Show the previous page.
+
+        Args:
+            interaction: The interaction of the pressed button.
+            button: The pressed button.
+
+        """
+        self._page_cursors.pop()
+        await self._show_page(interaction, self._page_cursors[-1])
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
+    async def next_page(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ) -> None:
+        """Show the next page.
+
+        Args:
+            interaction: The interaction of the pressed button.
+            button: The pressed button.
+
+        """
+        self._page_cursors.append(self._next_cursor)
+        await self._show_page(interaction, self._next_cursor)
+
+    async def on_timeout(self) -> None:
+        """Remove the buttons once the paginator timed out."""
+        if self.message is None:
+            return
+
+        try:
+            await self.message.edit(view=None)
+        except discord.HTTPException as e:
+            self.cog.logger.warning("Could not remove the page buttons: %s", e)
+
+
+def truncate(text: str, max_length: int) -> str:
+    """Shorten a text to a maximum length.
+
+    Args:
+        text: The text to shorten.
+        max_length: The maximum length of the text.
+
+    Returns:
+        The text, which ends with an ellipsis if it has been shortened.
+
+    """
+    if len(text) <= max_length:
+        return text
+
+    return text[: max_length - 1] + "…"
+
+
+async def setup(discord_bot: DiscordBot) -> None:
+    """Add the cog to the bot when the extension is loaded.
+
+    Args:
+        discord_bot: The discord bot which loads the extension.
+
+    """
+    await discord_bot.add_cog(BrevityTermCog(discord_bot))
@@ -30,7 +30,7 @@ class ConfigCog(commands.Cog):
             action: The desired action to take.
 
         """
-        if not self.bot.config["commands"]["config"]:
+        if not self.bot.config.commands.config:
             await ctx.send("The `config` commands have been disabled.")
             return
         elif not self._is_admin(ctx):
@@ -40,13 +40,13 @@ class ConfigCog(commands.Cog):
             )
             return
 
-        self.logger.info(f"Execute 'config' command with '{action}' action.")
+        self.logger.info("Execute 'config' command with '%s' action.", action)
 
         match action:
             case "update":
                 await ctx.send(self._config_update())
             case "show":
-                await ctx.send(json.dumps(self.bot.config, indent=4))
+                await ctx.send(json.dumps(self.bot.config.raw, indent=4))
             case _:
                 await ctx.send("Invalid `config` command.")
 
@@ -80,12 +80,14 @@ class ConfigCog(commands.Cog):
             A bool which indicates whether the author is an admin.
 
         """
-        admins: list[int] = []
+        return ctx.author.id in self.bot.config.admin_ids
 
-        for admin in self.bot.config["admins"]:
-            admins.append(admin["id"])
 
-        if ctx.author.id in admins:
-            return True
-        else:
-            return False
+async def setup(discord_bot: DiscordBot) -> None:
+    """Add the cog to the bot when the extension is loaded.
+
+    Args:
+        discord_bot: The discord bot which loads the extension.
+
+    """
+    await discord_bot.add_cog(ConfigCog(discord_bot))
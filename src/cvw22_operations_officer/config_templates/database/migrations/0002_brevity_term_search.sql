@@ -0,0 +1,67 @@
+-- Copyright 2026 Niklas Glienke
+
+-- Terms are looked up case-insensitively, so only the oldest of any
+-- duplicates stays before the unique index is created. The others are moved
+-- into their own table, so they can be reviewed and imported again.
+CREATE TABLE IF NOT EXISTS brevity_term_duplicate (
+    brevity_term_id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL,
+    description TEXT NOT NULL,
+    kept_brevity_term_id INTEGER NOT NULL
+);
+
+INSERT INTO brevity_term_duplicate (
+    brevity_term_id, term, description, kept_brevity_term_id
+)
+SELECT brevity_term.brevity_term_id, brevity_term.term,
+    brevity_term.description, kept.brevity_term_id
+FROM brevity_term
+JOIN (
+    SELECT MIN(brevity_term_id) AS brevity_term_id, term
+    FROM brevity_term
+    GROUP BY term COLLATE NOCASE
+) AS kept
+    ON kept.term = brevity_term.term COLLATE NOCASE
+WHERE brevity_term.brevity_term_id <> kept.brevity_term_id;
+
+DELETE FROM brevity_term
+WHERE brevity_term_id IN (SELECT brevity_term_id FROM brevity_term_duplicate);
+
+DROP INDEX IF EXISTS brevity_term_term_idx;
+
+CREATE UNIQUE INDEX IF NOT EXISTS brevity_term_term_unique_idx
+ON brevity_term (term COLLATE NOCASE);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS brevity_term_fts USING fts5 (
+    term,
+    description,
+    content = 'brevity_term',
+    content_rowid = 'brevity_term_id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS brevity_term_fts_insert
+AFTER INSERT ON brevity_term
+BEGIN
+    INSERT INTO brevity_term_fts (rowid, term, description)
+    VALUES (new.brevity_term_id, new.term, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS brevity_term_fts_delete
+AFTER DELETE ON brevity_term
+BEGIN
+    INSERT INTO brevity_term_fts (brevity_term_fts, rowid, term, description)
+    VALUES ('delete', old.brevity_term_id, old.term, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS brevity_term_fts_update
+AFTER UPDATE OF term, description ON brevity_term
+BEGIN
+    INSERT INTO brevity_term_fts (brevity_term_fts, rowid, term, description)
+    VALUES ('delete', old.brevity_term_id, old.term, old.description);
+    INSERT INTO brevity_term_fts (rowid, term, description)
+    VALUES (new.brevity_term_id, new.term, new.description);
+END;
+
+-- Index all brevity terms which were stored before the triggers existed.
+INSERT INTO brevity_term_fts (brevity_term_fts) VALUES ('rebuild');
@@ -0,0 +1,17 @@
+-- Copyright 2026 Niklas Glienke
+
+CREATE TABLE IF NOT EXISTS digest_state (
+    digest_state_id INTEGER PRIMARY KEY CHECK (digest_state_id = 1),
+    epoch INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO digest_state (digest_state_id, epoch) VALUES (1, 0);
+
+CREATE TABLE IF NOT EXISTS digest_queue (
+    position INTEGER PRIMARY KEY,
+    brevity_term_id INTEGER NOT NULL
+        REFERENCES brevity_term (brevity_term_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS digest_queue_brevity_term_id_idx
+ON digest_queue (brevity_term_id);
@@ -0,0 +1,38 @@
+-- Copyright 2026 Niklas Glienke
+
+-- Every change of the brevity terms increments the version, so bot processes
+-- which share the database notice the changes of each other.
+CREATE TABLE IF NOT EXISTS brevity_term_version (
+    brevity_term_version_id INTEGER PRIMARY KEY
+        CHECK (brevity_term_version_id = 1),
+    version INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO brevity_term_version (brevity_term_version_id, version)
+VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS brevity_term_version_insert
+AFTER INSERT ON brevity_term
+BEGIN
+    UPDATE brevity_term_version SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS brevity_term_version_delete
+AFTER DELETE ON brevity_term
+BEGIN
+    UPDATE brevity_term_version SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS brevity_term_version_update
+AFTER UPDATE OF term, description ON brevity_term
+BEGIN
+    UPDATE brevity_term_version SET version = version + 1;
+END;
+
+-- A scheduled job is claimed by inserting its due time, so it only runs in
+-- one of the bot processes which share the database.
+CREATE TABLE IF NOT EXISTS job_run (
+    name TEXT NOT NULL,
+    due_at TEXT NOT NULL,
+    PRIMARY KEY (name, due_at)
+) WITHOUT ROWID;
@@ -1,11 +1,215 @@
 # Copyright 2026 Niklas Glienke
 
-from dataclasses import dataclass
+import sys
+import threading
+import weakref
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class BrevityTerm:
-    """Represent a brevity term."""
+    """Represent a brevity term.
+
+    Brevity terms are immutable and slotted, so they carry no per-instance
+    dict. The description may contain several meanings separated by "&".
+    They are split and rendered once per brevity term on first use, so
+    brevity terms which are kept in memory are never parsed again.
+    """
 
     term: str
     description: str
+    _descriptions: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _markdown: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def descriptions(self) -> tuple[str, ...]:
+        """The single meanings of the description."""
+        if self._descriptions is None:
+            object.__setattr__(
+                self,
+                "_descriptions",
+                tuple(
+                    description.strip()
+                    for description in self.description.split("&")
+                ),
+            )
+
+        return self._descriptions  # type: ignore[return-value]
+
+    @property
+    def markdown(self) -> str:
+        """The brevity term rendered with MARKDOWN syntax for discord."""
+        if self._markdown is None:
+            object.__setattr__(
+                self,
+                "_markdown",
+                "\n".join(
+                    (
+                        f"### Brevity Term: `{self.term}`",
+                        *(
+                            f"> {description}"
+                            for description in self.descriptions
+                        ),
+                    )
+                ),
+            )
+
+        return self._markdown  # type: ignore[return-value]
+
+
+class BrevityTermRegistry:
+    """Share one instance per stored brevity term.
+
+    The registry maps the ID of a brevity term to its instance, as long as
+    the instance is referenced anywhere else, e.g. by the in-memory index or
+    a cached search. Every query which finds the brevity term again gets the
+    same instance, including its rendered markdown, instead of a new one.
+    Terms are interned, so equal terms share one string.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._brevity_terms: weakref.WeakValueDictionary[int, BrevityTerm] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of registered brevity terms.
+
+        Returns:
+            The number of brevity terms which are still referenced.
+
+        """
+        return len(self._brevity_terms)
+
+    def get(
+        self, brevity_term_id: int, term: str, description: str
+    ) -> BrevityTerm:
+        """Get the shared instance of a stored brevity term.
+
+        If the term or description changed since the instance has been
+        registered, it is replaced by a new instance.
+
+        Args:
+            brevity_term_id: ID of the brevity term in the database.
+            term: The term of the brevity term.
+            description: The description of the brevity term.
+
+        Returns:
+            The shared brevity term.
+
+        """
+        with self._lock:
+            brevity_term = self._brevity_terms.get(brevity_term_id)
+
+            if (
+                brevity_term is None
+                or brevity_term.term != term
+                or brevity_term.description != description
+            ):
+                brevity_term = BrevityTerm(sys.intern(term), description)
+                self._brevity_terms[brevity_term_id] = brevity_term
+
+            return brevity_term
+
+
+class BrevityTermColumns(Sequence[BrevityTerm]):
+    """Store many brevity terms column by column.
+
+    The IDs are kept in a packed array and the terms and descriptions in one
+    list each. An instance is only created when a brevity term is accessed
+    for the first time, shared through the registry and kept from then on,
+    so brevity terms which are never found do not cost an object and found
+    ones are never allocated or rendered again.
+    """
+
+    def __init__(self, registry: BrevityTermRegistry | None = None) -> None:
+        """Initialize empty columns.
+
+        Args:
+            registry: The registry which shares the accessed brevity terms.
+
+        """
+        self.registry = (
+            registry if registry is not None else BrevityTermRegistry()
+        )
+        self.ids = array("q")
+        self.terms: list[str] = []
+        self.descriptions: list[str] = []
+        self._brevity_terms: list[BrevityTerm | None] = []
+
+    def append(
+        self, brevity_term_id: int, term: str, description: str
+    ) -> None:
+        """Append a stored brevity term.
+
+        Args:
+            brevity_term_id: ID of the brevity term in the database.
+            term: The term of the brevity term.
+            description: The description of the brevity term.
+
+        """
+        self.ids.append(brevity_term_id)
+        self.terms.append(sys.intern(term))
+        self.descriptions.append(description)
+        self._brevity_terms.append(None)
+
+    def __len__(self) -> int:
+        """Get the number of stored brevity terms.
+
+        Returns:
+            The number of stored brevity terms.
+
+        """
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, position: int) -> BrevityTerm: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[BrevityTerm]: ...
+
+    def __getitem__(
+        self, position: int | slice
+    ) -> BrevityTerm | list[BrevityTerm]:
+        """Get the brevity terms at a position or slice.
+
+        Args:
+            position: The position or slice of the brevity terms.
+
+        Returns:
+            The shared brevity term or a list of the shared brevity terms.
+
+        """
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self.ids)))]
+
+        brevity_term = self._brevity_terms[position]
+
+        if brevity_term is None:
+            brevity_term = self.registry.get(
+                self.ids[position],
+                self.terms[position],
+                self.descriptions[position],
+            )
+            self._brevity_terms[position] = brevity_term
+
+        return brevity_term
+
+    def __iter__(self) -> Iterator[BrevityTerm]:
+        """Iterate over all stored brevity terms.
+
+        Yields:
+            Each shared brevity term.
+
+        """
+        for position in range(len(self.ids)):
+            yield self[position]
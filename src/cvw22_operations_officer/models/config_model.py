@@ -0,0 +1,491 @@
+# Copyright 2026 Niklas Glienke
+
+import datetime
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_CONFIG_WATCHER_INTERVAL_SECONDS = 5.0
+RENDER_MARKDOWN = "markdown"
+RENDER_EMBED = "embed"
+RENDER_TARGETS = (RENDER_MARKDOWN, RENDER_EMBED)
+
+logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+
+def _get(
+    data: dict, key: str, expected_type: type | tuple[type, ...], path: str
+) -> Any:
+    """Get a required value of a config section and check its type.
+
+    Args:
+        data: The config section.
+        key: The key of the value.
+        expected_type: The type or types the value must have.
+        path: The dotted path of the config section for error messages.
+
+    Returns:
+        The value of the key.
+
+    Raises:
+        ValueError: If the key is missing or the value has a wrong type.
+
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"'{path}' must be a mapping.")
+    elif key not in data:
+        raise ValueError(f"'{path}.{key}' is missing.")
+
+    value = data[key]
+    expected_types = (
+        expected_type if isinstance(expected_type, tuple) else (expected_type,)
+    )
+
+    # bool is a subclass of int, but a flag is never a valid ID or number.
+    if not isinstance(value, expected_types) or (
+        isinstance(value, bool) and bool not in expected_types
+    ):
+        raise ValueError(f"'{path}.{key}' has an invalid value: {value!r}.")
+
+    return value
+
+
+def _get_id(data: dict, key: str, path: str) -> int:
+    """Get a required discord ID of a config section.
+
+    Besides numbers, strings of digits are accepted as well. YAML reads an
+    unquoted ID with a leading zero as a string, like the IDs of the config
+    template of earlier versions.
+
+    Args:
+        data: The config section.
+        key: The key of the ID.
+        path: The dotted path of the config section for error messages.
+
+    Returns:
+        The ID.
+
+    Raises:
+        ValueError: If the key is missing or the value is not an ID.
+
+    """
+    value = _get(data, key, (int, str), path)
+
+    if isinstance(value, str):
+        if not value.isascii() or not value.isdigit():
+            raise ValueError(
+                f"'{path}.{key}' must be a discord ID made of digits, e.g. "
+                f"123456789012345678, but is {value!r}."
+            )
+
+        value = int(value)
+
+    return value
+
+
+def _parse_time(value: str, path: str) -> datetime.time:
+    """Parse a local time of day in the "HH:MM" format.
+
+    Args:
+        value: The time to parse.
+        path: The dotted path of the value for error messages.
+
+    Returns:
+        The parsed time.
+
+    Raises:
+        ValueError: If the time is invalid.
+
+    """
+    try:
+        return datetime.time.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"'{path}' has an invalid time: {value!r}.") from None
+
+
+def _parse_timezone(value: str, path: str) -> ZoneInfo:
+    """Parse an IANA timezone.
+
+    Args:
+        value: The name of the timezone.
+        path: The dotted path of the value for error messages.
+
+    Returns:
+        The timezone.
+
+    Raises:
+        ValueError: If the timezone is unknown.
+
+    """
+    try:
+        return ZoneInfo(value)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(
+            f"'{path}' has an unknown timezone: {value!r}."
+        ) from None
+
+
+@dataclass(frozen=True, slots=True)
+class CommandsConfig:
+    """Represent which commands are enabled and how they reply."""
+
+    config: bool
+    brevity_term: bool
+    brevity_term_render: str = RENDER_MARKDOWN
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str = "commands") -> "CommandsConfig":
+        """Validate and convert the commands section of the config.
+
+        The config command is enabled if it is not configured. The key
+        "admin" of earlier versions is still read in place of "config", but
+        logs a deprecation warning.
+
+        Args:
+            data: The commands section.
+            path: The dotted path of the section for error messages.
+
+        Returns:
+            The validated commands config.
+
+        Raises:
+            ValueError: If the render target is unknown.
+
+        """
+        if "config" in data:
+            config = _get(data, "config", bool, path)
+        elif "admin" in data:
+            logger.warning(
+                "'%s.admin' is deprecated, rename it to '%s.config'.",
+                path,
+                path,
+            )
+            config = _get(data, "admin", bool, path)
+        else:
+            config = True
+
+        brevity_term = _get(data, "brevity_term", bool, path)
+        brevity_term_render = (
+            _get(data, "brevity_term_render", str, path)
+            if "brevity_term_render" in data
+            else RENDER_MARKDOWN
+        )
+
+        if brevity_term_render not in RENDER_TARGETS:
+            raise ValueError(
+                f"'{path}.brevity_term_render' must be one of "
+                f"{', '.join(RENDER_TARGETS)}."
+            )
+
+        return cls(config, brevity_term, brevity_term_render)
+
+
+@dataclass(frozen=True, slots=True)
+class DigestSchedule:
+    """Represent the channels which are due at the same local time."""
+
+    at: datetime.time
+    timezone: ZoneInfo
+    channel_ids: tuple[int, ...]
+
+    @property
+    def name(self) -> str:
+        """The unique name of the schedule."""
+        return f"{self.at.isoformat('minutes')}@{self.timezone.key}"
+
+
+@dataclass(frozen=True, slots=True)
+class BrevityTermDigestConfig:
+    """Represent the 'Brevity Term Digest' task.
+
+    The targets are grouped by their local time and timezone when the config
+    is loaded, so scheduling does not need to parse anything.
+    """
+
+    enabled: bool
+    schedules: tuple[DigestSchedule, ...]
+
+    @classmethod
+    def from_dict(
+        cls, data: dict, path: str = "tasks.brevity_term_digest"
+    ) -> "BrevityTermDigestConfig":
+        """Validate and convert the 'Brevity Term Digest' task config.
+
+        Every entry of the optional "targets" list has its own channel and
+        can override the time and timezone of the task. Without "targets",
+        the channel of the task itself is the only target. A time is either a
+        single "HH:MM" time or a list of times.
+
+        Args:
+            data: The section of the task.
+            path: The dotted path of the section for error messages.
+
+        Returns:
+            The validated task config.
+
+        Raises:
+            ValueError: If the targets or times are not lists.
+
+        """
+        enabled = _get(data, "enabled", bool, path)
+        targets = data.get("targets") or [
+            {"channel_id": _get_id(data, "channel_id", path)}
+        ]
+
+        if not isinstance(targets, list):
+            raise ValueError(f"'{path}.targets' must be a list.")
+
+        grouped_targets: dict[tuple[datetime.time, str], list[int]] = {}
+        timezones: dict[str, ZoneInfo] = {}
+
+        for index, target in enumerate(targets):
+            target_path = f"{path}.targets[{index}]"
+            channel_id = _get_id(target, "channel_id", target_path)
+            times = (
+                _get(target, "time", (str, list), target_path)
+                if "time" in target
+                else _get(data, "time", (str, list), path)
+            )
+            time_zone = (
+                _get(target, "timezone", str, target_path)
+                if "timezone" in target
+                else _get(data, "timezone", str, path)
+            )
+
+            if time_zone not in timezones:
+                timezones[time_zone] = _parse_timezone(
+                    time_zone, f"{target_path}.timezone"
+                )
+
+            for time in [times] if isinstance(times, str) else times:
+                if not isinstance(time, str):
+                    raise ValueError(
+                        f"'{target_path}.time' has an invalid value: {time!r}."
+                    )
+
+                at = _parse_time(time, f"{target_path}.time")
+                grouped_targets.setdefault((at, time_zone), []).append(
+                    channel_id
+                )
+
+        return cls(
+            enabled,
+            tuple(
+                DigestSchedule(at, timezones[time_zone], tuple(channel_ids))
+                for (at, time_zone), channel_ids in grouped_targets.items()
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigWatcherConfig:
+    """Represent the watcher which reloads the config file on changes."""
+
+    enabled: bool = False
+    interval_seconds: float = DEFAULT_CONFIG_WATCHER_INTERVAL_SECONDS
+
+    @classmethod
+    def from_dict(
+        cls, data: dict, path: str = "tasks.config_watcher"
+    ) -> "ConfigWatcherConfig":
+        """Validate and convert the config watcher task config.
+
+        Args:
+            data: The section of the task.
+            path: The dotted path of the section for error messages.
+
+        Returns:
+            The validated task config.
+
+        Raises:
+            ValueError: If the interval is not positive.
+
+        """
+        enabled = _get(data, "enabled", bool, path)
+        interval_seconds = float(
+            _get(data, "interval_seconds", (int, float), path)
+            if "interval_seconds" in data
+            else DEFAULT_CONFIG_WATCHER_INTERVAL_SECONDS
+        )
+
+        if interval_seconds <= 0:
+            raise ValueError(f"'{path}.interval_seconds' must be positive.")
+
+        return cls(enabled, interval_seconds)
+
+
+@dataclass(frozen=True, slots=True)
+class TasksConfig:
+    """Represent the background tasks."""
+
+    brevity_term_digest: BrevityTermDigestConfig
+    config_watcher: ConfigWatcherConfig = ConfigWatcherConfig()
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str = "tasks") -> "TasksConfig":
+        """Validate and convert the tasks section of the config.
+
+        Args:
+            data: The tasks section.
+            path: The dotted path of the section for error messages.
+
+        Returns:
+            The validated tasks config.
+
+        """
+        return cls(
+            BrevityTermDigestConfig.from_dict(
+                _get(data, "brevity_term_digest", dict, path),
+                f"{path}.brevity_term_digest",
+            ),
+            ConfigWatcherConfig.from_dict(
+                _get(data, "config_watcher", dict, path),
+                f"{path}.config_watcher",
+            )
+            if "config_watcher" in data
+            else ConfigWatcherConfig(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitConfig:
+    """Represent the number of commands allowed within a period."""
+
+    rate: int
+    per_seconds: float
+
+    @classmethod
+    def from_dict(cls, data: dict, path: str) -> "RateLimitConfig":
+        """Validate and convert a rate limit.
+
+        Args:
+            data: The section of the rate limit.
+            path: The dotted path of the section for error messages.
+
+        Returns:
+            The validated rate limit.
+
+        Raises:
+            ValueError: If the rate or the period is not positive.
+
+        """
+        rate = _get(data, "rate", int, path)
+        per_seconds = float(_get(data, "per_seconds", (int, float), path))
+
+        if rate < 1:
+            raise ValueError(f"'{path}.rate' must be positive.")
+        elif per_seconds <= 0:
+            raise ValueError(f"'{path}.per_seconds' must be positive.")
+
+        return cls(rate, per_seconds)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitsConfig:
+    """Represent the command rate limits of every scope.
+
+    A scope without a rate limit is not limited.
+    """
+
+    user: RateLimitConfig | None = None
+    channel: RateLimitConfig | None = None
+    guild: RateLimitConfig | None = None
+
+    @classmethod
+    def from_dict(
+        cls, data: dict, path: str = "rate_limits"
+    ) -> "RateLimitsConfig":
+        """Validate and convert the rate limits section of the config.
+
+        Args:
+            data: The rate limits section.
+            path: The dotted path of the section for error messages.
+
+        Returns:
+            The validated rate limits.
+
+        Raises:
+            ValueError: If the section contains an unknown scope.
+
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"'{path}' must be a mapping.")
+
+        scopes = ("user", "channel", "guild")
+
+        for scope in data:
+            if scope not in scopes:
+                raise ValueError(
+                    f"'{path}.{scope}' is not one of {', '.join(scopes)}."
+                )
+
+        return cls(
+            *(
+                RateLimitConfig.from_dict(data[scope], f"{path}.{scope}")
+                if data.get(scope) is not None
+                else None
+                for scope in scopes
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AdminConfig:
+    """Represent an admin of the bot."""
+
+    name: str
+    id: int
+
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Represent the validated config of the bot.
+
+    The config is immutable, so a reload replaces the whole object at once
+    and every reader sees either the old or the new config.
+    """
+
+    commands: CommandsConfig
+    tasks: TasksConfig
+    rate_limits: RateLimitsConfig
+    admins: tuple[AdminConfig, ...]
+    admin_ids: frozenset[int]
+    raw: dict = field(compare=False, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "BotConfig":
+        """Validate and convert the parsed config.yaml.
+
+        Args:
+            data: The parsed content of the config.yaml.
+
+        Returns:
+            The validated config.
+
+        Raises:
+            ValueError: If the config is invalid.
+
+        """
+        if not isinstance(data, dict):
+            raise ValueError("The config must be a mapping.")
+
+        admins_data = _get(data, "admins", list, "config")
+        admins = tuple(
+            AdminConfig(
+                _get(admin, "name", str, f"admins[{index}]"),
+                _get_id(admin, "id", f"admins[{index}]"),
+            )
+            for index, admin in enumerate(admins_data)
+        )
+
+        return cls(
+            CommandsConfig.from_dict(_get(data, "commands", dict, "config")),
+            TasksConfig.from_dict(_get(data, "tasks", dict, "config")),
+            RateLimitsConfig.from_dict(data["rate_limits"])
+            if data.get("rate_limits") is not None
+            else RateLimitsConfig(),
+            admins,
+            frozenset(admin.id for admin in admins),
+            data,
+        )
@@ -0,0 +1,177 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.services.brevity_term_index import SearchCursor
+from cvw22_operations_officer.services.brevity_term_service import (
+    BrevityTermService,
+    SearchPage,
+)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class AsyncBrevityTermService:
+    """Provide non-blocking access to the stored brevity terms.
+
+    Every call is delegated to the synchronous BrevityTermService on a
+    bounded thread pool, so a slow query or a disk stall never blocks the
+    event loop of the discord bot.
+    """
+
+    def __init__(
+        self,
+        brevity_term_service: BrevityTermService,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize the thread pool.
+
+        The duration of every call is recorded in the metrics of the
+        synchronous service.
+
+        Args:
+            brevity_term_service: The synchronous service to delegate to.
+            max_workers: Maximum number of concurrent database calls.
+
+        """
+        self.brevity_term_service = brevity_term_service
+        self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+        metrics = brevity_term_service.metrics
+        self._call_duration = metrics.histogram(
+            "brevity_term_service_call_duration_seconds",
+            "Duration of a brevity term service call on the thread pool.",
+            ("method",),
+        )
+        self._wait_duration = metrics.histogram(
+            "brevity_term_service_wait_duration_seconds",
+            "Duration a brevity term service call waited for a thread.",
+            ("method",),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="brevity_term_service",
+        )
+
+    async def _run(self, method: str, *args: Any) -> Any:
+        """Run a method of the synchronous service on the thread pool.
+
+        Args:
+            method: The name of the method to run.
+            *args: Any arguments for the method.
+
+        Returns:
+            The return value of the method.
+
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self._timed_call, time.perf_counter(), method, *args
+            ),
+        )
+
+    def _timed_call(self, submitted_at: float, method: str, *args: Any) -> Any:
+        """Call a method of the synchronous service and record its durations.
+
+        Args:
+            submitted_at: The performance counter when the call was submitted.
+            method: The name of the method to call.
+            *args: Any arguments for the method.
+
+        Returns:
+            The return value of the method.
+
+        """
+        self._wait_duration.observe(time.perf_counter() - submitted_at, method)
+
+        with self._call_duration.time(method):
+            return getattr(self.brevity_term_service, method)(*args)
+
+    async def get_brevity_terms_by_term(
+        self, term: str, limit: int = 5
+    ) -> list[BrevityTerm]:
+        """Get all matching brevity terms from the given term.
+
+        Args:
+            term: The term to search for.
+            limit: The limit of returned brevity terms.
+
+        Returns:
+            A list of matching brevity terms as BrevityTerm objects.
+
+        """
+        return await self._run("get_brevity_terms_by_term", term, limit)
+
+    async def search_brevity_terms(
+        self, term: str, limit: int = 5, cursor: SearchCursor | None = None
+    ) -> SearchPage:
+        """Get a page of the matching brevity terms from the given term.
+
+        Args:
+            term: The term to search for.
+            limit: The maximum number of brevity terms on the page.
+            cursor: The next_cursor of the previous page, or None for the
+                first page.
+
+        Returns:
+            The page of the matching brevity terms.
+
+        """
+        return await self._run("search_brevity_terms", term, limit, cursor)
+
+    async def suggest_brevity_terms(
+        self, term: str, limit: int = 3
+    ) -> list[str]:
+        """Get similar brevity terms for a possibly misspelled search term.
+
+        Args:
+            term: The possibly misspelled term.
+            limit: The limit of returned suggestions.
+
+        Returns:
+            A list of suggested terms.
+
+        """
+        return await self._run("suggest_brevity_terms", term, limit)
+
+    async def load_term_index(self) -> None:
+        """Build the in-memory index from all stored brevity terms."""
+        await self._run("load_term_index")
+
+    async def reload_if_changed(self) -> bool:
+        """Catch up with changes of the brevity terms by other processes.
+
+        Returns:
+            A bool which indicates whether the brevity terms changed.
+
+        """
+        return await self._run("reload_if_changed")
+
+    async def get_brevity_term_for_digest(self) -> BrevityTerm:
+        """Get a yet unused brevity term for the digest.
+
+        Returns:
+            A unused brevity term as a BrevityTerm object for the digest.
+
+        """
+        return await self._run("get_brevity_term_for_digest")
+
+    async def close(self) -> None:
+        """Stop the thread pool.
+
+        Queued calls which have not started yet are cancelled, while the
+        running calls are waited for on a separate thread, so the event loop
+        is not blocked in the meantime.
+        """
+        self.logger.info("Shut down the brevity term service thread pool.")
+        await asyncio.to_thread(
+            self._executor.shutdown, wait=True, cancel_futures=True
+        )
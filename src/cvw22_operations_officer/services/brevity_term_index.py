@@ -0,0 +1,499 @@
+# Copyright 2026 Niklas Glienke
+
+import bisect
+import heapq
+import math
+import re
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from cvw22_operations_officer.models.brevity_term_model import (
+    BrevityTerm,
+    BrevityTermColumns,
+    BrevityTermRegistry,
+)
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+PLACEHOLDER_PATTERN = re.compile(r"\s*[\[(].*?[\])]")
+
+TERM_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+BM25_K1 = 1.2
+BM25_B = 0.75
+# The bm25 scores of the index and the database differ in their last bits,
+# so both are rounded to compare cursors of one with results of the other.
+SCORE_PRECISION = 9
+
+
+class SearchCursor(NamedTuple):
+    """Represent the rank of a brevity term within the results of a search.
+
+    The rank orders exact matches (0) before prefix matches (1) before
+    full-text matches (2), then by bm25 score and then by term.
+    """
+
+    match_rank: int
+    score: float
+    term: str
+
+
+class SearchResult(NamedTuple):
+    """Represent a found brevity term and its rank within the search."""
+
+    cursor: SearchCursor
+    brevity_term: BrevityTerm
+
+
+def levenshtein_distance(first: str, second: str) -> int:
+    """Calculate the edit distance between two strings.
+
+    Args:
+        first: The first string.
+        second: The second string.
+
+    Returns:
+        The minimum number of insertions, deletions and substitutions to turn
+        the first string into the second string.
+
+    """
+    if len(first) < len(second):
+        first, second = second, first
+
+    previous_row = list(range(len(second) + 1))
+
+    for i, first_char in enumerate(first, 1):
+        current_row = [i]
+
+        for j, second_char in enumerate(second, 1):
+            current_row.append(
+                min(
+                    previous_row[j] + 1,
+                    current_row[j - 1] + 1,
+                    previous_row[j - 1] + (first_char != second_char),
+                )
+            )
+
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+class _BKTree:
+    """Store strings in a BK-tree for bounded edit distance queries."""
+
+    def __init__(self) -> None:
+        """Initialize an empty tree."""
+        self._root: tuple[str, dict[int, tuple]] | None = None
+
+    def add(self, word: str) -> None:
+        """Add a word to the tree.
+
+        Args:
+            word: The word to add.
+
+        """
+        if self._root is None:
+            self._root = (word, {})
+            return
+
+        node_word, children = self._root
+
+        while True:
+            distance = levenshtein_distance(word, node_word)
+
+            if distance == 0:
+                return
+            elif distance not in children:
+                children[distance] = (word, {})
+                return
+
+            node_word, children = children[distance]
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """Get all words within a maximum edit distance.
+
+        Args:
+            word: The word to search for.
+            max_distance: The maximum edit distance of the found words.
+
+        Returns:
+            A list of tuples with the edit distance and the found word.
+
+        """
+        found_words: list[tuple[int, str]] = []
+        nodes = [self._root] if self._root is not None else []
+
+        while nodes:
+            node_word, children = nodes.pop()
+            distance = levenshtein_distance(word, node_word)
+
+            if distance <= max_distance:
+                found_words.append((distance, node_word))
+
+            for child_distance, child in children.items():
+                if abs(child_distance - distance) <= max_distance:
+                    nodes.append(child)
+
+        return found_words
+
+
+class BrevityTermIndex:
+    """Search the brevity terms in memory.
+
+    The index mirrors the ranking of the database search: Exact matches come
+    first, followed by prefix matches from a sorted array and then by
+    full-text matches of the term and description ranked by bm25. A BK-tree
+    provides typo-tolerant suggestions, and a sorted array of the word
+    suffixes of every term completes terms from any of their words. The
+    brevity terms themselves are stored in columns, and only the found ones
+    are shared as instances through the registry.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[tuple[int, str, str]],
+        registry: BrevityTermRegistry | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            rows: The ID, term and description of every brevity term.
+            registry: The registry which shares the found brevity terms.
+
+        """
+        self._brevity_terms = BrevityTermColumns(registry)
+        self._sort_keys: list[str] = []
+        self._postings: dict[str, dict[int, float]] = {}
+        self._row_lengths: list[int] = []
+        self._suggestion_terms: dict[str, list[str]] = {}
+        self._bk_tree = _BKTree()
+        self._word_suffixes: list[tuple[str, int]] = []
+
+        for brevity_term_id, term, description in sorted(
+            rows, key=lambda row: (row[1].casefold(), row[1])
+        ):
+            self._add(brevity_term_id, term, description)
+
+        self._vocabulary = sorted(self._postings)
+        self._word_suffixes.sort()
+        self._word_suffix_keys = [key for key, _ in self._word_suffixes]
+        self._average_row_length = (
+            sum(self._row_lengths) / len(self._row_lengths)
+            if self._row_lengths
+            else 0.0
+        )
+
+    def __len__(self) -> int:
+        """Get the number of indexed brevity terms.
+
+        Returns:
+            The number of indexed brevity terms.
+
+        """
+        return len(self._brevity_terms)
+
+    def _add(self, brevity_term_id: int, term: str, description: str) -> None:
+        """Add a brevity term to all index structures.
+
+        The brevity terms must be added in the order of their sort key.
+
+        Args:
+            brevity_term_id: ID of the brevity term in the database.
+            term: The term of the brevity term.
+            description: The description of the brevity term.
+
+        """
+        position = len(self._brevity_terms)
+        sort_key = term.casefold()
+        term_words = WORD_PATTERN.findall(sort_key)
+        description_words = WORD_PATTERN.findall(description.casefold())
+
+        self._brevity_terms.append(brevity_term_id, term, description)
+        self._sort_keys.append(sort_key)
+        self._row_lengths.append(len(term_words) + len(description_words))
+        self._word_suffixes.extend(
+            (sort_key[match.start() :], position)
+            for match in WORD_PATTERN.finditer(sort_key)
+            if match.start() > 0
+        )
+
+        for words, weight in (
+            (term_words, TERM_WEIGHT),
+            (description_words, DESCRIPTION_WEIGHT),
+        ):
+            for word in words:
+                posting = self._postings.setdefault(word, {})
+                posting[position] = posting.get(position, 0.0) + weight
+
+        suggestion_key = PLACEHOLDER_PATTERN.sub("", term)
+        suggestion_key = suggestion_key.strip().casefold()
+
+        if suggestion_key:
+            self._suggestion_terms.setdefault(suggestion_key, []).append(
+                self._brevity_terms.terms[position]
+            )
+            self._bk_tree.add(suggestion_key)
+
+    def _get_prefix_range(self, keys: list[str], prefix: str) -> range:
+        """Get the range of sorted keys which start with a prefix.
+
+        Args:
+            keys: The sorted keys.
+            prefix: The prefix of the keys.
+
+        Returns:
+            The range of positions of the matching keys.
+
+        """
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + "\U0010ffff", lo=start)
+
+        return range(start, end)
+
+    def _get_word_frequencies(
+        self, word: str, is_prefix: bool
+    ) -> dict[int, float]:
+        """Get the weighted frequencies of a word in every brevity term.
+
+        Args:
+            word: The word to look up.
+            is_prefix: Whether every word with this prefix matches as well.
+
+        Returns:
+            A dict with the position of the brevity term as key and the
+            weighted frequency as value.
+
+        """
+        if not is_prefix:
+            return self._postings.get(word, {})
+
+        frequencies: dict[int, float] = {}
+
+        for vocabulary_position in self._get_prefix_range(
+            self._vocabulary, word
+        ):
+            posting = self._postings[self._vocabulary[vocabulary_position]]
+
+            for position, frequency in posting.items():
+                frequencies[position] = frequencies.get(position, 0.0) + (
+                    frequency
+                )
+
+        return frequencies
+
+    def _search_full_text(self, term: str) -> list[tuple[float, int]]:
+        """Search the terms and descriptions for all words of a search term.
+
+        Args:
+            term: The term to search for.
+
+        Returns:
+            A list of tuples with the bm25 score and the position of every
+            matching brevity term.
+
+        """
+        words = WORD_PATTERN.findall(term.casefold())
+
+        if not words:
+            return []
+
+        word_frequencies = [
+            self._get_word_frequencies(word, i == len(words) - 1)
+            for i, word in enumerate(words)
+        ]
+        matching_positions = set(min(word_frequencies, key=len))
+
+        for frequencies in word_frequencies:
+            matching_positions.intersection_update(frequencies)
+
+        if not matching_positions:
+            return []
+
+        number_of_rows = len(self._brevity_terms)
+        average_row_length = self._average_row_length or 1.0
+        # The idf only depends on the word, so it is computed once per word
+        # instead of once per matching brevity term.
+        weighted_frequencies = [
+            (
+                frequencies,
+                max(
+                    math.log(
+                        (number_of_rows - len(frequencies) + 0.5)
+                        / (len(frequencies) + 0.5)
+                    ),
+                    1e-6,
+                ),
+            )
+            for frequencies in word_frequencies
+        ]
+        scores: list[tuple[float, int]] = []
+
+        for position in matching_positions:
+            length_ratio = self._row_lengths[position] / average_row_length
+            length_weight = BM25_K1 * (1 - BM25_B + BM25_B * length_ratio)
+            score = 0.0
+
+            for frequencies, idf in weighted_frequencies:
+                frequency = frequencies[position]
+                score -= (
+                    idf
+                    * (frequency * (BM25_K1 + 1))
+                    / (frequency + length_weight)
+                )
+
+            scores.append((round(score, SCORE_PRECISION), position))
+
+        return scores
+
+    def search(self, term: str, limit: int = 5) -> list[BrevityTerm]:
+        """Get the best matching brevity terms for a search term.
+
+        Args:
+            term: The term to search for.
+            limit: The limit of returned brevity terms.
+
+        Returns:
+            A list of the matching brevity terms in the order of their rank.
+
+        """
+        return [
+            result.brevity_term for result in self.search_ranked(term, limit)
+        ]
+
+    def search_ranked(
+        self, term: str, limit: int = 5, cursor: SearchCursor | None = None
+    ) -> list[SearchResult]:
+        """Get the matching brevity terms which rank after a cursor.
+
+        Prefix matches are sliced from the sorted array and full-text matches
+        are filtered by their rank, so a page never collects the matches of
+        the previous pages.
+
+        Args:
+            term: The term to search for.
+            limit: The limit of returned brevity terms.
+            cursor: The rank of the last brevity term of the previous page, or
+                None for the first page.
+
+        Returns:
+            A list of the matching brevity terms with their rank in the order
+            of their rank.
+
+        """
+        key = term.casefold()
+        prefix_range = self._get_prefix_range(self._sort_keys, key)
+        results: list[SearchResult] = []
+
+        if cursor is None or cursor.match_rank < 2:
+            # Exact matches sort before all other keys with the same prefix.
+            start = (
+                prefix_range.start
+                if cursor is None
+                else bisect.bisect_right(
+                    self._sort_keys,
+                    cursor.term.casefold(),
+                    prefix_range.start,
+                    prefix_range.stop,
+                )
+            )
+
+            for position in range(start, prefix_range.stop)[:limit]:
+                brevity_term = self._brevity_terms[position]
+                match_rank = 0 if self._sort_keys[position] == key else 1
+                results.append(
+                    SearchResult(
+                        SearchCursor(match_rank, 0.0, brevity_term.term),
+                        brevity_term,
+                    )
+                )
+
+        if len(results) < limit:
+            after = (
+                (cursor.score, cursor.term.casefold())
+                if cursor is not None and cursor.match_rank == 2
+                else None
+            )
+            full_text_matches = heapq.nsmallest(
+                limit - len(results),
+                (
+                    (score, self._sort_keys[position], position)
+                    for score, position in self._search_full_text(term)
+                    if position not in prefix_range
+                    and (
+                        after is None
+                        or (score, self._sort_keys[position]) > after
+                    )
+                ),
+            )
+            results.extend(
+                SearchResult(
+                    SearchCursor(
+                        2, score, self._brevity_terms.terms[position]
+                    ),
+                    self._brevity_terms[position],
+                )
+                for score, _, position in full_text_matches
+            )
+
+        return results
+
+    def complete(self, prefix: str, limit: int = 25) -> list[str]:
+        """Get the terms which complete a partially typed term.
+
+        Terms which start with the prefix come first in alphabetical order,
+        followed by terms with a later word which starts with the prefix,
+        ordered alphabetically from that word on.
+
+        Args:
+            prefix: The partially typed term.
+            limit: The limit of returned terms.
+
+        Returns:
+            A list of the completed terms.
+
+        """
+        key = prefix.lstrip().casefold()
+        positions = list(self._get_prefix_range(self._sort_keys, key)[:limit])
+
+        if key and len(positions) < limit:
+            found_positions = set(positions)
+
+            for suffix_position in self._get_prefix_range(
+                self._word_suffix_keys, key
+            ):
+                position = self._word_suffixes[suffix_position][1]
+
+                if position not in found_positions:
+                    found_positions.add(position)
+                    positions.append(position)
+
+                    if len(positions) == limit:
+                        break
+
+        return [self._brevity_terms.terms[position] for position in positions]
+
+    def suggest(
+        self, term: str, max_distance: int = 2, limit: int = 3
+    ) -> list[str]:
+        """Get similar brevity terms for a possibly misspelled search term.
+
+        Placeholders like "[location]" are ignored when comparing the terms.
+
+        Args:
+            term: The possibly misspelled term.
+            max_distance: The maximum edit distance of a suggestion.
+            limit: The limit of returned suggestions.
+
+        Returns:
+            A list of suggested terms ordered by their edit distance.
+
+        """
+        found_keys = sorted(
+            self._bk_tree.search(term.strip().casefold(), max_distance)
+        )
+        suggestions: list[str] = []
+
+        for _, key in found_keys:
+            suggestions.extend(self._suggestion_terms[key])
+
+        return suggestions[:limit]
@@ -1,59 +1,308 @@
 # Copyright 2026 Niklas Glienke
 
+import itertools
 import logging
+import re
 import sqlite3
-from pathlib import Path
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple
 
-from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.models.brevity_term_model import (
+    BrevityTerm,
+    BrevityTermRegistry,
+)
+from cvw22_operations_officer.services.brevity_term_index import (
+    SCORE_PRECISION,
+    WORD_PATTERN,
+    BrevityTermIndex,
+    SearchCursor,
+    SearchResult,
+)
+from cvw22_operations_officer.utils.database import DatabaseManager
+from cvw22_operations_officer.utils.metrics import MetricsRegistry
+
+# Exact and prefix matches are ordered by term like in the in-memory index,
+# even if they match the full-text search as well.
+_SCORE = "CASE WHEN MIN(match_rank) < 2 THEN 0.0 ELSE MIN(score) END"
+
+_SEARCH_QUERY = """
+    SELECT brevity_term_id, term, description, MIN(match_rank), {score}
+    FROM (
+        SELECT brevity_term_id, term, description,
+            0 AS match_rank, 0.0 AS score
+        FROM brevity_term
+        WHERE term = :term COLLATE NOCASE
+        UNION ALL
+        SELECT brevity_term_id, term, description,
+            1 AS match_rank, 0.0 AS score
+        FROM brevity_term
+        WHERE term LIKE :prefix ESCAPE '\\'
+        {full_text_search}
+    )
+    GROUP BY brevity_term_id
+    HAVING (MIN(match_rank), {score}, term COLLATE NOCASE)
+        > (:after_match_rank, :after_score, :after_term)
+    ORDER BY MIN(match_rank), {score}, term COLLATE NOCASE, term
+    LIMIT :limit
+"""
+
+_FULL_TEXT_SEARCH_QUERY = """
+        UNION ALL
+        SELECT brevity_term.brevity_term_id, brevity_term.term,
+            brevity_term.description,
+            2 AS match_rank,
+            round(bm25(brevity_term_fts, 10.0, 1.0), {precision}) AS score
+        FROM brevity_term_fts
+        JOIN brevity_term
+            ON brevity_term.brevity_term_id = brevity_term_fts.rowid
+        WHERE brevity_term_fts MATCH :match
+"""
+
+POP_DIGEST_QUEUE_QUERY = """
+    DELETE FROM digest_queue
+    WHERE position = (SELECT MIN(position) FROM digest_queue)
+    RETURNING
+        brevity_term_id,
+        (
+            SELECT term FROM brevity_term
+            WHERE brevity_term.brevity_term_id = digest_queue.brevity_term_id
+        ),
+        (
+            SELECT description FROM brevity_term
+            WHERE brevity_term.brevity_term_id = digest_queue.brevity_term_id
+        )
+"""
+
+UPDATE_BREVITY_TERM_QUERY = """
+    UPDATE brevity_term SET term = :term, description = :description
+    WHERE term = :term COLLATE NOCASE
+        AND (term <> :term OR description <> :description)
+"""
+
+INSERT_BREVITY_TERM_QUERY = """
+    INSERT INTO brevity_term (term, description, used_in_digest)
+    SELECT :term, :description, 0
+    WHERE NOT EXISTS (
+        SELECT 1 FROM brevity_term WHERE term = :term COLLATE NOCASE
+    )
+"""
+
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+EXPORT_FETCH_SIZE = 1000
+
+SEARCH_QUERY = _SEARCH_QUERY.format(
+    full_text_search=_FULL_TEXT_SEARCH_QUERY.format(precision=SCORE_PRECISION),
+    score=_SCORE,
+)
+TERM_SEARCH_QUERY = _SEARCH_QUERY.format(full_text_search="", score=_SCORE)
+
+
+# Ranks before every search result, so the first page starts at the top.
+FIRST_PAGE_CURSOR = SearchCursor(-1, 0.0, "")
+
+
+class SearchPage(NamedTuple):
+    """Represent a page of the brevity terms found by a search."""
+
+    results: list[SearchResult]
+    has_more: bool
+
+    @property
+    def brevity_terms(self) -> list[BrevityTerm]:
+        """The found brevity terms of the page."""
+        return [result.brevity_term for result in self.results]
+
+    @property
+    def next_cursor(self) -> SearchCursor | None:
+        """The cursor of the next page or None if this is the last page."""
+        return self.results[-1].cursor if self.has_more else None
+
+
+class ImportSummary(NamedTuple):
+    """Represent the outcome of a brevity term import."""
+
+    inserted: int
+    updated: int
 
 
 class BrevityTermService:
     """Provide interaction with the stored brevity terms."""
 
-    def __init__(self, db_path: Path):
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        metrics: MetricsRegistry | None = None,
+    ):
         """Initialize the database.
 
         Args:
-            db_path: Path to the sqlite database file.
+            database_manager: The manager of the database connections.
+            metrics: The registry to record metrics in.
 
         """
-        self.DB_PATH = db_path
+        self.database_manager = database_manager
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
         self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+        self._digest_resets = self.metrics.counter(
+            "brevity_term_digest_resets",
+            "Number of times the digest rotation has been refilled.",
+        )
+        self.brevity_term_registry = BrevityTermRegistry()
+        self._term_index: BrevityTermIndex | None = None
+        # The version of the brevity terms the index and listeners are at.
+        self._version: int | None = None
+        self._change_listeners: list[Callable[[], None]] = []
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Register a function which is called after the terms changed.
+
+        Args:
+            listener: The function to call.
+
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change_listeners(self) -> None:
+        """Call all registered change listeners."""
+        for listener in self._change_listeners:
+            listener()
+
+    @property
+    def is_term_index_stale(self) -> bool:
+        """Whether the in-memory index does not reflect the database."""
+        return self._term_index is None
+
+    def load_term_index(self) -> None:
+        """Build the in-memory index from all stored brevity terms.
+
+        The new index replaces the current index at once, so concurrent
+        searches either use the old or the new index.
+        """
+        self.logger.info("Load all brevity terms into the in-memory index.")
+
+        with self.database_manager.read() as connection:
+            # Read the version and the terms from the same snapshot.
+            connection.execute("BEGIN")
+            version = self._get_version(connection)
+            response = connection.execute(
+                "SELECT brevity_term_id, term, description FROM brevity_term"
+            )
+            self._term_index = BrevityTermIndex(
+                response.fetchall(), self.brevity_term_registry
+            )
+            self._version = version
 
-    def _reset_used_in_digest(self) -> None:
-        """Reset used_in_digest attribute for all brevity terms."""
         self.logger.info(
-            "Reset 'used_in_digest' to '0' for all brevity terms."
+            "Loaded %d brevity terms into the index.", len(self._term_index)
         )
 
-        with sqlite3.connect(self.DB_PATH) as connection:
-            cursor = connection.cursor()
-            cursor.execute("UPDATE brevity_term SET used_in_digest = 0")
-            connection.commit()
+    @staticmethod
+    def _get_version(connection: sqlite3.Connection) -> int:
+        """Get the version of the brevity terms.
+
+        Args:
+            connection: An open connection to the database.
 
-    def _set_used_in_digest(self, term: str) -> None:
-        """Set used_in_digest attribute of a brevity term to used.
+        Returns:
+            The version, which is incremented by every change of a term.
+
+        """
+        return connection.execute(
+            "SELECT version FROM brevity_term_version"
+        ).fetchone()[0]
+
+    def reload_if_changed(self) -> bool:
+        """Catch up with changes of the brevity terms by other processes.
+
+        Other bot processes or the import command may change the brevity
+        terms in the shared database. If the version of the brevity terms
+        changed since the index was loaded or the last check, the index is
+        loaded again and all change listeners are called. A check is a single
+        query of one row.
+
+        Returns:
+            A bool which indicates whether the brevity terms changed.
+
+        """
+        with self.database_manager.read() as connection:
+            version = self._get_version(connection)
+
+        if version == self._version:
+            return False
+
+        self.logger.info("Brevity terms changed to version %d.", version)
+
+        if self._term_index is None:
+            self._version = version
+        else:
+            self.load_term_index()
+
+        self._notify_change_listeners()
+
+        return True
+
+    def mark_term_index_stale(self) -> None:
+        """Mark the in-memory index as stale after the terms changed.
+
+        Until the index is loaded again, all searches are served by the
+        database.
+        """
+        self.logger.info("Mark the in-memory brevity term index as stale.")
+        self._term_index = None
+
+    def _refill_digest_queue(self, connection: sqlite3.Connection) -> int:
+        """Start a new digest epoch with a freshly shuffled rotation.
 
         Args:
-            term: Term of the desired brevity term to set used_in_digest
-              attribute.
+            connection: The write connection of the running transaction.
+
+        Returns:
+            The number of the new epoch.
 
         """
-        self.logger.info(f"Set 'used_in_digest' to '1' for {term}")
+        connection.execute("DELETE FROM digest_queue")
+        connection.execute(
+            "INSERT INTO digest_queue (brevity_term_id) "
+            "SELECT brevity_term_id FROM brevity_term ORDER BY random()"
+        )
+        response = connection.execute(
+            "UPDATE digest_state SET epoch = epoch + 1 RETURNING epoch"
+        )
 
-        with sqlite3.connect(self.DB_PATH) as connection:
-            cursor = connection.cursor()
-            cursor.execute(
-                "UPDATE brevity_term SET used_in_digest = 1 WHERE term = ?",
-                (term,),
-            )
-            connection.commit()
+        return response.fetchone()[0]
+
+    @staticmethod
+    def _build_match_expression(term: str) -> str:
+        """Build a full-text search expression from a search term.
+
+        Every word of the search term is quoted, so that FTS5 operators like
+        "NOT" or "OR" are searched for literally. The last word is matched as
+        a prefix.
+
+        Args:
+            term: The term to search for.
+
+        Returns:
+            The FTS5 match expression or an empty str if the search term
+            contains no words.
+
+        """
+        words = [f'"{word}"' for word in WORD_PATTERN.findall(term)]
+
+        if words:
+            words[-1] += "*"
+
+        return " ".join(words)
 
     def get_brevity_terms_by_term(
         self, term: str, limit: int = 5
     ) -> list[BrevityTerm]:
         """Get all matching brevity terms from the given term.
 
+        The matching brevity terms are ranked: An exact match of the term comes
+        first, followed by terms which start with the search term and then by
+        full-text matches of the term and description ranked by bm25.
+
         Args:
             term: The term to search for.
             limit: The limit of returned brevity terms.
@@ -64,56 +313,268 @@ class BrevityTermService:
             list is a BrevityTerm object.
 
         """
-        matching_brevity_terms: list[BrevityTerm] = []
+        return self.search_brevity_terms(term, limit).brevity_terms
+
+    def search_brevity_terms(
+        self, term: str, limit: int = 5, cursor: SearchCursor | None = None
+    ) -> SearchPage:
+        """Get a page of the matching brevity terms from the given term.
+
+        The brevity terms are ranked like in get_brevity_terms_by_term. Pages
+        are seeked by the rank of the last brevity term of the previous page
+        instead of an offset, so every page costs the same, no matter how
+        deep it is.
+
+        Args:
+            term: The term to search for.
+            limit: The maximum number of brevity terms on the page.
+            cursor: The next_cursor of the previous page, or None for the
+                first page.
+
+        Returns:
+            The page of the matching brevity terms, which is empty if no more
+            brevity terms match.
+
+        """
+        term_index = self._term_index
+
+        # One more result than requested tells whether there is a next page.
+        if term_index is None:
+            results = self._search_database(term, limit + 1, cursor)
+        else:
+            self.logger.debug(
+                "Search for brevity terms with '%s' in the in-memory index.",
+                term,
+            )
+            results = term_index.search_ranked(term, limit + 1, cursor)
+
+        if not results:
+            self.logger.info("No matching brevity term found.")
+
+        return SearchPage(results[:limit], len(results) > limit)
+
+    def _search_database(
+        self, term: str, limit: int, cursor: SearchCursor | None = None
+    ) -> list[SearchResult]:
+        """Search the brevity terms in the database.
+
+        Args:
+            term: The term to search for.
+            limit: The limit of returned brevity terms.
+            cursor: The rank after which the returned brevity terms start.
+
+        Returns:
+            A list of the matching brevity terms with their rank in the order
+            of their rank.
+
+        """
+        self.logger.debug(
+            "Search for brevity terms with '%s' in the database.", term
+        )
+
+        match_expression = self._build_match_expression(term)
+        escaped_term = re.sub(r"([\\%_])", r"\\\1", term)
+        query = SEARCH_QUERY if match_expression else TERM_SEARCH_QUERY
+        after = cursor if cursor is not None else FIRST_PAGE_CURSOR
+
+        with self.database_manager.read() as connection:
+            response = connection.execute(
+                query,
+                {
+                    "term": term,
+                    "prefix": f"{escaped_term}%",
+                    "match": match_expression,
+                    "after_match_rank": after.match_rank,
+                    "after_score": after.score,
+                    "after_term": after.term,
+                    "limit": limit,
+                },
+            )
+            fetched_brevity_terms = response.fetchall()
+
+        return [
+            SearchResult(
+                SearchCursor(match_rank, score, term),
+                self.brevity_term_registry.get(
+                    brevity_term_id, term, description
+                ),
+            )
+            for (
+                brevity_term_id,
+                term,
+                description,
+                match_rank,
+                score,
+            ) in fetched_brevity_terms
+        ]
+
+    def import_brevity_terms(
+        self,
+        brevity_terms: Iterable[BrevityTerm],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    ) -> ImportSummary:
+        """Insert new brevity terms and update existing ones by their term.
+
+        The brevity terms are consumed lazily and written in batches, each in
+        its own transaction, so arbitrarily large imports only keep one batch
+        in memory. Terms are matched case-insensitively and the last
+        occurrence of a term within a batch wins. The full-text index is kept
+        in sync by triggers, the in-memory index is rebuilt if it has been
+        loaded and all change listeners are notified.
+
+        Args:
+            brevity_terms: The brevity terms to import.
+            batch_size: Number of brevity terms written per transaction.
+
+        Returns:
+            The number of inserted and updated brevity terms.
+
+        """
+        inserted = 0
+        updated = 0
+
+        for batch in itertools.batched(brevity_terms, batch_size):
+            parameters = list(
+                {
+                    brevity_term.term.casefold(): {
+                        "term": brevity_term.term,
+                        "description": brevity_term.description,
+                    }
+                    for brevity_term in batch
+                }.values()
+            )
+
+            with self.database_manager.write() as connection:
+                updated += connection.executemany(
+                    UPDATE_BREVITY_TERM_QUERY, parameters
+                ).rowcount
+                inserted += connection.executemany(
+                    INSERT_BREVITY_TERM_QUERY, parameters
+                ).rowcount
+
+            self.logger.info(
+                "Imported a batch of %d brevity terms.", len(parameters)
+            )
 
         self.logger.info(
-            f"Search for brevity terms with '{term}' in the database."
+            "Inserted %d and updated %d brevity terms.", inserted, updated
         )
 
-        with sqlite3.connect(self.DB_PATH) as connection:
-            cursor = connection.cursor()
-            response = cursor.execute(
-                "SELECT term, description FROM brevity_term WHERE term LIKE ?",
-                (f"%{term}%",),
+        if inserted or updated:
+            was_term_index_loaded = not self.is_term_index_stale
+            self.mark_term_index_stale()
+            self._notify_change_listeners()
+
+            if was_term_index_loaded:
+                self.load_term_index()
+
+        return ImportSummary(inserted, updated)
+
+    def export_brevity_terms(self) -> Iterator[BrevityTerm]:
+        """Stream all stored brevity terms ordered by their term.
+
+        Yields:
+            Each stored brevity term.
+
+        """
+        with self.database_manager.read() as connection:
+            response = connection.execute(
+                "SELECT term, description FROM brevity_term "
+                "ORDER BY term COLLATE NOCASE, term"
             )
-            fetched_brevity_terms = response.fetchmany(limit)
 
-        if not fetched_brevity_terms:
-            self.logger.info("No matching brevity term found in the database.")
+            while rows := response.fetchmany(EXPORT_FETCH_SIZE):
+                for term, description in rows:
+                    yield BrevityTerm(term, description)
+
+    def complete_brevity_terms(
+        self, prefix: str, limit: int = 25
+    ) -> list[str]:
+        """Get the terms which complete a partially typed term.
+
+        Only the in-memory index is searched, so this is fast enough to be
+        called from the event loop for every keystroke.
+
+        Args:
+            prefix: The partially typed term.
+            limit: The limit of returned terms.
+
+        Returns:
+            A list of the completed terms. The list is empty if nothing has
+            been found or the in-memory index is stale.
+
+        """
+        term_index = self._term_index
+
+        if term_index is None:
             return []
 
-        for term, description in fetched_brevity_terms:
-            matching_brevity_terms.append(BrevityTerm(term, description))
+        return term_index.complete(prefix, limit)
+
+    def suggest_brevity_terms(self, term: str, limit: int = 3) -> list[str]:
+        """Get similar brevity terms for a possibly misspelled search term.
 
-        return matching_brevity_terms
+        Args:
+            term: The possibly misspelled term.
+            limit: The limit of returned suggestions.
+
+        Returns:
+            A list of suggested terms. The list is empty if nothing similar
+            has been found or the in-memory index is stale.
+
+        """
+        term_index = self._term_index
+
+        if term_index is None:
+            return []
+
+        return term_index.suggest(term, limit=limit)
 
     def get_brevity_term_for_digest(self) -> BrevityTerm:
         """Get a yet unused brevity term for the digest.
 
+        The next brevity term is popped from the head of the shuffled digest
+        rotation with a single DELETE ... RETURNING statement inside an
+        immediate transaction. Therefore, concurrent callers, even in other
+        processes, never get the same brevity term of an epoch. If the
+        rotation is exhausted, a new epoch with a newly shuffled rotation is
+        started.
+
         Returns:
             A unused brevity term as a BrevityTerm object for the digest.
 
+        Raises:
+            LookupError: If no brevity terms are stored.
+
         """
         self.logger.info(
             "Get a yet unused brevity term for the digest from the database."
         )
 
-        while True:
-            with sqlite3.connect(self.DB_PATH) as connection:
-                cursor = connection.cursor()
-                response = cursor.execute(
-                    "SELECT term, description FROM brevity_term "
-                    "WHERE used_in_digest = 0 "
-                    "LIMIT 1"
-                )
+        is_reset = False
+
+        with self.database_manager.write() as connection:
+            for _ in range(2):
+                response = connection.execute(POP_DIGEST_QUEUE_QUERY)
                 brevity_term_for_digest = response.fetchone()
 
-            if brevity_term_for_digest is None:
+                if brevity_term_for_digest is not None:
+                    break
+
                 self.logger.info("No unused brevity term found.")
-                self._reset_used_in_digest()
-                continue
+                epoch = self._refill_digest_queue(connection)
+                is_reset = True
+                self.logger.info("Start digest epoch %d.", epoch)
+            else:
+                raise LookupError("No brevity terms stored for the digest.")
+
+        if is_reset:
+            self._digest_resets.inc()
 
-            self.logger.info("Unused brevity term found.")
-            self._set_used_in_digest(brevity_term_for_digest[0])
+        brevity_term_id, term, description = brevity_term_for_digest
 
-            return BrevityTerm(*brevity_term_for_digest)
+        self.logger.info("Unused brevity term %d found.", brevity_term_id)
+
+        return self.brevity_term_registry.get(
+            brevity_term_id, term, description
+        )
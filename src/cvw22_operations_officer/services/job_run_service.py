@@ -0,0 +1,70 @@
+# Copyright 2026 Niklas Glienke
+
+import datetime
+import logging
+
+from cvw22_operations_officer.utils.database import DatabaseManager
+
+DEFAULT_JOB_RUN_RETENTION = datetime.timedelta(days=7)
+
+
+class JobRunService:
+    """Claim the runs of scheduled jobs in the shared database.
+
+    Every bot process which shares the database schedules the same jobs. A
+    run is claimed by inserting the name and due time of the job, which only
+    succeeds for the first process, so every run happens exactly once.
+    """
+
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        retention: datetime.timedelta = DEFAULT_JOB_RUN_RETENTION,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            database_manager: The manager of the database connections.
+            retention: How long claimed runs are kept.
+
+        """
+        self.database_manager = database_manager
+        self.RETENTION = retention
+        self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+    def claim_job_run(self, name: str, due_at: datetime.datetime) -> bool:
+        """Claim the run of a job at its due time.
+
+        Claims older than the retention are removed in the same transaction.
+
+        Args:
+            name: The unique name of the job.
+            due_at: The aware due time of the run.
+
+        Returns:
+            A bool which indicates whether the run has been claimed by this
+            call, and not before by another process.
+
+        """
+        due_at = due_at.astimezone(datetime.UTC)
+
+        with self.database_manager.write() as connection:
+            connection.execute(
+                "DELETE FROM job_run WHERE due_at < ?",
+                ((due_at - self.RETENTION).isoformat(),),
+            )
+            is_claimed = (
+                connection.execute(
+                    "INSERT OR IGNORE INTO job_run (name, due_at) "
+                    "VALUES (?, ?)",
+                    (name, due_at.isoformat()),
+                ).rowcount
+                == 1
+            )
+
+        if not is_claimed:
+            self.logger.info(
+                "'%s' due at %s has already been claimed.", name, due_at
+            )
+
+        return is_claimed
@@ -0,0 +1,410 @@
+# Copyright 2026 Niklas Glienke
+
+import csv
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+
+READ_CHUNK_SIZE = 64 * 1024
+FIELD_NAMES = ("term", "description")
+SUPPORTED_SUFFIXES = (".csv", ".json", ".jsonl", ".yaml", ".yml")
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Untagged plain scalars which YAML resolves to null.
+YAML_NULL_VALUES = frozenset(("", "~", "null", "Null", "NULL"))
+
+
+def _get_format(path: Path) -> str:
+    """Get the file format from the suffix of a path.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The lowercase suffix of the path.
+
+    Raises:
+        ValueError: If the file format is not supported.
+
+    """
+    suffix = path.suffix.lower()
+
+    if suffix not in SUPPORTED_SUFFIXES:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. "
+            f"Supported formats: {', '.join(SUPPORTED_SUFFIXES)}"
+        )
+
+    return suffix
+
+
+def _to_brevity_term(record: Any, number: int) -> BrevityTerm:
+    """Validate a record and convert it to a brevity term.
+
+    Args:
+        record: The record read from the file.
+        number: The number of the record in the file, starting at 1.
+
+    Returns:
+        The brevity term of the record.
+
+    Raises:
+        ValueError: If the record has no term or description.
+
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"Record {number} is not a mapping.")
+
+    term = record.get("term")
+    description = record.get("description")
+
+    if not isinstance(term, str) or not term.strip():
+        raise ValueError(f"Record {number} has no term.")
+    elif not isinstance(description, str) or not description.strip():
+        raise ValueError(f"Record {number} has no description.")
+
+    return BrevityTerm(term.strip(), description.strip())
+
+
+def _read_json_array(file: TextIO) -> Iterator[Any]:
+    """Read the elements of a top-level JSON array one after another.
+
+    The file is read in chunks, so only the current element is kept in
+    memory. The elements are decoded at their offset in the current chunk,
+    so the chunk is not copied for every element.
+
+    Args:
+        file: The opened JSON file.
+
+    Yields:
+        The decoded elements of the array.
+
+    Raises:
+        ValueError: If the file does not contain exactly one JSON array.
+
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    number = 0
+    has_started = False
+    has_ended = False
+    # Whether the last element is not followed by its separator yet.
+    is_separator_expected = False
+    is_element_expected = False
+    is_end_of_file = False
+
+    while not is_end_of_file:
+        chunk = file.read(READ_CHUNK_SIZE)
+        is_end_of_file = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        while True:
+            position = JSON_WHITESPACE.match(buffer, position).end()
+
+            if position == len(buffer):
+                break
+            elif has_ended:
+                raise ValueError("The JSON array is followed by more data.")
+            elif not has_started:
+                if buffer[position] != "[":
+                    raise ValueError("The JSON file must contain an array.")
+
+                position += 1
+                has_started = True
+            elif buffer[position] == "]":
+                if is_element_expected:
+                    raise ValueError(
+                        f"The JSON array has a comma after element {number}."
+                    )
+
+                position += 1
+                has_ended = True
+            elif is_separator_expected:
+                if buffer[position] != ",":
+                    raise ValueError(
+                        f"The JSON array has no comma after element {number}."
+                    )
+
+                position += 1
+                is_separator_expected = False
+                is_element_expected = True
+            elif buffer[position] == ",":
+                raise ValueError(
+                    f"The JSON array has an extra comma after element "
+                    f"{number}."
+                )
+            else:
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if is_end_of_file:
+                        raise
+
+                    break
+
+                # A value at the end of the buffer may continue in the next
+                # chunk, e.g. a number which has been cut off.
+                if end == len(buffer) and not is_end_of_file:
+                    break
+
+                yield element
+                number += 1
+                position = end
+                is_separator_expected = True
+                is_element_expected = False
+
+    if not has_ended:
+        raise ValueError("The JSON array is not terminated.")
+
+
+def _read_json_lines(file: TextIO) -> Iterator[Any]:
+    """Read one JSON value per line.
+
+    Args:
+        file: The opened JSON Lines file.
+
+    Yields:
+        The decoded value of every non-empty line.
+
+    """
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _read_yaml_sequence(file: TextIO) -> Iterator[dict[str, str]]:
+    """Read the mappings of a top-level YAML sequence one after another.
+
+    The file is parsed event by event instead of being loaded as a whole.
+    Only flat mappings with scalar values are supported, and all values are
+    read as strings. Values which are null are left out, like missing ones.
+
+    Args:
+        file: The opened YAML file.
+
+    Yields:
+        Each mapping of the sequence.
+
+    Raises:
+        ValueError: If the file does not contain a sequence of flat mappings.
+
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    has_started = False
+    number = 0
+    mapping: dict[str, str] | None = None
+    key: str | None = None
+
+    for event in yaml.parse(file, Loader=loader):
+        if not isinstance(event, (yaml.NodeEvent, yaml.CollectionEndEvent)):
+            continue
+        elif not has_started:
+            if not isinstance(event, yaml.SequenceStartEvent):
+                break
+
+            has_started = True
+        elif mapping is None:
+            if isinstance(event, yaml.SequenceEndEvent):
+                return
+
+            number += 1
+
+            if not isinstance(event, yaml.MappingStartEvent):
+                raise ValueError(f"Record {number} is not a mapping.")
+
+            mapping = {}
+        elif isinstance(event, yaml.MappingEndEvent):
+            yield mapping
+            mapping = None
+        elif not isinstance(event, yaml.ScalarEvent):
+            raise ValueError(f"Record {number} has a value which is nested.")
+        elif key is None:
+            key = event.value
+        else:
+            if not event.implicit[0] or event.value not in YAML_NULL_VALUES:
+                mapping[key] = event.value
+
+            key = None
+
+    raise ValueError("The YAML file must contain a sequence.")
+
+
+def read_brevity_terms(path: Path) -> Iterator[BrevityTerm]:
+    """Stream the brevity terms of a CSV, JSON, JSON Lines or YAML file.
+
+    CSV files need a header with the columns "term" and "description". JSON
+    and YAML files contain a list of mappings with these keys, and JSON Lines
+    files contain one such mapping per line.
+
+    Args:
+        path: Path to the file.
+
+    Yields:
+        Each brevity term of the file.
+
+    """
+    file_format = _get_format(path)
+
+    with open(path, "r", encoding="UTF-8", newline="") as f:
+        match file_format:
+            case ".csv":
+                records: Iterator[Any] = csv.DictReader(f)
+            case ".json":
+                records = _read_json_array(f)
+            case ".jsonl":
+                records = _read_json_lines(f)
+            case _:
+                records = _read_yaml_sequence(f)
+
+        for number, record in enumerate(records, 1):
+            yield _to_brevity_term(record, number)
+
+
+def _to_record(brevity_term: BrevityTerm) -> dict[str, str]:
+    """Convert a brevity term to a record.
+
+    Args:
+        brevity_term: The brevity term to convert.
+
+    Returns:
+        A dict with the term and description.
+
+    """
+    return {"term": brevity_term.term, "description": brevity_term.description}
+
+
+def _write_csv(file: TextIO, brevity_terms: Iterable[BrevityTerm]) -> int:
+    """Write brevity terms as CSV with a header.
+
+    Args:
+        file: The opened file.
+        brevity_terms: The brevity terms to write.
+
+    Returns:
+        The number of written brevity terms.
+
+    """
+    writer = csv.writer(file)
+    writer.writerow(FIELD_NAMES)
+    count = 0
+
+    for brevity_term in brevity_terms:
+        writer.writerow((brevity_term.term, brevity_term.description))
+        count += 1
+
+    return count
+
+
+def _write_json_array(
+    file: TextIO, brevity_terms: Iterable[BrevityTerm]
+) -> int:
+    """Write brevity terms as a JSON array, one element per line.
+
+    Args:
+        file: The opened file.
+        brevity_terms: The brevity terms to write.
+
+    Returns:
+        The number of written brevity terms.
+
+    """
+    count = 0
+    file.write("[")
+
+    for brevity_term in brevity_terms:
+        file.write(",\n    " if count else "\n    ")
+        file.write(json.dumps(_to_record(brevity_term), ensure_ascii=False))
+        count += 1
+
+    file.write("\n]\n")
+
+    return count
+
+
+def _write_json_lines(
+    file: TextIO, brevity_terms: Iterable[BrevityTerm]
+) -> int:
+    """Write one brevity term as JSON per line.
+
+    Args:
+        file: The opened file.
+        brevity_terms: The brevity terms to write.
+
+    Returns:
+        The number of written brevity terms.
+
+    """
+    count = 0
+
+    for brevity_term in brevity_terms:
+        file.write(json.dumps(_to_record(brevity_term), ensure_ascii=False))
+        file.write("\n")
+        count += 1
+
+    return count
+
+
+def _write_yaml_sequence(
+    file: TextIO, brevity_terms: Iterable[BrevityTerm]
+) -> int:
+    """Write brevity terms as a YAML sequence of mappings.
+
+    Args:
+        file: The opened file.
+        brevity_terms: The brevity terms to write.
+
+    Returns:
+        The number of written brevity terms.
+
+    """
+    import yaml
+
+    count = 0
+
+    for brevity_term in brevity_terms:
+        yaml.safe_dump(
+            [_to_record(brevity_term)],
+            file,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+        count += 1
+
+    if not count:
+        file.write("[]\n")
+
+    return count
+
+
+def write_brevity_terms(
+    path: Path, brevity_terms: Iterable[BrevityTerm]
+) -> int:
+    """Stream brevity terms into a CSV, JSON, JSON Lines or YAML file.
+
+    Args:
+        path: Path to the file.
+        brevity_terms: The brevity terms to write.
+
+    Returns:
+        The number of written brevity terms.
+
+    """
+    file_format = _get_format(path)
+
+    with open(path, "w", encoding="UTF-8", newline="") as f:
+        match file_format:
+            case ".csv":
+                return _write_csv(f, brevity_terms)
+            case ".json":
+                return _write_json_array(f, brevity_terms)
+            case ".jsonl":
+                return _write_json_lines(f, brevity_terms)
+            case _:
+                return _write_yaml_sequence(f, brevity_terms)
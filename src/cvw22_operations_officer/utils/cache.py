@@ -0,0 +1,139 @@
+# Copyright 2026 Niklas Glienke
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import NamedTuple
+
+DEFAULT_MAX_SIZE = 256
+DEFAULT_TTL_SECONDS = 300.0
+
+
+class CacheInfo(NamedTuple):
+    """Represent the statistics of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int
+    current_size: int
+
+
+class LRUCache[K: Hashable, V]:
+    """Cache values with a least recently used eviction and a time to live.
+
+    The cache is thread-safe, so it can be invalidated from the thread pool
+    while the event loop reads from it. Every invalidation starts a new
+    generation, so a value which was computed before the invalidation can
+    be kept from being cached afterwards.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of cached values.
+            ttl_seconds: Number of seconds until a cached value expires.
+            timer: Function which returns the current time in seconds.
+
+        Raises:
+            ValueError: If the maximum size is smaller than one.
+
+        """
+        if max_size < 1:
+            raise ValueError("The maximum size must be at least 1.")
+
+        self.MAX_SIZE = max_size
+        self.TTL_SECONDS = ttl_seconds
+
+        self._timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of times the cache has been cleared."""
+        return self._generation
+
+    def get(self, key: K) -> V | None:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The cached value or None if the key is not cached or expired.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= self._timer():
+                del self._entries[key]
+                self._misses += 1
+                self._evictions += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """Cache a value and evict the least recently used value if full.
+
+        Args:
+            key: The key of the value.
+            value: The value to cache.
+            generation: The generation the value has been computed in. If the
+                cache has been cleared since, the value is not cached.
+
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            self._entries[key] = (self._timer() + self.TTL_SECONDS, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.MAX_SIZE:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def cache_info(self) -> CacheInfo:
+        """Get the statistics of the cache.
+
+        Returns:
+            The hits, misses, evictions and sizes of the cache.
+
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.MAX_SIZE,
+                len(self._entries),
+            )
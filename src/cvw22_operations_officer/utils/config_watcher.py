@@ -0,0 +1,127 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+type FileSignature = tuple[int, int] | None
+
+
+def get_file_signature(path: Path) -> FileSignature:
+    """Get the modification time and size of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        A tuple of the modification time in nanoseconds and the size, or None
+        if the file does not exist.
+
+    """
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class ConfigWatcher:
+    """Reload the config whenever its file changes.
+
+    The file is checked by its modification time and size on an interval,
+    which works on every platform and file system, including bind mounts
+    into containers where inotify events are not delivered. A check is a
+    single stat call, so it does not read or parse the file.
+    """
+
+    def __init__(self, path: Path, callback: Callable[[], None]) -> None:
+        """Initialize the watcher without starting it.
+
+        Args:
+            path: Path to the watched file.
+            callback: The function to call after the file changed.
+
+        """
+        self.PATH = path
+        self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+        self._callback = callback
+        self._signature = get_file_signature(path)
+        self._task: asyncio.Task | None = None
+
+    def check(self) -> bool:
+        """Call the callback if the file changed since the last check.
+
+        A deleted file is not reported as a change, so the callback is only
+        called again once the file exists.
+
+        Returns:
+            A bool which indicates whether the callback has been called.
+
+        """
+        signature = get_file_signature(self.PATH)
+
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+
+        if signature is None:
+            self.logger.warning("Watched file %s was deleted.", self.PATH)
+            return False
+
+        self.logger.info("Watched file %s changed.", self.PATH)
+        self._callback()
+
+        return True
+
+    def is_running(self) -> bool:
+        """Check if the watcher is running.
+
+        Returns:
+            A bool which indicates whether the watcher is running.
+
+        """
+        return self._task is not None and not self._task.done()
+
+    def start(self, interval_seconds: float) -> None:
+        """Start watching the file in the running event loop.
+
+        Args:
+            interval_seconds: Number of seconds between two checks.
+
+        """
+        if self.is_running():
+            return
+
+        self._signature = get_file_signature(self.PATH)
+        self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        """Stop watching the file."""
+        if self._task is None:
+            return
+
+        task = self._task
+        self._task = None
+        task.cancel()
+
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self, interval_seconds: float) -> None:
+        """Check the file on every interval.
+
+        Args:
+            interval_seconds: Number of seconds between two checks.
+
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+
+            try:
+                self.check()
+            except Exception:
+                self.logger.exception("Reloading %s failed.", self.PATH)
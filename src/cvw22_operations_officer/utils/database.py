@@ -0,0 +1,744 @@
+# Copyright 2026 Niklas Glienke
+
+import logging
+import queue
+import sqlite3
+import threading
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_READ_POOL_SIZE = 4
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_CACHE_SIZE_KIB = 8192
+DEFAULT_MMAP_SIZE = 64 * 1024 * 1024
+DEFAULT_REPLICA_LOCK_TIMEOUT_SECONDS = 0.5
+MAX_REPLICA_APPLY_PASSES = 4
+
+
+class DatabaseManager:
+    """Own the long-lived connections to the sqlite database.
+
+    The manager keeps a pool of read connections and a single write
+    connection, so the file open, schema parse and page cache warmup are only
+    paid once instead of on every query. The database is switched to WAL mode,
+    which allows the readers to keep reading while the writer commits.
+    """
+
+    def __init__(
+        self, db_path: Path, read_pool_size: int = DEFAULT_READ_POOL_SIZE
+    ) -> None:
+        """Initialize the connection manager.
+
+        Connections are opened lazily on first use.
+
+        Args:
+            db_path: Path to the sqlite database file.
+            read_pool_size: Maximum number of pooled read connections.
+
+        Raises:
+            ValueError: If the read pool size is smaller than one.
+
+        """
+        if read_pool_size < 1:
+            raise ValueError("The read pool size must be at least 1.")
+
+        self.DB_PATH = db_path
+        self.READ_POOL_SIZE = read_pool_size
+        self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] = (
+            queue.LifoQueue()
+        )
+        self._read_semaphore = threading.BoundedSemaphore(read_pool_size)
+        self._write_lock = threading.Lock()
+        self._write_connection: sqlite3.Connection | None = None
+        self._closed = False
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        """Open a new connection with the tuned pragmas applied.
+
+        Args:
+            read_only: Whether the connection is only used for reading.
+
+        Returns:
+            The opened connection.
+
+        """
+        connection = sqlite3.connect(
+            self.DB_PATH,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        connection.execute(f"PRAGMA busy_timeout = {DEFAULT_BUSY_TIMEOUT_MS}")
+        connection.execute(f"PRAGMA cache_size = -{DEFAULT_CACHE_SIZE_KIB}")
+        connection.execute(f"PRAGMA mmap_size = {DEFAULT_MMAP_SIZE}")
+        connection.execute("PRAGMA foreign_keys = ON")
+
+        if read_only:
+            connection.execute("PRAGMA query_only = 1")
+        else:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+
+        return connection
+
+    def _ensure_open(self) -> None:
+        """Raise an error if the manager has already been closed.
+
+        Raises:
+            sqlite3.ProgrammingError: If the manager is closed.
+
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError(
+                "Cannot operate on a closed database manager."
+            )
+
+    def _get_write_connection(self) -> sqlite3.Connection:
+        """Get the write connection and open it if necessary.
+
+        The write connection is opened before any read connection, so the
+        database is already in WAL mode when the readers connect.
+
+        Returns:
+            The write connection.
+
+        """
+        if self._write_connection is None:
+            self._write_connection = self._connect(read_only=False)
+
+        return self._write_connection
+
+    def _acquire_read_connection(self) -> sqlite3.Connection:
+        """Take a read connection from the pool or open a new one.
+
+        Returns:
+            A read connection.
+
+        """
+        try:
+            return self._read_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._write_lock:
+            self._get_write_connection()
+
+        return self._connect(read_only=True)
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection.
+
+        If all read connections are in use, the caller blocks until one is
+        returned to the pool.
+
+        Yields:
+            A read connection which must not be used for writing.
+
+        """
+        self._ensure_open()
+
+        with self._read_semaphore:
+            connection = self._acquire_read_connection()
+
+            try:
+                yield connection
+            finally:
+                if connection.in_transaction:
+                    connection.rollback()
+
+                self._release_read_connection(connection)
+
+    def _release_read_connection(self, connection: sqlite3.Connection) -> None:
+        """Return a read connection to the pool or close it.
+
+        Args:
+            connection: The returned read connection.
+
+        """
+        if self._closed:
+            connection.close()
+        else:
+            self._read_pool.put(connection)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the write connection inside an immediate transaction.
+
+        The transaction is committed when the block exits normally and rolled
+        back if an exception is raised.
+
+        Yields:
+            The write connection.
+
+        """
+        self._ensure_open()
+
+        with self._write_lock:
+            connection = self._get_write_connection()
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            else:
+                connection.commit()
+                self._after_commit(connection)
+
+    def _after_commit(self, connection: sqlite3.Connection) -> None:
+        """Handle a committed write while the write lock is still held.
+
+        Args:
+            connection: The write connection.
+
+        """
+
+    def close(self) -> None:
+        """Close all connections.
+
+        Read connections which are currently borrowed are closed as soon as
+        they are returned.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self.logger.info("Close all database connections.")
+
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self._write_lock:
+            if self._write_connection is not None:
+                self._write_connection.close()
+                self._write_connection = None
+
+
+class ReplicatedDatabaseManager(DatabaseManager):
+    """Serve all reads from an in-memory replica of the sqlite database.
+
+    The database file is copied into a shared-cache in-memory database with
+    the backup API, which the pooled read connections are opened on. Writes
+    go to the database file and are applied to the replica once they are
+    committed: Temporary triggers of the write connection record the rowids
+    of all changed rows, which are then copied into the replica row by row.
+    The triggers of the replica itself keep its full-text index and term
+    version in sync. Tables without rowid are small and copied as a whole.
+    The readers share the tables of the replica, and sqlite does not wait
+    for their table locks. So a write is only applied while no read
+    connection of the replica is borrowed, and new readers wait until it is
+    applied.
+
+    Commits of other processes are detected by the data version of the
+    write connection, which only changes with commits of other connections.
+    Then the database file is copied again into a new in-memory database, a
+    generation, which replaces the current generation at once. Read
+    connections of the old generation are closed when they are returned,
+    which frees it. A new generation is also copied if the replica is
+    locked by readers for too long to apply a write.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        replica_lock_timeout: float = DEFAULT_REPLICA_LOCK_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the connection manager.
+
+        The replica is loaded lazily on first use.
+
+        Args:
+            db_path: Path to the sqlite database file.
+            read_pool_size: Maximum number of pooled read connections.
+            replica_lock_timeout: Number of seconds to wait for readers which
+                lock the replica, before a new generation is copied instead.
+
+        Raises:
+            ValueError: If the read pool size is smaller than one.
+
+        """
+        super().__init__(db_path, read_pool_size)
+
+        self.REPLICA_LOCK_TIMEOUT = replica_lock_timeout
+        self._replica_name = f"replica-{uuid.uuid4().hex}"
+        self._pool_lock = threading.Lock()
+        self._readers_changed = threading.Condition(self._pool_lock)
+        # The number of borrowed read connections of the current generation.
+        self._reader_count = 0
+        self._is_applying = False
+        # Writes to the current generation and keeps it alive while no
+        # reader is connected. It is only used with the write lock held.
+        self._replica_connection: sqlite3.Connection | None = None
+        self._replica_connections: set[sqlite3.Connection] = set()
+        self._generation = 0
+        self._data_version: int | None = None
+        # The names of the tables whose rows are copied by their rowid.
+        self._rowid_tables: set[str] = set()
+        self._schema_version: int | None = None
+
+    @property
+    def generation(self) -> int:
+        """The number of copies of the database file into the replica."""
+        return self._generation
+
+    def _connect_replica(self, generation: int) -> sqlite3.Connection:
+        """Open a new connection to a generation of the replica.
+
+        Args:
+            generation: The number of the generation.
+
+        Returns:
+            The opened connection.
+
+        """
+        return sqlite3.connect(
+            f"file:{self._replica_name}-{generation}?mode=memory&cache=shared",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+
+    def _get_write_connection(self) -> sqlite3.Connection:
+        """Get the write connection and open it if necessary.
+
+        A newly opened write connection records the changed rows of every
+        table in the temporary replica_change table.
+
+        Returns:
+            The write connection.
+
+        """
+        if self._write_connection is None:
+            connection = super()._get_write_connection()
+            connection.execute(
+                "CREATE TEMP TABLE replica_change "
+                "(table_name TEXT NOT NULL, row_id INTEGER)"
+            )
+            self._record_changes(connection)
+
+        return self._write_connection  # type: ignore[return-value]
+
+    def _record_changes(self, connection: sqlite3.Connection) -> None:
+        """Create the temporary triggers which record the changed rows.
+
+        The triggers are created for the current schema, so they have to be
+        created again whenever the schema changes.
+
+        Args:
+            connection: The write connection.
+
+        """
+        for (name,) in connection.execute(
+            "SELECT name FROM temp.sqlite_schema WHERE type = 'trigger'"
+        ).fetchall():
+            connection.execute(f'DROP TRIGGER temp."{name}"')
+
+        self._rowid_tables = set()
+        self._schema_version = connection.execute(
+            "PRAGMA main.schema_version"
+        ).fetchone()[0]
+        virtual_tables = [
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM main.sqlite_schema WHERE type = 'table' "
+                "AND sql LIKE 'CREATE VIRTUAL TABLE%'"
+            )
+        ]
+
+        for _, name, table_type, _, without_rowid, _ in connection.execute(
+            "PRAGMA main.table_list"
+        ).fetchall():
+            # Virtual tables and their shadow tables are maintained by the
+            # triggers of the replica.
+            if (
+                table_type != "table"
+                or name.startswith("sqlite_")
+                or any(
+                    name == virtual_table
+                    or name.startswith(f"{virtual_table}_")
+                    for virtual_table in virtual_tables
+                )
+            ):
+                continue
+
+            if not without_rowid:
+                self._rowid_tables.add(name)
+
+            for event, rows in (
+                ("INSERT", ("new",)),
+                ("UPDATE", ("old", "new")),
+                ("DELETE", ("old",)),
+            ):
+                values = ", ".join(
+                    f"('{name}', NULL)"
+                    if without_rowid
+                    else f"('{name}', {row}.rowid)"
+                    for row in rows
+                )
+                connection.execute(
+                    f'CREATE TEMP TRIGGER "replica_{name}_{event}" '
+                    f'AFTER {event} ON main."{name}" BEGIN '
+                    "INSERT INTO replica_change (table_name, row_id) "
+                    f"VALUES {values}; END"
+                )
+
+    def _update_recording(self, connection: sqlite3.Connection) -> bool:
+        """Create the triggers again if the schema changed.
+
+        Args:
+            connection: The write connection.
+
+        Returns:
+            A bool which indicates whether the schema changed.
+
+        """
+        schema_version = connection.execute(
+            "PRAGMA main.schema_version"
+        ).fetchone()[0]
+
+        if schema_version == self._schema_version:
+            return False
+
+        self._record_changes(connection)
+
+        return True
+
+    def _copy_replica(self, connection: sqlite3.Connection) -> None:
+        """Copy the database file into a new generation of the replica.
+
+        The caller must hold the write lock.
+
+        Args:
+            connection: The write connection.
+
+        """
+        self._update_recording(connection)
+        data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+        generation = self._generation + 1
+        replica_connection = self._connect_replica(generation)
+        connection.backup(replica_connection)
+        self.logger.debug(
+            "Copied the database into generation %d of the replica.",
+            generation,
+        )
+
+        with self._pool_lock:
+            previous_connection = self._replica_connection
+            self._replica_connection = replica_connection
+            self._replica_connections = set()
+            self._reader_count = 0
+            self._generation = generation
+            self._data_version = data_version
+
+            while True:
+                try:
+                    self._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+        if previous_connection is not None:
+            previous_connection.close()
+
+    def _is_changed_elsewhere(self, connection: sqlite3.Connection) -> bool:
+        """Check whether another connection changed the database file.
+
+        Args:
+            connection: The write connection.
+
+        Returns:
+            A bool which indicates whether the database file changed since
+            it has been copied into the replica.
+
+        """
+        data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+
+        return data_version != self._data_version
+
+    def _apply_changes(self, connection: sqlite3.Connection) -> bool:
+        """Copy the rows changed by the write connection into the replica.
+
+        The triggers of the replica may change further rows, like the term
+        version, which were changed by the same triggers in the database
+        file. So the changed rows are copied again until all of them match
+        the database file.
+
+        Args:
+            connection: The write connection.
+
+        Returns:
+            A bool which indicates whether the replica matches the database
+            file, which is False if the triggers never settled.
+
+        Raises:
+            sqlite3.OperationalError: If the replica is locked.
+
+        """
+        replica_connection = self._replica_connection
+        assert replica_connection is not None
+        changes = connection.execute(
+            "SELECT DISTINCT table_name, row_id FROM replica_change"
+        ).fetchall()
+        row_changes = [
+            (table_name, row_id)
+            for table_name, row_id in changes
+            if table_name in self._rowid_tables
+        ]
+
+        replica_connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            for table_name in {table_name for table_name, _ in changes}:
+                if table_name not in self._rowid_tables:
+                    self._copy_table(connection, table_name)
+
+            for _ in range(MAX_REPLICA_APPLY_PASSES):
+                copied_rows = [
+                    self._copy_row(connection, table_name, row_id)
+                    for table_name, row_id in row_changes
+                ]
+
+                if not any(copied_rows):
+                    break
+            else:
+                replica_connection.rollback()
+                return False
+        except BaseException:
+            if replica_connection.in_transaction:
+                replica_connection.rollback()
+
+            raise
+
+        replica_connection.commit()
+
+        return True
+
+    def _copy_table(
+        self, connection: sqlite3.Connection, table_name: str
+    ) -> None:
+        """Copy all rows of a table of the database file into the replica.
+
+        Args:
+            connection: The write connection.
+            table_name: The name of the table.
+
+        """
+        replica_connection = self._replica_connection
+        assert replica_connection is not None
+        rows = connection.execute(f'SELECT * FROM main."{table_name}"')
+        replica_connection.execute(f'DELETE FROM "{table_name}"')
+        placeholders = ", ".join("?" * len(rows.description))
+        replica_connection.executemany(
+            f'INSERT INTO "{table_name}" VALUES ({placeholders})', rows
+        )
+
+    def _copy_row(
+        self, connection: sqlite3.Connection, table_name: str, row_id: int
+    ) -> bool:
+        """Copy a row of the database file into the replica by its rowid.
+
+        The row is only updated, inserted or deleted if it differs, so the
+        triggers of the replica fire like they did in the database file.
+
+        Args:
+            connection: The write connection.
+            table_name: The name of the table of the row.
+            row_id: The rowid of the row.
+
+        Returns:
+            A bool which indicates whether the row of the replica changed.
+
+        """
+        replica_connection = self._replica_connection
+        assert replica_connection is not None
+        response = connection.execute(
+            f'SELECT * FROM main."{table_name}" WHERE rowid = ?', (row_id,)
+        )
+        row = response.fetchone()
+
+        if row is None:
+            return (
+                replica_connection.execute(
+                    f'DELETE FROM "{table_name}" WHERE rowid = ?', (row_id,)
+                ).rowcount
+                > 0
+            )
+
+        columns = [f'"{column[0]}"' for column in response.description]
+
+        if (
+            replica_connection.execute(
+                f'SELECT 1 FROM "{table_name}" WHERE rowid = ?', (row_id,)
+            ).fetchone()
+            is None
+        ):
+            replica_connection.execute(
+                f'INSERT INTO "{table_name}" (rowid, {", ".join(columns)}) '
+                f"VALUES (?, {', '.join('?' * len(columns))})",
+                (row_id, *row),
+            )
+            return True
+
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        differences = " OR ".join(f"{column} IS NOT ?" for column in columns)
+
+        return (
+            replica_connection.execute(
+                f'UPDATE "{table_name}" SET {assignments} '
+                f"WHERE rowid = ? AND ({differences})",
+                (*row, row_id, *row),
+            ).rowcount
+            > 0
+        )
+
+    def _start_applying(self) -> bool:
+        """Stop new readers and wait until all readers are done.
+
+        Returns:
+            A bool which indicates whether the readers are done in time. If
+            not, new readers are let in again.
+
+        """
+        with self._readers_changed:
+            self._is_applying = True
+
+            if self._readers_changed.wait_for(
+                lambda: self._reader_count == 0, self.REPLICA_LOCK_TIMEOUT
+            ):
+                return True
+
+            self._is_applying = False
+            self._readers_changed.notify_all()
+
+            return False
+
+    def _stop_applying(self) -> None:
+        """Let the waiting readers in again."""
+        with self._readers_changed:
+            self._is_applying = False
+            self._readers_changed.notify_all()
+
+    def _after_commit(self, connection: sqlite3.Connection) -> None:
+        """Apply a committed write to the replica.
+
+        If the database file has also been changed elsewhere or the readers
+        of the replica are not done in time, it is copied into a new
+        generation instead.
+
+        Args:
+            connection: The write connection.
+
+        """
+        try:
+            is_schema_changed = self._update_recording(connection)
+
+            if self._replica_connection is None:
+                return
+
+            if is_schema_changed or self._is_changed_elsewhere(connection):
+                self._copy_replica(connection)
+                return
+
+            if not self._start_applying():
+                self.logger.info("The replica is read for too long, copy it.")
+            else:
+                try:
+                    if self._apply_changes(connection):
+                        return
+
+                    self.logger.info(
+                        "The write did not settle in the replica, copy it."
+                    )
+                except sqlite3.OperationalError as e:
+                    self.logger.info("The replica is locked, copy it: %s", e)
+                finally:
+                    self._stop_applying()
+
+            self._copy_replica(connection)
+        finally:
+            connection.execute("DELETE FROM replica_change")
+
+    def _acquire_read_connection(self) -> sqlite3.Connection:
+        """Take a read connection to the current replica from the pool.
+
+        If the database file has been changed by another process, it is
+        copied into the replica first. While a write is in progress, the
+        current replica is read instead. While a write is applied to the
+        replica, the caller waits until it is applied.
+
+        Returns:
+            A read connection to the replica.
+
+        """
+        if self._write_lock.acquire(blocking=self._replica_connection is None):
+            try:
+                self._ensure_open()
+                connection = self._get_write_connection()
+
+                if self._replica_connection is None or (
+                    self._is_changed_elsewhere(connection)
+                ):
+                    self._copy_replica(connection)
+            finally:
+                self._write_lock.release()
+
+        with self._readers_changed:
+            self._readers_changed.wait_for(lambda: not self._is_applying)
+            self._ensure_open()
+
+            try:
+                connection = self._read_pool.get_nowait()
+            except queue.Empty:
+                connection = self._connect_replica(self._generation)
+                connection.execute("PRAGMA query_only = 1")
+                self._replica_connections.add(connection)
+
+            self._reader_count += 1
+
+        return connection
+
+    def _release_read_connection(self, connection: sqlite3.Connection) -> None:
+        """Return a read connection to the pool or close it.
+
+        Read connections to a previous generation of the replica are closed.
+
+        Args:
+            connection: The returned read connection.
+
+        """
+        with self._readers_changed:
+            if connection in self._replica_connections:
+                self._reader_count -= 1
+                self._readers_changed.notify_all()
+
+            if self._closed or connection not in self._replica_connections:
+                self._replica_connections.discard(connection)
+                connection.close()
+            else:
+                self._read_pool.put(connection)
+
+    def close(self) -> None:
+        """Close all connections and free the replica.
+
+        Read connections which are currently borrowed are closed as soon as
+        they are returned.
+        """
+        if self._closed:
+            return
+
+        super().close()
+
+        with self._write_lock, self._pool_lock:
+            self._replica_connections = set()
+
+            if self._replica_connection is not None:
+                self._replica_connection.close()
+                self._replica_connection = None
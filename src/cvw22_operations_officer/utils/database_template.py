@@ -0,0 +1,155 @@
+# Copyright 2026 Niklas Glienke
+
+import contextlib
+import hashlib
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+from cvw22_operations_officer.utils.migrations import (
+    MIGRATIONS_DIR,
+    get_migrations,
+    migrate,
+)
+
+DATABASE_TEMPLATES_DIR = MIGRATIONS_DIR.parent
+SEED_PATH = DATABASE_TEMPLATES_DIR / "brevity_term.sql"
+TEMPLATE_PATH = DATABASE_TEMPLATES_DIR / "template.db"
+
+logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+
+def get_checksum_path(template_path: Path) -> Path:
+    """Get the path of the file with the source checksum of a template.
+
+    Args:
+        template_path: Path to the template database.
+
+    Returns:
+        The path of the checksum file next to the template.
+
+    """
+    return template_path.with_name(f"{template_path.name}.sha256")
+
+
+def get_source_checksum(
+    migrations_dir: Path = MIGRATIONS_DIR, seed_path: Path = SEED_PATH
+) -> str:
+    """Get the checksum of the SQL sources of the database template.
+
+    Args:
+        migrations_dir: Path to the directory with the migration files.
+        seed_path: Path to the SQL script with the default brevity terms.
+
+    Returns:
+        The SHA-256 of the names and contents of all migrations and the seed
+        script as hex digest.
+
+    """
+    checksum = hashlib.sha256()
+
+    for path in [
+        migration.path for migration in get_migrations(migrations_dir)
+    ] + [seed_path]:
+        checksum.update(path.name.encode("UTF-8") + b"\0")
+        checksum.update(path.read_bytes() + b"\0")
+
+    return checksum.hexdigest()
+
+
+def build_database_template(
+    template_path: Path = TEMPLATE_PATH,
+    migrations_dir: Path = MIGRATIONS_DIR,
+    seed_path: Path = SEED_PATH,
+) -> str:
+    """Build the database template from the SQL sources.
+
+    The schema is migrated to the latest version and seeded with the default
+    brevity terms. The template is analyzed for the query planner and
+    vacuumed into a single compact file. The checksum of the sources is
+    written next to the template.
+
+    Args:
+        template_path: Path to the template database, which is replaced.
+        migrations_dir: Path to the directory with the migration files.
+        seed_path: Path to the SQL script with the default brevity terms.
+
+    Returns:
+        The checksum of the SQL sources.
+
+    """
+    build_path = template_path.with_name(f"{template_path.name}.build")
+    build_path.unlink(missing_ok=True)
+
+    migrate(build_path, migrations_dir)
+
+    with contextlib.closing(
+        sqlite3.connect(build_path, isolation_level=None)
+    ) as connection:
+        connection.executescript(seed_path.read_text(encoding="UTF-8"))
+        connection.execute("ANALYZE")
+        connection.execute("VACUUM")
+
+    checksum = get_source_checksum(migrations_dir, seed_path)
+
+    os.replace(build_path, template_path)
+    get_checksum_path(template_path).write_text(f"{checksum}\n")
+    logger.info("Built the database template %s.", template_path)
+
+    return checksum
+
+
+def restore_database_template(
+    db_path: Path,
+    template_path: Path = TEMPLATE_PATH,
+    migrations_dir: Path = MIGRATIONS_DIR,
+    seed_path: Path = SEED_PATH,
+) -> bool:
+    """Create a new database from the template.
+
+    The template is only used if it has been built from the current SQL
+    sources. It is copied page by page with the backup API into a temporary
+    file, which replaces the database once it is complete.
+
+    Args:
+        db_path: Path to the new database file.
+        template_path: Path to the template database.
+        migrations_dir: Path to the directory with the migration files.
+        seed_path: Path to the SQL script with the default brevity terms.
+
+    Returns:
+        A bool which indicates whether the database has been created from
+        the template.
+
+    """
+    checksum_path = get_checksum_path(template_path)
+
+    try:
+        template_checksum = checksum_path.read_text().strip()
+    except FileNotFoundError:
+        logger.info("No database template found.")
+        return False
+
+    if template_checksum != get_source_checksum(migrations_dir, seed_path):
+        logger.warning("The database template does not match its sources.")
+        return False
+
+    restore_path = db_path.with_name(f"{db_path.name}.restore")
+
+    with (
+        contextlib.closing(
+            sqlite3.connect(f"{template_path.as_uri()}?mode=ro", uri=True)
+        ) as source,
+        contextlib.closing(sqlite3.connect(restore_path)) as destination,
+    ):
+        source.backup(destination)
+
+    os.replace(restore_path, db_path)
+    logger.info("Created the database from the template.")
+
+    return True
+
+
+if __name__ == "__main__":  # pragma: no cover
+    print(f"Built the template from sources {build_database_template()}.")
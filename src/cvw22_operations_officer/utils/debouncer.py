@@ -0,0 +1,65 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+from collections.abc import Hashable
+
+
+class Debouncer[K: Hashable]:
+    """Let only the latest of rapid successive calls of a key through.
+
+    Every call waits for the delay. A call which is followed by another call
+    of the same key within the delay is superseded, so only the last call of
+    a burst does the actual work.
+    """
+
+    def __init__(self, delay: float) -> None:
+        """Initialize without pending calls.
+
+        Args:
+            delay: Seconds a call waits for a following call.
+
+        """
+        self.DELAY = delay
+        self._latest_calls: dict[K, object] = {}
+        self._superseded_calls = 0
+
+    @property
+    def superseded_calls(self) -> int:
+        """Number of calls which have been superseded by a later call."""
+        return self._superseded_calls
+
+    def __len__(self) -> int:
+        """Get the number of keys with a pending call.
+
+        Returns:
+            The number of keys with a pending call.
+
+        """
+        return len(self._latest_calls)
+
+    async def wait(self, key: K) -> bool:
+        """Wait for the delay and check whether the call is still the latest.
+
+        Args:
+            key: The key of successive calls, e.g. the ID of a user.
+
+        Returns:
+            A bool which indicates whether no later call of the key has been
+            made within the delay.
+
+        """
+        call = object()
+        self._latest_calls[key] = call
+
+        try:
+            await asyncio.sleep(self.DELAY)
+        finally:
+            is_latest = self._latest_calls.get(key) is call
+
+            if is_latest:
+                del self._latest_calls[key]
+
+        if not is_latest:
+            self._superseded_calls += 1
+
+        return is_latest
@@ -0,0 +1,187 @@
+# Copyright 2026 Niklas Glienke
+
+import atexit
+import datetime
+import json
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+
+DEFAULT_RATE_LIMIT = 20
+DEFAULT_RATE_LIMIT_PERIOD_SECONDS = 60.0
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record as JSON.
+
+        Args:
+            record: The log record to format.
+
+        Returns:
+            The log record as a single line of JSON.
+
+        """
+        entry = {
+            "time": datetime.datetime.fromtimestamp(
+                record.created, datetime.UTC
+            ).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+
+        suppressed = getattr(record, "suppressed", 0)
+
+        if suppressed:
+            entry["suppressed"] = suppressed
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop log records of a call site which logs too often.
+
+    Every call site may log a number of records per period. Further records
+    of the call site are dropped until the period ends, and the first record
+    of the next period carries the number of dropped records in its
+    "suppressed" attribute. Errors are never dropped.
+    """
+
+    def __init__(
+        self,
+        rate: int = DEFAULT_RATE_LIMIT,
+        period_seconds: float = DEFAULT_RATE_LIMIT_PERIOD_SECONDS,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            rate: Maximum number of records of a call site per period.
+            period_seconds: Length of a period in seconds.
+            timer: Function which returns the current time in seconds.
+
+        """
+        super().__init__()
+        self.RATE = rate
+        self.PERIOD_SECONDS = period_seconds
+
+        self._timer = timer
+        self._lock = threading.Lock()
+        # Per call site: the start of its period, its records in the period
+        # and its dropped records in the period.
+        self._call_sites: dict[tuple[str, int], list[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check whether a log record is within the rate of its call site.
+
+        Args:
+            record: The log record to check.
+
+        Returns:
+            A bool which indicates whether the record is logged.
+
+        """
+        record.suppressed = 0
+
+        if record.levelno >= logging.ERROR:
+            return True
+
+        now = self._timer()
+        key = (record.pathname, record.lineno)
+
+        with self._lock:
+            call_site = self._call_sites.get(key)
+
+            if call_site is None or now - call_site[0] >= self.PERIOD_SECONDS:
+                record.suppressed = 0 if call_site is None else call_site[2]
+                self._call_sites[key] = [now, 1, 0]
+                return True
+            elif call_site[1] < self.RATE:
+                call_site[1] += 1
+                return True
+
+            call_site[2] += 1
+
+            return False
+
+
+class SuppressedFormatter(logging.Formatter):
+    """Format log records and note the number of suppressed records."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record.
+
+        Args:
+            record: The log record to format.
+
+        Returns:
+            The formatted log record.
+
+        """
+        message = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+
+        if suppressed:
+            message += f" ({suppressed} similar messages suppressed)"
+
+        return message
+
+
+class StoppableQueueListener(QueueListener):
+    """A queue listener which can be stopped more than once."""
+
+    def stop(self) -> None:
+        """Write all queued records and stop the background thread."""
+        if self._thread is not None:
+            super().stop()
+
+
+def start_queue_logging(
+    logger: logging.Logger,
+    handler: logging.Handler,
+    rate_limit_filter: RateLimitFilter | None = None,
+) -> StoppableQueueListener:
+    """Log through a queue, which is written by a background thread.
+
+    The logger only puts the records into an unbounded queue, so logging
+    never blocks the event loop on disk I/O. The handler is called by a
+    background thread, which is stopped and flushed when the interpreter
+    exits.
+
+    Args:
+        logger: The logger to log through the queue.
+        handler: The handler which writes the records.
+        rate_limit_filter: An optional filter which drops records of noisy
+            call sites before they are queued.
+
+    Returns:
+        The started listener, which writes the queued records.
+
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+
+    if rate_limit_filter is not None:
+        queue_handler.addFilter(rate_limit_filter)
+
+    listener = StoppableQueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(queue_handler)
+
+    return listener
@@ -0,0 +1,673 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import bisect
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+MAX_REQUEST_HEADERS = 100
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format.
+
+    Args:
+        value: The value to format.
+
+    Returns:
+        The formatted value.
+
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    elif math.isnan(value):
+        return "NaN"
+
+    return repr(float(value))
+
+
+def _format_labels(
+    label_names: tuple[str, ...], label_values: tuple[str, ...]
+) -> str:
+    """Format the labels of a sample for the text exposition format.
+
+    Args:
+        label_names: The names of the labels.
+        label_values: The values of the labels.
+
+    Returns:
+        The formatted labels including the braces, or an empty str without
+        labels.
+
+    """
+    if not label_names:
+        return ""
+
+    labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    )
+
+    return f"{{{labels}}}"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the text exposition format.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The escaped label value.
+
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    """Base of all metrics with optional labels.
+
+    Samples are only touched under a lock, so metrics can be updated from the
+    event loop and the thread pool at the same time. An update is a single
+    dict lookup, which keeps the metrics cheap enough for the hot path.
+    """
+
+    TYPE = ""
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...]
+    ) -> None:
+        """Initialize the metric without any samples.
+
+        Args:
+            name: The name of the metric.
+            documentation: The help text of the metric.
+            label_names: The names of the labels of the metric.
+
+        """
+        self.NAME = name
+        self.DOCUMENTATION = documentation
+        self.LABEL_NAMES = label_names
+
+        self._lock = threading.Lock()
+
+    def _check_label_values(self, label_values: tuple[str, ...]) -> None:
+        """Check that a value is given for every label.
+
+        Args:
+            label_values: The values of the labels.
+
+        Raises:
+            ValueError: If the number of values does not match the labels.
+
+        """
+        if len(label_values) != len(self.LABEL_NAMES):
+            raise ValueError(
+                f"'{self.NAME}' expects the labels {self.LABEL_NAMES}, "
+                f"but got {label_values}."
+            )
+
+    @property
+    def family_name(self) -> str:
+        """The name of the metric in the help text and type."""
+        return self.NAME
+
+    def collect(self) -> Iterator[str]:
+        """Render the samples of the metric.
+
+        Yields:
+            Each line of the samples in the text exposition format.
+
+        """
+        yield from ()
+
+    def render(self) -> str:
+        """Render the metric with its help text and type.
+
+        Returns:
+            The metric in the text exposition format.
+
+        """
+        lines = [
+            f"# HELP {self.family_name} {self.DOCUMENTATION}",
+            f"# TYPE {self.family_name} {self.TYPE}",
+            *self.collect(),
+        ]
+
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Count events which only ever increase.
+
+    Instead of being increased, a counter can also be computed by a function
+    whenever the metrics are rendered, e.g. from a total which is already
+    counted elsewhere.
+    """
+
+    TYPE = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...]
+    ) -> None:
+        """Initialize the counter without any samples.
+
+        Args:
+            name: The name of the counter.
+            documentation: The help text of the counter.
+            label_names: The names of the labels of the counter.
+
+        """
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    @property
+    def family_name(self) -> str:
+        """The name of the counter in the help text and type."""
+        return f"{self.NAME}_total"
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            *label_values: The values of the labels.
+            amount: The non-negative amount to add.
+
+        Raises:
+            ValueError: If the amount is negative.
+
+        """
+        if amount < 0:
+            raise ValueError("A counter can only be increased.")
+
+        self._check_label_values(label_values)
+
+        with self._lock:
+            self._values[label_values] = (
+                self._values.get(label_values, 0.0) + amount
+            )
+
+    def set_function(
+        self, function: Callable[[], float], *label_values: str
+    ) -> None:
+        """Compute the counter by a function whenever it is rendered.
+
+        Args:
+            function: The function which returns the current total, which
+                must never decrease.
+            *label_values: The values of the labels.
+
+        """
+        self._check_label_values(label_values)
+
+        with self._lock:
+            self._functions[label_values] = function
+
+    def get(self, *label_values: str) -> float:
+        """Get the current value of the counter.
+
+        Args:
+            *label_values: The values of the labels.
+
+        Returns:
+            The current value.
+
+        """
+        with self._lock:
+            function = self._functions.get(label_values)
+            value = self._values.get(label_values, 0.0)
+
+        return function() if function is not None else value
+
+    def collect(self) -> Iterator[str]:
+        """Render the samples of the counter.
+
+        Yields:
+            Each line of the samples in the text exposition format.
+
+        """
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+
+        for label_values, function in functions.items():
+            values[label_values] = function()
+
+        for label_values, value in sorted(values.items()):
+            labels = _format_labels(self.LABEL_NAMES, label_values)
+            yield f"{self.NAME}_total{labels} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Represent a value which can go up and down.
+
+    Instead of being set, a gauge can also be computed by a function whenever
+    the metrics are rendered, which costs nothing on the hot path.
+    """
+
+    TYPE = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...]
+    ) -> None:
+        """Initialize the gauge without any samples.
+
+        Args:
+            name: The name of the gauge.
+            documentation: The help text of the gauge.
+            label_names: The names of the labels of the gauge.
+
+        """
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, *label_values: str) -> None:
+        """Set the gauge to a value.
+
+        Args:
+            value: The new value.
+            *label_values: The values of the labels.
+
+        """
+        self._check_label_values(label_values)
+
+        with self._lock:
+            self._values[label_values] = value
+
+    def set_function(
+        self, function: Callable[[], float], *label_values: str
+    ) -> None:
+        """Compute the gauge by a function whenever it is rendered.
+
+        Args:
+            function: The function which returns the current value.
+            *label_values: The values of the labels.
+
+        """
+        self._check_label_values(label_values)
+
+        with self._lock:
+            self._functions[label_values] = function
+
+    def get(self, *label_values: str) -> float:
+        """Get the current value of the gauge.
+
+        Args:
+            *label_values: The values of the labels.
+
+        Returns:
+            The current value.
+
+        """
+        with self._lock:
+            function = self._functions.get(label_values)
+            value = self._values.get(label_values, 0.0)
+
+        return function() if function is not None else value
+
+    def collect(self) -> Iterator[str]:
+        """Render the samples of the gauge.
+
+        Yields:
+            Each line of the samples in the text exposition format.
+
+        """
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+
+        for label_values, function in functions.items():
+            values[label_values] = function()
+
+        for label_values, value in sorted(values.items()):
+            labels = _format_labels(self.LABEL_NAMES, label_values)
+            yield f"{self.NAME}{labels} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Count observed values, such as durations, in cumulative buckets."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram without any samples.
+
+        Args:
+            name: The name of the histogram.
+            documentation: The help text of the histogram.
+            label_names: The names of the labels of the histogram.
+            buckets: The sorted upper bounds of the buckets.
+
+        Raises:
+            ValueError: If the buckets are not sorted.
+
+        """
+        if list(buckets) != sorted(buckets):
+            raise ValueError("The buckets must be sorted.")
+
+        super().__init__(name, documentation, label_names)
+        self.BUCKETS = buckets
+
+        # Per label values: the count of every bucket, then +Inf, then sum.
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Count a value in its bucket.
+
+        Args:
+            value: The observed value.
+            *label_values: The values of the labels.
+
+        """
+        self._check_label_values(label_values)
+        index = bisect.bisect_left(self.BUCKETS, value)
+
+        with self._lock:
+            counts = self._values.get(label_values)
+
+            if counts is None:
+                counts = [0.0] * (len(self.BUCKETS) + 2)
+                self._values[label_values] = counts
+
+            counts[index] += 1
+            counts[-1] += value
+
+    @contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        """Observe the duration of a block in seconds.
+
+        Args:
+            *label_values: The values of the labels.
+
+        Yields:
+            Nothing, the block is timed until it is left.
+
+        """
+        started_at = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, *label_values)
+
+    def get_count(self, *label_values: str) -> int:
+        """Get the number of observed values.
+
+        Args:
+            *label_values: The values of the labels.
+
+        Returns:
+            The number of observed values.
+
+        """
+        with self._lock:
+            counts = self._values.get(label_values)
+
+            return 0 if counts is None else int(sum(counts[:-1]))
+
+    def collect(self) -> Iterator[str]:
+        """Render the samples of the histogram.
+
+        Yields:
+            Each line of the samples in the text exposition format.
+
+        """
+        with self._lock:
+            values = sorted(
+                (label_values, list(counts))
+                for label_values, counts in self._values.items()
+            )
+
+        label_names = (*self.LABEL_NAMES, "le")
+
+        for label_values, counts in values:
+            cumulative_count = 0.0
+
+            for bound, count in zip((*self.BUCKETS, math.inf), counts):
+                cumulative_count += count
+                labels = _format_labels(
+                    label_names, (*label_values, _format_value(bound))
+                )
+                yield (
+                    f"{self.NAME}_bucket{labels} "
+                    f"{_format_value(cumulative_count)}"
+                )
+
+            labels = _format_labels(self.LABEL_NAMES, label_values)
+            yield f"{self.NAME}_sum{labels} {_format_value(counts[-1])}"
+            yield (
+                f"{self.NAME}_count{labels} {_format_value(cumulative_count)}"
+            )
+
+
+class MetricsRegistry:
+    """Hold all metrics of the bot and render them for Prometheus."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register[M: _Metric](
+        self, metric_type: type[M], name: str, *args: object
+    ) -> M:
+        """Get a registered metric or register a new one.
+
+        Args:
+            metric_type: The type of the metric.
+            name: The name of the metric.
+            *args: Any arguments to create the metric.
+
+        Returns:
+            The registered metric.
+
+        Raises:
+            ValueError: If a metric of another type or with other labels is
+                registered with the same name.
+
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+
+            if metric is None:
+                metric = metric_type(name, *args)  # type: ignore[arg-type]
+                self._metrics[name] = metric
+            elif type(metric) is not metric_type or (
+                metric.LABEL_NAMES != args[1]
+            ):
+                raise ValueError(
+                    f"Metric '{name}' is already registered differently."
+                )
+
+            return metric  # type: ignore[return-value]
+
+    def counter(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        """Get or register a counter.
+
+        Args:
+            name: The name of the counter, without the "_total" suffix.
+            documentation: The help text of the counter.
+            label_names: The names of the labels of the counter.
+
+        Returns:
+            The registered counter.
+
+        """
+        return self._register(Counter, name, documentation, label_names)
+
+    def gauge(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Gauge:
+        """Get or register a gauge.
+
+        Args:
+            name: The name of the gauge.
+            documentation: The help text of the gauge.
+            label_names: The names of the labels of the gauge.
+
+        Returns:
+            The registered gauge.
+
+        """
+        return self._register(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or register a histogram.
+
+        Args:
+            name: The name of the histogram.
+            documentation: The help text of the histogram.
+            label_names: The names of the labels of the histogram.
+            buckets: The sorted upper bounds of the buckets.
+
+        Returns:
+            The registered histogram.
+
+        """
+        return self._register(
+            Histogram, name, documentation, label_names, buckets
+        )
+
+    def render(self) -> str:
+        """Render all metrics ordered by their name.
+
+        Returns:
+            All metrics in the Prometheus text exposition format.
+
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+
+        return "".join(metric.render() for _, metric in metrics)
+
+
+class MetricsServer:
+    """Serve the metrics of a registry on a local HTTP /metrics endpoint.
+
+    The server is a minimal HTTP/1.0 server on the event loop, so it needs
+    neither a thread nor a web framework.
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, host: str, port: int
+    ) -> None:
+        """Initialize the server without starting it.
+
+        Args:
+            registry: The registry to serve.
+            host: The host to listen on.
+            port: The port to listen on.
+
+        """
+        self.HOST = host
+        self.PORT = port
+        self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+        self._registry = registry
+        self._server: asyncio.Server | None = None
+
+    @property
+    def sockets(self) -> tuple:
+        """The listening sockets of the server."""
+        return () if self._server is None else self._server.sockets
+
+    async def start(self) -> None:
+        """Start listening for requests."""
+        self._server = await asyncio.start_server(
+            self._handle, self.HOST, self.PORT
+        )
+        self.logger.info(
+            "Serve metrics on http://%s:%d/metrics.", self.HOST, self.PORT
+        )
+
+    async def stop(self) -> None:
+        """Stop listening for requests."""
+        if self._server is None:
+            return
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer a single HTTP request.
+
+        Args:
+            reader: The stream of the request.
+            writer: The stream of the response.
+
+        """
+        try:
+            request_line = await reader.readline()
+
+            for _ in range(MAX_REQUEST_HEADERS):
+                if await reader.readline() in (b"\r\n", b"\n", b""):
+                    break
+
+            method, path, *_ = (
+                *request_line.decode("latin-1").split(),
+                "",
+                "",
+            )
+
+            if method != "GET":
+                status, body = "405 Method Not Allowed", "Method Not Allowed\n"
+            elif path.split("?", 1)[0] != "/metrics":
+                status, body = "404 Not Found", "Not Found\n"
+            else:
+                status, body = "200 OK", self._registry.render()
+
+            payload = body.encode("UTF-8")
+            writer.write(
+                (
+                    f"HTTP/1.0 {status}\r\n"
+                    f"Content-Type: {CONTENT_TYPE}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+                + payload
+            )
+            await writer.drain()
+        except ConnectionError:  # pragma: no cover
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,165 @@
+# Copyright 2026 Niklas Glienke
+
+import logging
+import re
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+MIGRATIONS_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "config_templates"
+    / "database"
+    / "migrations"
+)
+MIGRATION_FILE_PATTERN = re.compile(r"(\d+)_\w+\.sql")
+
+logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+
+class Migration(NamedTuple):
+    """Represent a SQL script which upgrades the schema by one version."""
+
+    version: int
+    path: Path
+
+
+def get_migrations(migrations_dir: Path = MIGRATIONS_DIR) -> list[Migration]:
+    """Get all migrations of a directory ordered by their version.
+
+    Migration files are named "<version>_<name>.sql", and the versions have
+    to start at 1 without any gaps.
+
+    Args:
+        migrations_dir: Path to the directory with the migration files.
+
+    Returns:
+        A list of all migrations ordered by their version.
+
+    Raises:
+        ValueError: If the versions do not start at 1 or have gaps.
+
+    """
+    migrations = sorted(
+        Migration(int(match.group(1)), path)
+        for path in migrations_dir.iterdir()
+        if (match := MIGRATION_FILE_PATTERN.fullmatch(path.name))
+    )
+
+    for expected_version, migration in enumerate(migrations, 1):
+        if migration.version != expected_version:
+            raise ValueError(
+                f"Expected migration version {expected_version}, "
+                f"but found {migration.path.name}."
+            )
+
+    return migrations
+
+
+def _log_brevity_term_duplicates(connection: sqlite3.Connection) -> None:
+    """Warn about the duplicate terms which were moved aside.
+
+    Args:
+        connection: An open connection to the migrated database.
+
+    """
+    duplicates = connection.execute(
+        "SELECT brevity_term_duplicate.term, brevity_term.term "
+        "FROM brevity_term_duplicate JOIN brevity_term "
+        "ON brevity_term.brevity_term_id "
+        "= brevity_term_duplicate.kept_brevity_term_id "
+        "ORDER BY brevity_term_duplicate.brevity_term_id"
+    ).fetchall()
+
+    for duplicate_term, kept_term in duplicates:
+        logger.warning(
+            "Moved the duplicate brevity term '%s' of '%s' into the "
+            "brevity_term_duplicate table.",
+            duplicate_term,
+            kept_term,
+        )
+
+
+# Functions which report on the outcome of a migration, by its file name.
+MIGRATION_REPORTS: dict[str, Callable[[sqlite3.Connection], None]] = {
+    "0002_brevity_term_search.sql": _log_brevity_term_duplicates,
+}
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Get the schema version of a database.
+
+    Args:
+        connection: An open connection to the database.
+
+    Returns:
+        The schema version, which is 0 for an unversioned database.
+
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db_path: Path, migrations_dir: Path = MIGRATIONS_DIR) -> int:
+    """Upgrade the schema of a database to the latest version.
+
+    Every pending migration is applied in its own transaction together with
+    the new schema version, so a failing migration leaves the database at the
+    previous version. A database which is already current is only checked
+    with a single pragma.
+
+    Args:
+        db_path: Path to the sqlite database file, which is created if it does
+            not exist.
+        migrations_dir: Path to the directory with the migration files.
+
+    Returns:
+        The schema version of the database after the upgrade.
+
+    Raises:
+        RuntimeError: If the database has a newer schema version than the
+            latest migration.
+
+    """
+    migrations = get_migrations(migrations_dir)
+    latest_version = len(migrations)
+    connection = sqlite3.connect(db_path, isolation_level=None)
+
+    try:
+        version = get_schema_version(connection)
+
+        if version > latest_version:
+            raise RuntimeError(
+                f"Database schema version {version} is newer than the "
+                f"latest supported version {latest_version}."
+            )
+
+        for migration in migrations[version:]:
+            logger.info(
+                "Migrate the database to version %d with %s.",
+                migration.version,
+                migration.path.name,
+            )
+
+            try:
+                connection.executescript(
+                    "BEGIN IMMEDIATE;\n"
+                    f"{migration.path.read_text(encoding='UTF-8')}\n"
+                    f"PRAGMA user_version = {migration.version};\n"
+                    "COMMIT;"
+                )
+            except sqlite3.Error:
+                if connection.in_transaction:
+                    connection.rollback()
+
+                raise
+
+            version = migration.version
+            report = MIGRATION_REPORTS.get(migration.path.name)
+
+            if report is not None:
+                report(connection)
+    finally:
+        connection.close()
+
+    return version
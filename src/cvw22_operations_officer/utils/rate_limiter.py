@@ -0,0 +1,88 @@
+# Copyright 2026 Niklas Glienke
+
+from typing import Any
+
+from discord.ext import commands
+
+from cvw22_operations_officer.models.config_model import RateLimitsConfig
+
+BUCKET_TYPES = {
+    "user": commands.BucketType.user,
+    "channel": commands.BucketType.channel,
+    "guild": commands.BucketType.guild,
+}
+
+
+class RateLimitExceeded(commands.CheckFailure):
+    """Represent a command which has been rejected by a rate limit."""
+
+    def __init__(self, scope: str, retry_after: float, is_first: bool) -> None:
+        """Initialize the error.
+
+        Args:
+            scope: The scope whose rate limit rejected the command.
+            retry_after: Seconds until the scope allows commands again.
+            is_first: Whether this is the first rejection of the scope within
+                its period.
+
+        """
+        super().__init__(
+            f"Rate limit of the {scope} exceeded, "
+            f"retry after {retry_after:.1f} seconds."
+        )
+        self.scope = scope
+        self.retry_after = retry_after
+        self.is_first = is_first
+
+
+class CommandRateLimiter:
+    """Limit the commands of every user, channel and guild.
+
+    Every scope has its own buckets, which allow a number of commands per
+    period. A command is rejected by the first scope whose bucket is
+    exhausted.
+    """
+
+    def __init__(self, config: RateLimitsConfig) -> None:
+        """Initialize the buckets of all limited scopes.
+
+        Args:
+            config: The rate limits of every scope.
+
+        """
+        self.config = config
+        self._cooldowns: dict[str, commands.CooldownMapping] = {}
+        # Allow one notice about a rejection per bucket and period.
+        self._notices: dict[str, commands.CooldownMapping] = {}
+
+        for scope, bucket_type in BUCKET_TYPES.items():
+            rate_limit = getattr(config, scope)
+
+            if rate_limit is None:
+                continue
+
+            self._cooldowns[scope] = commands.CooldownMapping.from_cooldown(
+                rate_limit.rate, rate_limit.per_seconds, bucket_type
+            )
+            self._notices[scope] = commands.CooldownMapping.from_cooldown(
+                1, rate_limit.per_seconds, bucket_type
+            )
+
+    def check(self, message: Any) -> None:
+        """Take a token for a command from the buckets of its scopes.
+
+        Args:
+            message: The discord message which invoked the command.
+
+        Raises:
+            RateLimitExceeded: If the bucket of a scope is exhausted.
+
+        """
+        for scope, cooldown in self._cooldowns.items():
+            retry_after = cooldown.update_rate_limit(message)
+
+            if retry_after is not None:
+                is_first = (
+                    self._notices[scope].update_rate_limit(message) is None
+                )
+                raise RateLimitExceeded(scope, retry_after, is_first)
@@ -0,0 +1,253 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import datetime
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+DEFAULT_CATCH_UP_WINDOW = datetime.timedelta(hours=1)
+MAX_SLEEP_SECONDS = 3600.0
+
+
+def utc_now() -> datetime.datetime:
+    """Get the current time.
+
+    Returns:
+        The current time as an aware datetime in UTC.
+
+    """
+    return datetime.datetime.now(datetime.UTC)
+
+
+def get_next_run_time(
+    at: datetime.time,
+    timezone: datetime.tzinfo,
+    after: datetime.datetime,
+) -> datetime.datetime:
+    """Get the next time a daily schedule is due.
+
+    The local time is resolved in the given timezone on every day, so daylight
+    saving time changes are taken into account. A local time which does not
+    exist on a day is resolved with the offset before the change, and a local
+    time which exists twice on a day is only due at its first occurrence.
+
+    Args:
+        at: The local time of day the schedule is due.
+        timezone: The timezone of the local time.
+        after: The aware datetime after which the schedule is due.
+
+    Returns:
+        The next due time as an aware datetime in UTC.
+
+    """
+    run_date = after.astimezone(timezone).date()
+
+    while True:
+        run_time = datetime.datetime.combine(
+            run_date, at, tzinfo=timezone
+        ).astimezone(datetime.UTC)
+
+        if run_time > after:
+            return run_time
+
+        run_date += datetime.timedelta(days=1)
+
+
+@dataclass
+class ScheduledJob:
+    """Represent a callback which is due at a local time every day."""
+
+    name: str
+    at: datetime.time
+    timezone: datetime.tzinfo
+    callback: Callable[[], Awaitable[None]]
+    next_run: datetime.datetime
+
+
+class Scheduler:
+    """Run callbacks at local times of day.
+
+    Instead of polling, the scheduler sleeps until the next job is due. The
+    sleep is interrupted whenever a job is scheduled or unscheduled, so the due
+    times are recomputed at once. A job which is due while the event loop was
+    blocked or the host was suspended is still run, as long as it is not later
+    than the catch-up window. If several schedulers run the same jobs, e.g.
+    in multiple processes, a claim decides which of them runs a due job.
+    """
+
+    def __init__(
+        self,
+        catch_up_window: datetime.timedelta = DEFAULT_CATCH_UP_WINDOW,
+        clock: Callable[[], datetime.datetime] = utc_now,
+        claim: Callable[[str, datetime.datetime], Awaitable[bool]]
+        | None = None,
+    ) -> None:
+        """Initialize the scheduler without any jobs.
+
+        Args:
+            catch_up_window: Maximum delay of a job which is still run.
+            clock: Function which returns the current time as an aware
+                datetime.
+            claim: Optional coroutine function which is called with the name
+                and due time of a due job and returns whether this scheduler
+                may run it.
+
+        """
+        self.CATCH_UP_WINDOW = catch_up_window
+        self.logger = logging.getLogger(f"cvw22_operations_officer.{__name__}")
+
+        self._clock = clock
+        self._claim = claim
+        self._jobs: dict[str, ScheduledJob] = {}
+        self._running_jobs: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def jobs(self) -> dict[str, ScheduledJob]:
+        """A copy of all scheduled jobs by their name."""
+        return dict(self._jobs)
+
+    def schedule(
+        self,
+        name: str,
+        at: datetime.time,
+        timezone: datetime.tzinfo,
+        callback: Callable[[], Awaitable[None]],
+    ) -> ScheduledJob:
+        """Schedule a callback every day at a local time.
+
+        A job with the same name is replaced.
+
+        Args:
+            name: The unique name of the job.
+            at: The local time of day the callback is due.
+            timezone: The timezone of the local time.
+            callback: The coroutine function to call.
+
+        Returns:
+            The scheduled job.
+
+        """
+        job = ScheduledJob(
+            name,
+            at,
+            timezone,
+            callback,
+            get_next_run_time(at, timezone, self._clock()),
+        )
+        self._jobs[name] = job
+        self._wakeup.set()
+
+        self.logger.info("Scheduled '%s' for %s.", name, job.next_run)
+
+        return job
+
+    def unschedule(self, name: str) -> None:
+        """Remove a job if it is scheduled.
+
+        Args:
+            name: The name of the job.
+
+        """
+        if self._jobs.pop(name, None) is not None:
+            self._wakeup.set()
+            self.logger.info("Unscheduled '%s'.", name)
+
+    def is_running(self) -> bool:
+        """Check if the scheduler is running.
+
+        Returns:
+            A bool which indicates whether the scheduler is running.
+
+        """
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the scheduler in the running event loop."""
+        if self.is_running():
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler and cancel all running jobs."""
+        tasks = list(self._running_jobs)
+
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Sleep until the next job is due and run it."""
+        while True:
+            self._wakeup.clear()
+
+            if self._jobs:
+                next_run = min(job.next_run for job in self._jobs.values())
+                delay = (next_run - self._clock()).total_seconds()
+            else:
+                delay = MAX_SLEEP_SECONDS
+
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), min(delay, MAX_SLEEP_SECONDS)
+                    )
+                    continue
+                except TimeoutError:
+                    pass
+
+            self._run_due_jobs()
+
+    def _run_due_jobs(self) -> None:
+        """Start all due jobs and compute their next due time."""
+        now = self._clock()
+
+        for job in list(self._jobs.values()):
+            if job.next_run > now:
+                continue
+
+            delay = now - job.next_run
+
+            if delay > self.CATCH_UP_WINDOW:
+                self.logger.warning(
+                    "Skipped '%s', which was due at %s.",
+                    job.name,
+                    job.next_run,
+                )
+            else:
+                task = asyncio.create_task(self._run_job(job, job.next_run))
+                self._running_jobs.add(task)
+                task.add_done_callback(self._running_jobs.discard)
+
+            job.next_run = get_next_run_time(job.at, job.timezone, now)
+
+    async def _run_job(
+        self, job: ScheduledJob, due_at: datetime.datetime | None = None
+    ) -> None:
+        """Run a job if it can be claimed and log any exception it raises.
+
+        Args:
+            job: The job to run.
+            due_at: The due time of the run, which defaults to the next run
+                of the job.
+
+        """
+        try:
+            if self._claim is not None and not await self._claim(
+                job.name, job.next_run if due_at is None else due_at
+            ):
+                self.logger.info("Skipped '%s', claimed elsewhere.", job.name)
+                return
+
+            self.logger.info("Run '%s'.", job.name)
+            await job.callback()
+        except Exception:
+            self.logger.exception("'%s' raised an exception.", job.name)
@@ -0,0 +1,57 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[K: Hashable, V]:
+    """Share one call between all identical concurrent calls.
+
+    While a call of a key is in flight, further calls of the same key wait
+    for its result instead of starting their own call. The key is released
+    once the call completes, so later calls start a new one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without calls in flight."""
+        self._calls: dict[K, asyncio.Future[V]] = {}
+        self._shared_calls = 0
+
+    @property
+    def shared_calls(self) -> int:
+        """Number of calls which waited for a call in flight."""
+        return self._shared_calls
+
+    def __len__(self) -> int:
+        """Get the number of calls in flight.
+
+        Returns:
+            The number of calls in flight.
+
+        """
+        return len(self._calls)
+
+    async def run(self, key: K, function: Callable[[], Awaitable[V]]) -> V:
+        """Run a function once for all concurrent calls of a key.
+
+        A cancelled caller does not cancel the call, which may still be
+        awaited by other callers.
+
+        Args:
+            key: The key of identical calls.
+            function: The function which starts the call.
+
+        Returns:
+            The result of the call.
+
+        """
+        call = self._calls.get(key)
+
+        if call is None:
+            call = asyncio.ensure_future(function())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self._shared_calls += 1
+
+        return await asyncio.shield(call)
@@ -0,0 +1,88 @@
+# Copyright 2026 Niklas Glienke
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
+
+
+class StartupPhase(NamedTuple):
+    """Represent a finished phase of the startup."""
+
+    name: str
+    started_at: float
+    duration: float
+
+
+class StartupProfile:
+    """Record the timeline of the startup of the bot.
+
+    Phases are measured relative to the creation of the profile, so the
+    report shows when each phase started, how long it took and the gaps in
+    between.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Start the timeline.
+
+        Args:
+            clock: Function which returns a monotonic time in seconds.
+
+        """
+        self._clock = clock
+        self._started_at = clock()
+        self.phases: list[StartupPhase] = []
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the timeline started."""
+        return self._clock() - self._started_at
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure a phase of the startup.
+
+        Args:
+            name: The name of the phase.
+
+        Yields:
+            Nothing, the phase lasts until the block exits.
+
+        """
+        started_at = self.elapsed
+
+        try:
+            yield
+        finally:
+            self.phases.append(
+                StartupPhase(name, started_at, self.elapsed - started_at)
+            )
+
+    def mark(self, name: str) -> None:
+        """Record a point in time of the startup as a phase without duration.
+
+        Args:
+            name: The name of the point in time.
+
+        """
+        self.phases.append(StartupPhase(name, self.elapsed, 0.0))
+
+    def report(self) -> str:
+        """Render the timeline as a table.
+
+        Returns:
+            One line per phase with its start and duration in milliseconds,
+            ordered by the start.
+
+        """
+        lines = [f"{'phase':<28} {'start ms':>10} {'duration ms':>12}"]
+
+        for name, started_at, duration in sorted(
+            self.phases, key=lambda phase: phase.started_at
+        ):
+            lines.append(
+                f"{name:<28} {started_at * 1000:>10.1f} "
+                f"{duration * 1000:>12.1f}"
+            )
+
+        return "\n".join(lines)
@@ -0,0 +1,136 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.services.async_brevity_term_service import (
+    AsyncBrevityTermService,
+)
+from cvw22_operations_officer.services.brevity_term_index import SearchCursor
+from cvw22_operations_officer.services.brevity_term_service import SearchPage
+from cvw22_operations_officer.utils.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def mock_service():
+    mock_service = MagicMock()
+    mock_service.metrics = MetricsRegistry()
+
+    return mock_service
+
+
+@pytest.mark.asyncio
+async def test_get_brevity_terms_by_term(mock_service):
+    main_thread = threading.get_ident()
+    calling_threads: list[int] = []
+
+    def get_brevity_terms_by_term(term, limit):
+        calling_threads.append(threading.get_ident())
+        return [BrevityTerm(term, "DESCRIPTION 1")][:limit]
+
+    mock_service.get_brevity_terms_by_term.side_effect = (
+        get_brevity_terms_by_term
+    )
+    async_service = AsyncBrevityTermService(mock_service)
+
+    result = await async_service.get_brevity_terms_by_term("TERM 1", 1)
+
+    await async_service.close()
+
+    assert result == [BrevityTerm("TERM 1", "DESCRIPTION 1")]
+    assert calling_threads[0] != main_thread
+    assert (
+        mock_service.metrics.histogram(
+            "brevity_term_service_call_duration_seconds", "", ("method",)
+        ).get_count("get_brevity_terms_by_term")
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_brevity_term_for_digest(mock_service):
+    mock_service.get_brevity_term_for_digest.return_value = BrevityTerm(
+        "TERM 1", "DESCRIPTION 1"
+    )
+    async_service = AsyncBrevityTermService(mock_service)
+
+    result = await async_service.get_brevity_term_for_digest()
+
+    await async_service.close()
+
+    assert result == BrevityTerm("TERM 1", "DESCRIPTION 1")
+
+
+@pytest.mark.asyncio
+async def test_exception_is_propagated(mock_service):
+    mock_service.get_brevity_term_for_digest.side_effect = RuntimeError(
+        "Test Error."
+    )
+    async_service = AsyncBrevityTermService(mock_service)
+
+    with pytest.raises(RuntimeError):
+        await async_service.get_brevity_term_for_digest()
+
+    await async_service.close()
+
+
+@pytest.mark.asyncio
+async def test_search_brevity_terms(mock_service):
+    cursor = SearchCursor(1, 0.0, "TERM 1")
+    page = SearchPage([], False)
+    mock_service.search_brevity_terms.return_value = page
+    async_service = AsyncBrevityTermService(mock_service)
+
+    result = await async_service.search_brevity_terms("TERM", 2, cursor)
+
+    await async_service.close()
+
+    assert result is page
+    mock_service.search_brevity_terms.assert_called_once_with(
+        "TERM", 2, cursor
+    )
+
+
+@pytest.mark.asyncio
+async def test_reload_if_changed(mock_service):
+    mock_service.reload_if_changed.return_value = True
+    async_service = AsyncBrevityTermService(mock_service)
+
+    assert await async_service.reload_if_changed()
+
+    await async_service.close()
+
+    mock_service.reload_if_changed.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_queued_calls(mock_service):
+    started = threading.Event()
+    release = threading.Event()
+
+    def reload_if_changed():
+        started.set()
+        release.wait()
+        return True
+
+    mock_service.reload_if_changed.side_effect = reload_if_changed
+    async_service = AsyncBrevityTermService(mock_service, max_workers=1)
+    running = asyncio.ensure_future(async_service.reload_if_changed())
+    queued = asyncio.ensure_future(async_service.reload_if_changed())
+    await asyncio.to_thread(started.wait)
+
+    closing = asyncio.ensure_future(async_service.close())
+    await asyncio.sleep(0.01)
+
+    assert not closing.done()
+
+    release.set()
+    await closing
+
+    assert await running
+    assert queued.cancelled()
+    mock_service.reload_if_changed.assert_called_once_with()
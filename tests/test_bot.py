@@ -1,17 +1,32 @@
 # Copyright 2025 Niklas Glienke
 
+import asyncio
+import datetime
+import sqlite3
 from textwrap import dedent
+from unittest.mock import AsyncMock, MagicMock
 
 import discord
 import pytest
 import yaml
 
-from cvw22_operations_officer.bot import DiscordBot
+from cvw22_operations_officer.__main__ import setup_config_dir
+from cvw22_operations_officer.bot import DiscordBot, ShardedDiscordBot
+from cvw22_operations_officer.models.config_model import BotConfig
+from cvw22_operations_officer.utils.database import ReplicatedDatabaseManager
+from cvw22_operations_officer.utils.rate_limiter import RateLimitExceeded
 
 VALID_CONFIG = {
-    "test_str": "test_value",
-    "test_int": 5,
-    "test_list": [{"str": "test", "int": 67}, {"str": "test", "int": 68}],
+    "commands": {"config": True, "brevity_term": True},
+    "tasks": {
+        "brevity_term_digest": {
+            "enabled": True,
+            "channel_id": 123456789,
+            "time": "12:00",
+            "timezone": "UTC",
+        }
+    },
+    "admins": [{"name": "Admin 1", "id": 987654321}],
 }
 
 INVALID_CONFIG = dedent("""
@@ -31,8 +46,32 @@ def test_get_config_valid(tmp_path):
     )
     config = discord_bot.config
 
-    assert isinstance(config, dict)
-    assert VALID_CONFIG == config
+    assert isinstance(config, BotConfig)
+    assert VALID_CONFIG == config.raw
+    assert config.admin_ids == frozenset({987654321})
+
+
+def test_get_config_invalid_config_keeps_config(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    config = discord_bot.config
+    listener = MagicMock()
+    discord_bot.add_config_listener(listener)
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump({"commands": {"config": True}}, f)
+
+    with pytest.raises(ValueError):
+        discord_bot.get_config()
+
+    assert discord_bot.config is config
+    listener.assert_not_called()
 
 
 def test_get_config_no_config_file(tmp_path):
@@ -51,3 +90,447 @@ def test_get_config_invalid_yaml(tmp_path):
             tmp_path, intents=discord.Intents.all(), command_prefix="!"
         )
         discord_bot.get_config()
+
+
+@pytest.mark.asyncio
+async def test_close_closes_database_connections(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "a") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+
+    await discord_bot.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with discord_bot.database_manager.read():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_in_memory_replica(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path,
+        intents=discord.Intents.all(),
+        command_prefix="!",
+        in_memory_replica=True,
+    )
+
+    assert isinstance(discord_bot.database_manager, ReplicatedDatabaseManager)
+    assert discord_bot.brevity_term_service.get_brevity_terms_by_term("BOGEY")
+
+    await discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_setup_hook_loads_term_index(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+
+    assert discord_bot.brevity_term_service.is_term_index_stale
+
+    await discord_bot.setup_hook()
+    await discord_bot._term_index_task
+
+    assert not discord_bot.brevity_term_service.is_term_index_stale
+    assert not discord_bot.config_watcher.is_running()
+    assert not discord_bot.SYNC_APP_COMMANDS
+    assert [phase.name for phase in discord_bot.startup_profile.phases] == [
+        "load_term_index"
+    ]
+
+    await discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_load_term_index_logs_failure(tmp_path, caplog):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    discord_bot.async_brevity_term_service.load_term_index = AsyncMock(
+        side_effect=sqlite3.OperationalError("Test Error.")
+    )
+
+    await discord_bot._load_term_index()
+
+    assert "Loading the brevity term index failed." in caplog.text
+
+    await discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_loading_term_index(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    discord_bot.async_brevity_term_service.load_term_index = AsyncMock(
+        side_effect=asyncio.Event().wait
+    )
+
+    await discord_bot.setup_hook()
+    await asyncio.sleep(0)
+    term_index_task = discord_bot._term_index_task
+
+    await discord_bot.close()
+
+    assert term_index_task.cancelled()
+    assert discord_bot._term_index_task is None
+
+
+@pytest.mark.asyncio
+async def test_load_extensions(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+
+    await discord_bot.load_extensions()
+
+    assert set(discord_bot.cogs) == {"ConfigCog", "BrevityTermCog"}
+    assert discord_bot.get_command("brevity_term") is not None
+    assert [phase.name for phase in discord_bot.startup_profile.phases] == [
+        "load_extensions"
+    ]
+
+    await discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_setup_hook_syncs_app_commands(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path,
+        intents=discord.Intents.all(),
+        command_prefix="!",
+        sync_app_commands=True,
+    )
+    discord_bot.tree.sync = AsyncMock(return_value=[])
+
+    await discord_bot.setup_hook()
+
+    discord_bot.tree.sync.assert_awaited_once()
+
+    await discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_setup_hook_starts_config_watcher(tmp_path):
+    setup_config_dir(tmp_path)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        config_file.read_text().replace(
+            "config_watcher:\n    enabled: false",
+            "config_watcher:\n    enabled: true",
+        )
+    )
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+
+    await discord_bot.setup_hook()
+
+    assert discord_bot.config_watcher.is_running()
+
+    await discord_bot.close()
+
+    assert not discord_bot.config_watcher.is_running()
+
+
+@pytest.mark.asyncio
+async def test_watch_brevity_terms(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    reload_if_changed = AsyncMock(side_effect=[RuntimeError, True, False])
+    discord_bot.async_brevity_term_service.reload_if_changed = (
+        reload_if_changed
+    )
+
+    task = asyncio.create_task(discord_bot._watch_brevity_terms(0))
+
+    while reload_if_changed.await_count < 3:
+        await asyncio.sleep(0)
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_claim_job_run(tmp_path):
+    setup_config_dir(tmp_path)
+    due_at = datetime.datetime(2025, 1, 1, 11, 0, tzinfo=datetime.UTC)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    other_discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+
+    assert await discord_bot._claim_job_run("job", due_at)
+    assert not await other_discord_bot._claim_job_run("job", due_at)
+
+    await discord_bot.close()
+    await other_discord_bot.close()
+
+
+@pytest.mark.asyncio
+async def test_sharded_discord_bot(tmp_path):
+    setup_config_dir(tmp_path)
+
+    discord_bot = ShardedDiscordBot(
+        tmp_path,
+        intents=discord.Intents.all(),
+        command_prefix="!",
+        shard_count=4,
+        shard_ids=[2, 3],
+    )
+
+    # A sharded client can only be closed once its event loop is set up.
+    async with discord_bot:
+        assert isinstance(discord_bot, discord.AutoShardedClient)
+        assert discord_bot.shard_count == 4
+        assert discord_bot.shard_ids == [2, 3]
+        assert discord_bot.config.commands.brevity_term
+
+
+def test_config_listeners(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "a") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    listener = MagicMock()
+    discord_bot.add_config_listener(listener)
+
+    discord_bot.get_config()
+
+    listener.assert_called_once()
+
+    discord_bot.remove_config_listener(listener)
+    discord_bot.remove_config_listener(listener)
+    discord_bot.get_config()
+
+    listener.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_resolve_channel(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "a") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    cached_channel = MagicMock()
+    fetched_channel = MagicMock()
+
+    async def fetch_channel(channel_id):
+        if channel_id == 2:
+            return fetched_channel
+
+        raise discord.NotFound(MagicMock(status=404), "Unknown Channel")
+
+    discord_bot.get_channel = MagicMock(
+        side_effect=lambda channel_id: (
+            cached_channel if channel_id == 1 else None
+        )
+    )
+    discord_bot.fetch_channel = AsyncMock(side_effect=fetch_channel)
+
+    assert await discord_bot.resolve_channel(1) is cached_channel
+    assert await discord_bot.resolve_channel(2) is fetched_channel
+    assert await discord_bot.resolve_channel(2) is fetched_channel
+    assert await discord_bot.resolve_channel(3) is None
+
+    assert discord_bot.fetch_channel.await_count == 2
+
+
+def test_metrics(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "a") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    discord_bot.search_cache.set(("bogey", 5), "BOGEY")
+    discord_bot.search_cache.get(("bogey", 5))
+
+    metrics = discord_bot.metrics.render()
+
+    assert "discord_gateway_latency_seconds NaN" in metrics
+    assert "brevity_term_search_cache_hits_total 1.0" in metrics
+    assert "brevity_term_search_cache_current_size 1.0" in metrics
+
+
+@pytest.mark.asyncio
+async def test_invoke_records_command_duration(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "a") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    ctx = MagicMock()
+    ctx.command.qualified_name = "brevity_term"
+    ctx.command.invoke = AsyncMock()
+    ctx.command_failed = False
+    discord_bot.can_run = AsyncMock(return_value=True)
+
+    await discord_bot.invoke(ctx)
+
+    histogram = discord_bot.metrics.histogram(
+        "discord_command_duration_seconds", "", ("command", "status")
+    )
+
+    assert histogram.get_count("brevity_term", "succeeded") == 1
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limits(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump(
+            {
+                **VALID_CONFIG,
+                "rate_limits": {"user": {"rate": 1, "per_seconds": 60}},
+            },
+            f,
+        )
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    ctx = MagicMock()
+    ctx.author.id = 1
+    ctx.message.author.id = 1
+    admin_ctx = MagicMock()
+    admin_ctx.author.id = 987654321
+    admin_ctx.message.author.id = 987654321
+
+    assert await discord_bot._check_rate_limits(ctx)
+
+    with pytest.raises(RateLimitExceeded):
+        await discord_bot._check_rate_limits(ctx)
+
+    for _ in range(3):
+        assert await discord_bot._check_rate_limits(admin_ctx)
+
+    counter = discord_bot.metrics.counter(
+        "discord_command_rate_limited", "", ("scope",)
+    )
+
+    assert counter.get("user") == 1
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limits_once_per_invocation(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump(
+            {
+                **VALID_CONFIG,
+                "rate_limits": {"user": {"rate": 1, "per_seconds": 60}},
+            },
+            f,
+        )
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    ctx = MagicMock()
+    ctx.author.id = 1
+    ctx.message.author.id = 1
+
+    # Like the help command, which checks every command it lists.
+    for _ in range(3):
+        assert await discord_bot.can_run(ctx)
+
+    assert await discord_bot.can_run(ctx, call_once=True)
+
+    with pytest.raises(RateLimitExceeded):
+        await discord_bot.can_run(ctx, call_once=True)
+
+
+@pytest.mark.asyncio
+async def test_on_command_error_rate_limit_noticed_once(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    ctx = MagicMock()
+    ctx.send = AsyncMock()
+
+    await discord_bot.on_command_error(
+        ctx, RateLimitExceeded("user", 4.2, True)
+    )
+    await discord_bot.on_command_error(
+        ctx, RateLimitExceeded("user", 3.9, False)
+    )
+
+    ctx.send.assert_awaited_once_with(
+        "Too many commands, please try again in 5 seconds."
+    )
+
+
+def test_get_config_keeps_unchanged_rate_limiter(tmp_path):
+    config_file = tmp_path / "config.yaml"
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump(VALID_CONFIG, f)
+
+    discord_bot = DiscordBot(
+        tmp_path, intents=discord.Intents.all(), command_prefix="!"
+    )
+    rate_limiter = discord_bot.rate_limiter
+
+    discord_bot.get_config()
+
+    assert discord_bot.rate_limiter is rate_limiter
+
+    with open(config_file, "w") as f:
+        yaml.safe_dump(
+            {
+                **VALID_CONFIG,
+                "rate_limits": {"guild": {"rate": 1, "per_seconds": 1}},
+            },
+            f,
+        )
+
+    discord_bot.get_config()
+
+    assert discord_bot.rate_limiter is not rate_limiter
+    assert discord_bot.rate_limiter.config.guild is not None
@@ -1,21 +1,35 @@
 # Copyright 2025 Niklas Glienke
 
+import asyncio
+import datetime
 from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
 
+import discord
 import pytest
 from discord.channel import TextChannel, VoiceChannel
-from freezegun import freeze_time
 
-from cvw22_operations_officer.cogs.brevity_term_cog import BrevityTermCog
+from cvw22_operations_officer.cogs.brevity_term_cog import (
+    BrevityTermCog,
+    BrevityTermPaginator,
+    DigestDeliveryStats,
+)
 from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.models.config_model import BotConfig
+from cvw22_operations_officer.services.brevity_term_index import (
+    SearchCursor,
+    SearchResult,
+)
+from cvw22_operations_officer.services.brevity_term_service import SearchPage
+from cvw22_operations_officer.utils.cache import LRUCache
+from cvw22_operations_officer.utils.metrics import MetricsRegistry
+from cvw22_operations_officer.utils.scheduler import Scheduler
 
 
 @pytest.fixture
-def mock_bot():
-    bot = MagicMock()
-
-    bot.config = {
-        "commands": {"brevity_term": True},
+def config_data():
+    return {
+        "commands": {"config": True, "brevity_term": True},
         "tasks": {
             "brevity_term_digest": {
                 "enabled": True,
@@ -24,10 +38,22 @@ def mock_bot():
                 "channel_id": 123456789,
             }
         },
+        "admins": [],
     }
 
-    bot.get_channel = MagicMock()
-    bot.brevity_term_service = MagicMock()
+
+@pytest.fixture
+def mock_bot(config_data):
+    bot = MagicMock()
+
+    bot.config = BotConfig.from_dict(config_data)
+
+    bot.metrics = MetricsRegistry()
+    bot.resolve_channel = AsyncMock()
+    bot.scheduler = Scheduler()
+    bot.search_cache = LRUCache()
+    bot.async_brevity_term_service = AsyncMock()
+    bot.async_brevity_term_service.suggest_brevity_terms.return_value = []
 
     return bot
 
@@ -39,11 +65,22 @@ def mock_ctx():
     return ctx
 
 
+def get_page(*brevity_terms, has_more=False):
+    return SearchPage(
+        [
+            SearchResult(SearchCursor(1, 0.0, brevity_term.term), brevity_term)
+            for brevity_term in brevity_terms
+        ],
+        has_more,
+    )
+
+
 @pytest.mark.asyncio
 async def test_brevity_term_enabled_by_config(mock_bot, mock_ctx):
-    mock_bot.brevity_term_service.get_brevity_terms_by_term.return_value = [
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page(
         BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1")
-    ]
+    )
 
     cog = BrevityTermCog(mock_bot)
 
@@ -54,11 +91,79 @@ async def test_brevity_term_enabled_by_config(mock_bot, mock_ctx):
 
     assert sent_message[0] == "### Brevity Term: `TERM EQUAL 1`"
     assert sent_message[1] == "> DESCRIPTION 1"
+    assert mock_ctx.send.call_args.kwargs["view"] is None
+
+
+@pytest.mark.asyncio
+async def test_brevity_term_multiple_brevity_terms(mock_bot, mock_ctx):
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page(
+        BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1"),
+        BrevityTerm("TERM EQUAL 2", "DESCRIPTION 2 & DESCRIPTION 3"),
+        BrevityTerm("TERM EQUAL 3", "DESCRIPTION 4"),
+    )
+
+    cog = BrevityTermCog(mock_bot)
+
+    await cog.brevity_term(cog, mock_ctx, "equal")  # type: ignore
+
+    output_message = mock_ctx.send.call_args.args[0].split("\n")
+
+    assert output_message[0] == "### Brevity Term: `TERM EQUAL 1`"
+    assert output_message[1] == "> DESCRIPTION 1"
+    assert output_message[2] == "### Brevity Term: `TERM EQUAL 2`"
+    assert output_message[3] == "> DESCRIPTION 2"
+    assert output_message[4] == "> DESCRIPTION 3"
+    assert output_message[5] == "### Brevity Term: `TERM EQUAL 3`"
+    assert output_message[6] == "> DESCRIPTION 4"
+
+
+@pytest.mark.asyncio
+async def test_brevity_term_rendered_as_embeds(
+    config_data, mock_bot, mock_ctx
+):
+    config_data["commands"]["brevity_term_render"] = "embed"
+    mock_bot.config = BotConfig.from_dict(config_data)
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page(
+        BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1 & DESCRIPTION 2"),
+        BrevityTerm("TERM EQUAL 2", "DESCRIPTION 3"),
+    )
+
+    cog = BrevityTermCog(mock_bot)
+
+    await cog.brevity_term(cog, mock_ctx, "TERM EQUAL")  # type: ignore
+
+    embeds = mock_ctx.send.call_args.kwargs["embeds"]
+
+    assert mock_ctx.send.call_args.args[0] is None
+    assert [embed.title for embed in embeds] == [
+        "Brevity Term: TERM EQUAL 1",
+        "Brevity Term: TERM EQUAL 2",
+    ]
+    assert embeds[0].description == "DESCRIPTION 1\nDESCRIPTION 2"
 
 
 @pytest.mark.asyncio
-async def test_brevity_term_disabled_by_config(mock_bot, mock_ctx):
-    mock_bot.config["commands"]["brevity_term"] = False
+async def test_brevity_term_nothing_found(mock_bot, mock_ctx):
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page()
+
+    cog = BrevityTermCog(mock_bot)
+
+    await cog.brevity_term(cog, mock_ctx, "not equal")  # type: ignore
+
+    mock_ctx.send.assert_awaited_once_with(
+        "No brevity terms found with `not equal`."
+    )
+
+
+@pytest.mark.asyncio
+async def test_brevity_term_disabled_by_config(
+    config_data, mock_bot, mock_ctx
+):
+    config_data["commands"]["brevity_term"] = False
+    mock_bot.config = BotConfig.from_dict(config_data)
 
     cog = BrevityTermCog(mock_bot)
 
@@ -71,61 +176,302 @@ async def test_brevity_term_disabled_by_config(mock_bot, mock_ctx):
 
 
 @pytest.mark.asyncio
-async def test_search_brevity_term_single_brevity_terms(mock_bot):
-    mock_bot.brevity_term_service.get_brevity_terms_by_term.return_value = [
-        BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1")
+async def test_brevity_term_autocomplete(mock_bot):
+    mock_bot.brevity_term_service.complete_brevity_terms.return_value = [
+        "TERM 1",
+        "T" * 120,
     ]
+    interaction = MagicMock()
+    interaction.user.id = 1
 
     cog = BrevityTermCog(mock_bot)
-    output_message = cog._search_brevity_term("TERM EQUAL 1").split("\n")
+    choices = await cog.brevity_term_autocomplete(interaction, "T")
 
-    assert output_message[0] == "### Brevity Term: `TERM EQUAL 1`"
-    assert output_message[1] == "> DESCRIPTION 1"
+    assert [choice.value for choice in choices] == ["TERM 1", "T" * 100]
+    assert len(choices[1].name) == 100
+    mock_bot.brevity_term_service.complete_brevity_terms.assert_called_once_with(
+        "T", 25
+    )
+    assert cog._autocompletions.get("completed") == 1
 
 
 @pytest.mark.asyncio
-async def test_search_brevity_term_multiple_brevity_terms(mock_bot):
-    mock_bot.brevity_term_service.get_brevity_terms_by_term.return_value = [
-        BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1"),
-        BrevityTerm("TERM EQUAL 2", "DESCRIPTION 2 & DESCRIPTION 3"),
-        BrevityTerm("TERM EQUAL 3", "DESCRIPTION 4"),
+async def test_brevity_term_autocomplete_debounced(mock_bot):
+    mock_bot.brevity_term_service.complete_brevity_terms.return_value = [
+        "TERM 1"
     ]
+    interaction = MagicMock()
+    interaction.user.id = 1
 
     cog = BrevityTermCog(mock_bot)
-    output_message = cog._search_brevity_term("equal").split("\n")
+    first_task = asyncio.create_task(
+        cog.brevity_term_autocomplete(interaction, "T")
+    )
+    await asyncio.sleep(0)
+    second_task = asyncio.create_task(
+        cog.brevity_term_autocomplete(interaction, "TE")
+    )
+
+    first_choices, second_choices = await asyncio.gather(
+        first_task, second_task
+    )
+
+    assert first_choices == []
+    assert [choice.value for choice in second_choices] == ["TERM 1"]
+    mock_bot.brevity_term_service.complete_brevity_terms.assert_called_once_with(
+        "TE", 25
+    )
+    assert cog._autocompletions.get("superseded") == 1
+
+
+@pytest.mark.asyncio
+async def test_brevity_term_autocomplete_disabled(config_data, mock_bot):
+    config_data["commands"]["brevity_term"] = False
+    mock_bot.config = BotConfig.from_dict(config_data)
+
+    cog = BrevityTermCog(mock_bot)
+
+    assert await cog.brevity_term_autocomplete(MagicMock(), "T") == []
+    mock_bot.brevity_term_service.complete_brevity_terms.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_search_page_cached(mock_bot):
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page(
+        BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1")
+    )
+
+    cog = BrevityTermCog(mock_bot)
+    first_page = await cog._get_search_page("term  equal 1")
+    second_page = await cog._get_search_page(" TERM EQUAL 1 ")
+
+    service.search_brevity_terms.assert_called_once_with("term  equal 1", 5)
+    assert first_page is second_page
+    assert mock_bot.search_cache.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_search_page_shares_concurrent_searches(mock_bot):
+    page = get_page(BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1"))
+    release = asyncio.Event()
+
+    async def search_brevity_terms(*args):
+        await release.wait()
+        return page
+
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.side_effect = search_brevity_terms
+
+    cog = BrevityTermCog(mock_bot)
+    tasks = [
+        asyncio.create_task(cog._get_search_page(search_term))
+        for search_term in ("term equal 1", "TERM  EQUAL 1", "term equal 1")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [page, page, page]
+    service.search_brevity_terms.assert_called_once()
+    assert "brevity_term_search_shared_queries 2.0" in (
+        mock_bot.metrics.render()
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_search_page_nothing_found_not_cached(mock_bot):
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page()
+
+    cog = BrevityTermCog(mock_bot)
+    await cog._get_search_page("not equal")
+    await cog._get_search_page("not equal")
+
+    assert service.search_brevity_terms.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_search_page_not_cached_after_change(mock_bot):
+    service = mock_bot.async_brevity_term_service
+    page = get_page(BrevityTerm("TERM EQUAL 1", "DESCRIPTION 1"))
+
+    async def search_brevity_terms(*args):
+        # The brevity terms change while the search is running.
+        mock_bot.search_cache.clear()
+        return page
+
+    service.search_brevity_terms.side_effect = search_brevity_terms
+
+    cog = BrevityTermCog(mock_bot)
+
+    assert await cog._get_search_page("equal") == page
+    assert mock_bot.search_cache.cache_info().current_size == 0
+
+
+@pytest.mark.asyncio
+async def test_get_search_page_with_cursor_not_cached(mock_bot):
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.return_value = get_page(
+        BrevityTerm("TERM EQUAL 2", "DESCRIPTION 2")
+    )
+    cursor = SearchCursor(1, 0.0, "TERM EQUAL 1")
+
+    cog = BrevityTermCog(mock_bot)
+    await cog._get_search_page("equal", cursor)
+
+    service.search_brevity_terms.assert_called_once_with("equal", 5, cursor)
+    assert mock_bot.search_cache.cache_info().current_size == 0
+
+
+@pytest.mark.asyncio
+async def test_get_not_found_message_suggestions(mock_bot):
+    service = mock_bot.async_brevity_term_service
+    service.suggest_brevity_terms.return_value = ["BOGEY", "BOGEY DOPE"]
+
+    cog = BrevityTermCog(mock_bot)
+    output_message = await cog._get_not_found_message("BOGIE")
+
+    assert output_message == (
+        "No brevity terms found with `BOGIE`. "
+        "Did you mean `BOGEY`, `BOGEY DOPE`?"
+    )
+
+
+def test_fit_search_results_message_length():
+    results = get_page(
+        *(BrevityTerm(f"TERM {i}", "D" * 600) for i in range(5))
+    ).results
+
+    fitted_results = BrevityTermCog.fit_search_results(results, "markdown")
+
+    assert fitted_results == results[:3]
+    assert BrevityTermCog.fit_search_results(results, "embed") == results
+
+
+def test_fit_search_results_embed_length():
+    # The titles are truncated, so only their first 256 characters count.
+    results = get_page(
+        *(BrevityTerm("T" * 2000, "D" * 1500) for _ in range(4)),
+        BrevityTerm("TERM 5", "D" * 1500),
+    ).results
+
+    assert BrevityTermCog.fit_search_results(results, "embed") == results[:3]
+
+
+def test_format_brevity_term_embed_long_term():
+    embed = BrevityTermCog.format_brevity_term_embed(
+        BrevityTerm("T" * 300, "D" * 5000)
+    )
+
+    assert len(embed.title) == 256
+    assert embed.title.startswith("Brevity Term: TTT")
+    assert embed.title.endswith("…")
+    assert len(embed.description) == 4096
+
+
+def test_fit_search_results_keeps_first_result():
+    results = get_page(BrevityTerm("TERM 1", "D" * 3000)).results
+
+    assert BrevityTermCog.fit_search_results(results, "markdown") == results
 
-    assert output_message[0] == "### Brevity Term: `TERM EQUAL 1`"
-    assert output_message[1] == "> DESCRIPTION 1"
-    assert output_message[2] == "### Brevity Term: `TERM EQUAL 2`"
-    assert output_message[3] == "> DESCRIPTION 2"
-    assert output_message[4] == "> DESCRIPTION 3"
-    assert output_message[5] == "### Brevity Term: `TERM EQUAL 3`"
-    assert output_message[6] == "> DESCRIPTION 4"
+
+@pytest.mark.asyncio
+async def test_paginator_long_page(mock_bot):
+    cog = BrevityTermCog(mock_bot)
+    paginator = BrevityTermPaginator(cog, 1, "TERM", "markdown")
+
+    content, embeds = paginator.render(
+        get_page(BrevityTerm("TERM 1", "D" * 3000))
+    )
+
+    assert len(content) == 2000
+    assert content.endswith("…")
+    assert embeds == []
+    assert not paginator.has_pages
 
 
 @pytest.mark.asyncio
-async def test_search_brevity_term_nothing_found(mock_bot):
-    mock_bot.brevity_term_service.get_brevity_terms_by_term.return_value = []
+async def test_paginator_turns_pages(mock_bot, mock_ctx):
+    first_page = get_page(
+        BrevityTerm("TERM 1", "DESCRIPTION 1"),
+        BrevityTerm("TERM 2", "DESCRIPTION 2"),
+        has_more=True,
+    )
+    second_page = get_page(BrevityTerm("TERM 3", "DESCRIPTION 3"))
+    service = mock_bot.async_brevity_term_service
+    service.search_brevity_terms.side_effect = [first_page, second_page]
+    mock_ctx.author.id = 1
+    interaction = MagicMock()
+    interaction.user.id = 1
+    interaction.response.edit_message = AsyncMock()
 
     cog = BrevityTermCog(mock_bot)
-    output_message = cog._search_brevity_term("not equal")
 
-    assert output_message == "No brevity terms found with `not equal`."
+    await cog.brevity_term(cog, mock_ctx, "TERM")  # type: ignore
+
+    paginator = mock_ctx.send.call_args.kwargs["view"]
+
+    assert isinstance(paginator, BrevityTermPaginator)
+    assert paginator.previous_page.disabled
+    assert not paginator.next_page.disabled
+
+    await paginator.next_page.callback(interaction)
+
+    service.search_brevity_terms.assert_called_with(
+        "TERM", 5, first_page.next_cursor
+    )
+    assert interaction.response.edit_message.call_args.kwargs[
+        "content"
+    ].startswith("### Brevity Term: `TERM 3`")
+    assert not paginator.previous_page.disabled
+    assert paginator.next_page.disabled
+
+    await paginator.previous_page.callback(interaction)
+
+    assert service.search_brevity_terms.call_count == 2
+    assert interaction.response.edit_message.call_args.kwargs[
+        "content"
+    ].startswith("### Brevity Term: `TERM 1`")
+    assert paginator.previous_page.disabled
+    assert not paginator.next_page.disabled
 
 
 @pytest.mark.asyncio
-@freeze_time("2025-01-01 12:00:00")
-async def test_brevity_term_digest_correct_time(mock_bot):
+async def test_paginator_only_for_author(mock_bot):
+    cog = BrevityTermCog(mock_bot)
+    paginator = BrevityTermPaginator(cog, 1, "TERM", "markdown")
+    interaction = MagicMock()
+    interaction.user.id = 2
+    interaction.response.send_message = AsyncMock()
+
+    assert not await paginator.interaction_check(interaction)
+    interaction.response.send_message.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_paginator_timeout_removes_buttons(mock_bot):
+    cog = BrevityTermCog(mock_bot)
+    paginator = BrevityTermPaginator(cog, 1, "TERM", "markdown")
+    paginator.message = AsyncMock()
+
+    await paginator.on_timeout()
+
+    paginator.message.edit.assert_awaited_once_with(view=None)
+
+
+@pytest.mark.asyncio
+async def test_brevity_term_digest(mock_bot):
     mock_channel = AsyncMock(TextChannel)
-    mock_bot.get_channel.return_value = mock_channel
+    mock_bot.resolve_channel.return_value = mock_channel
 
-    mock_bot.brevity_term_service.get_brevity_term_for_digest.return_value = (
-        BrevityTerm("TERM 1", "DESCRIPTION 1")
+    service = mock_bot.async_brevity_term_service
+    service.get_brevity_term_for_digest.return_value = BrevityTerm(
+        "TERM 1", "DESCRIPTION 1"
     )
 
     cog = BrevityTermCog(mock_bot)
 
-    await cog.brevity_term_digest()
+    await cog.brevity_term_digest((123456789,))
 
     mock_channel.send.assert_called_once()
     sent_message = mock_channel.send.call_args.args[0].split("\n")
@@ -135,50 +481,177 @@ async def test_brevity_term_digest_correct_time(mock_bot):
 
 
 @pytest.mark.asyncio
-@freeze_time("2025-01-01 13:33:02")
-async def test_brevity_term_digest_wrong_time(mock_bot):
+async def test_brevity_term_digest_disabled(config_data, mock_bot):
+    config_data["tasks"]["brevity_term_digest"]["enabled"] = False
+    mock_bot.config = BotConfig.from_dict(config_data)
+
     cog = BrevityTermCog(mock_bot)
 
-    response = await cog.brevity_term_digest()
+    response = await cog.brevity_term_digest((123456789,))
 
     assert response is None
 
 
 @pytest.mark.asyncio
-@freeze_time("2025-01-01 12:00:00")
-async def test_brevity_term_digest_disabled(mock_bot):
-    mock_bot.config["tasks"]["brevity_term_digest"]["enabled"] = False
+async def test_brevity_term_digest_channel_not_found(mock_bot):
+    mock_bot.resolve_channel.return_value = None
 
     cog = BrevityTermCog(mock_bot)
 
-    response = await cog.brevity_term_digest()
+    response = await cog.brevity_term_digest((123456789,))
 
     assert response is None
 
 
 @pytest.mark.asyncio
-@freeze_time("2025-01-01 12:00:00")
-async def test_brevity_term_digest_channel_not_found(mock_bot):
-    mock_bot.get_channel.return_value = None
+async def test_brevity_term_digest_wrong_channel_type(mock_bot):
+    mock_channel = AsyncMock(VoiceChannel)
+    mock_bot.resolve_channel.return_value = mock_channel
 
     cog = BrevityTermCog(mock_bot)
 
-    response = await cog.brevity_term_digest()
+    response = await cog.brevity_term_digest((123456789,))
 
     assert response is None
 
 
 @pytest.mark.asyncio
-@freeze_time("2025-01-01 12:00:00")
-async def test_brevity_term_digest_wrong_channel_type(mock_bot):
-    mock_channel = AsyncMock(VoiceChannel)
-    mock_bot.get_channel.return_value = mock_channel
+async def test_brevity_term_digest_no_brevity_terms(mock_bot):
+    mock_channel = AsyncMock(TextChannel)
+    mock_bot.resolve_channel.return_value = mock_channel
+
+    service = mock_bot.async_brevity_term_service
+    service.get_brevity_term_for_digest.side_effect = LookupError(
+        "Test Error."
+    )
 
     cog = BrevityTermCog(mock_bot)
 
-    response = await cog.brevity_term_digest()
+    response = await cog.brevity_term_digest((123456789,))
 
     assert response is None
+    mock_channel.send.assert_not_called()
+    assert cog._digest_misses.get("no_brevity_term") == 1
+
+
+@pytest.mark.asyncio
+async def test_cog_load_schedules_brevity_term_digest(mock_bot):
+    cog = BrevityTermCog(mock_bot)
+
+    await cog.cog_load()
+
+    mock_bot.add_config_listener.assert_called_once_with(
+        cog._schedule_brevity_term_digest
+    )
+    job = mock_bot.scheduler.jobs["brevity_term_digest@12:00@UTC"]
+
+    assert job.at == datetime.time(12, 0)
+    assert job.timezone == ZoneInfo("UTC")
+    assert job.callback.func == cog.brevity_term_digest
+    assert job.callback.args == ((123456789,),)
+
+
+@pytest.mark.asyncio
+async def test_cog_unload_unschedules_brevity_term_digest(mock_bot):
+    cog = BrevityTermCog(mock_bot)
+    await cog.cog_load()
+
+    await cog.cog_unload()
+
+    mock_bot.remove_config_listener.assert_called_once_with(
+        cog._schedule_brevity_term_digest
+    )
+    assert mock_bot.scheduler.jobs == {}
+
+
+def test_schedule_brevity_term_digest_multiple_times(config_data, mock_bot):
+    config_data["tasks"]["brevity_term_digest"]["time"] = [
+        "08:00",
+        "20:30",
+    ]
+    mock_bot.config = BotConfig.from_dict(config_data)
+    mock_bot.scheduler.schedule(
+        "brevity_term_digest@12:00@UTC",
+        datetime.time(12, 0),
+        ZoneInfo("UTC"),
+        AsyncMock(),
+    )
+
+    cog = BrevityTermCog(mock_bot)
+    cog._schedule_brevity_term_digest()
+
+    assert sorted(mock_bot.scheduler.jobs) == [
+        "brevity_term_digest@08:00@UTC",
+        "brevity_term_digest@20:30@UTC",
+    ]
+
+
+def test_schedule_brevity_term_digest_targets(config_data, mock_bot):
+    config_data["tasks"]["brevity_term_digest"]["targets"] = [
+        {"channel_id": 1},
+        {"channel_id": 2},
+        {"channel_id": 3, "time": "08:00", "timezone": "Europe/Zurich"},
+    ]
+    mock_bot.config = BotConfig.from_dict(config_data)
+
+    cog = BrevityTermCog(mock_bot)
+    cog._schedule_brevity_term_digest()
+    jobs = mock_bot.scheduler.jobs
+
+    assert sorted(jobs) == [
+        "brevity_term_digest@08:00@Europe/Zurich",
+        "brevity_term_digest@12:00@UTC",
+    ]
+    assert jobs["brevity_term_digest@12:00@UTC"].callback.args == ((1, 2),)
+    assert jobs["brevity_term_digest@08:00@Europe/Zurich"].timezone == (
+        ZoneInfo("Europe/Zurich")
+    )
+
+
+def test_schedule_brevity_term_digest_disabled(config_data, mock_bot):
+    config_data["tasks"]["brevity_term_digest"]["enabled"] = False
+    mock_bot.config = BotConfig.from_dict(config_data)
+
+    cog = BrevityTermCog(mock_bot)
+    cog._schedule_brevity_term_digest()
+
+    assert mock_bot.scheduler.jobs == {}
+
+
+@pytest.mark.asyncio
+async def test_brevity_term_digest_fan_out(mock_bot):
+    channels = {
+        1: AsyncMock(TextChannel, id=1),
+        2: AsyncMock(TextChannel, id=2),
+        3: AsyncMock(TextChannel, id=3),
+    }
+    channels[2].send.side_effect = discord.HTTPException(
+        MagicMock(status=403), "Missing Access"
+    )
+    mock_bot.resolve_channel.side_effect = channels.get
+
+    service = mock_bot.async_brevity_term_service
+    service.get_brevity_term_for_digest.return_value = BrevityTerm(
+        "TERM 1", "DESCRIPTION 1"
+    )
+
+    cog = BrevityTermCog(mock_bot)
+
+    await cog.brevity_term_digest((1, 2, 3, 4))
+
+    service.get_brevity_term_for_digest.assert_awaited_once()
+    for channel in channels.values():
+        channel.send.assert_awaited_once_with(
+            "### Brevity Term: `TERM 1`\n> DESCRIPTION 1"
+        )
+    assert cog.digest_stats[1] == DigestDeliveryStats(sent=1, failed=0)
+    assert cog.digest_stats[2] == DigestDeliveryStats(sent=0, failed=1)
+    assert cog.digest_stats[3] == DigestDeliveryStats(sent=1, failed=0)
+    assert cog.digest_stats[4] == DigestDeliveryStats(sent=0, failed=1)
+    assert cog._digest_fires.get() == 1
+    assert cog._digest_deliveries.get("sent") == 2
+    assert cog._digest_deliveries.get("failed") == 2
+    assert cog._send_duration.get_count("digest") == 3
 
 
 def test_format_brevity_term_single_description():
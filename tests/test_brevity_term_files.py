@@ -0,0 +1,134 @@
+# Copyright 2026 Niklas Glienke
+
+import pytest
+
+from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.utils import brevity_term_files
+from cvw22_operations_officer.utils.brevity_term_files import (
+    read_brevity_terms,
+    write_brevity_terms,
+)
+
+BREVITY_TERMS = [
+    BrevityTerm("BOGEY", "[A/A] A radar or visual contact."),
+    BrevityTerm("ANCHOR [location]", '1. Orbit, "quoted", ünïcode.\n2. Line'),
+    BrevityTerm("WINCHESTER", "No ordnance remaining: 0"),
+]
+RECORD = '{"term": "BOGEY", "description": "Contact."}'
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".jsonl", ".yaml"])
+def test_round_trip(tmp_path, suffix):
+    path = tmp_path / f"brevity_terms{suffix}"
+
+    count = write_brevity_terms(path, iter(BREVITY_TERMS))
+
+    assert count == 3
+    assert list(read_brevity_terms(path)) == BREVITY_TERMS
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".jsonl", ".yml"])
+def test_round_trip_empty(tmp_path, suffix):
+    path = tmp_path / f"brevity_terms{suffix}"
+
+    assert write_brevity_terms(path, []) == 0
+    assert list(read_brevity_terms(path)) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_read_json_across_chunks(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(brevity_term_files, "READ_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "brevity_terms.json"
+    write_brevity_terms(path, BREVITY_TERMS)
+
+    assert list(read_brevity_terms(path)) == BREVITY_TERMS
+
+
+def test_read_json_number_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(brevity_term_files, "READ_CHUNK_SIZE", 2)
+    path = tmp_path / "brevity_terms.json"
+    path.write_text(" [ 1234 ,\t5 ]")
+
+    with open(path) as f:
+        assert list(brevity_term_files._read_json_array(f)) == [1234, 5]
+
+
+def test_read_strips_whitespace(tmp_path):
+    path = tmp_path / "brevity_terms.csv"
+    path.write_text("term,description\n  BOGEY , Unknown contact. \n")
+
+    assert list(read_brevity_terms(path)) == [
+        BrevityTerm("BOGEY", "Unknown contact.")
+    ]
+
+
+def test_read_unsupported_format(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        list(read_brevity_terms(tmp_path / "brevity_terms.txt"))
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ('{"term": "BOGEY"}', "must contain an array"),
+        ('[{"term": "BOGEY", "description": "Contact."}', "not terminated"),
+        ('[{"term": "BOGEY"}]', "Record 1 has no description"),
+        ('[{"description": "Contact."}]', "Record 1 has no term"),
+        ('["BOGEY"]', "Record 1 is not a mapping"),
+        ('[{"term": }]', "Expecting value"),
+        (f"[{RECORD} {RECORD}]", "no comma after element 1"),
+        (f"[,{RECORD}]", "extra comma after element 0"),
+        (f"[{RECORD},,{RECORD}]", "extra comma after element 1"),
+        (f"[{RECORD},]", "comma after element 1"),
+        ("[,]", "extra comma after element 0"),
+        (f"[{RECORD}] trailing garbage", "followed by more data"),
+        ("[] []", "followed by more data"),
+        ("", "not terminated"),
+        (f"[{RECORD},", "not terminated"),
+    ],
+)
+def test_read_json_invalid(tmp_path, content, message):
+    path = tmp_path / "brevity_terms.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match=message):
+        list(read_brevity_terms(path))
+
+
+def test_read_yaml_values_as_strings(tmp_path):
+    path = tmp_path / "brevity_terms.yaml"
+    path.write_text("- term: 42\n  description: yes\n")
+
+    assert list(read_brevity_terms(path)) == [BrevityTerm("42", "yes")]
+
+
+def test_read_yaml_null_as_missing(tmp_path):
+    path = tmp_path / "brevity_terms.yaml"
+    path.write_text(
+        '- term: "null"\n  description: Quoted.\n'
+        "- term: BOGEY\n  description: ~\n"
+    )
+    brevity_terms = read_brevity_terms(path)
+
+    assert next(brevity_terms) == BrevityTerm("null", "Quoted.")
+
+    with pytest.raises(ValueError, match="Record 2 has no description"):
+        next(brevity_terms)
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("", "must contain a sequence"),
+        ("term: BOGEY\n", "must contain a sequence"),
+        ("- BOGEY\n", "Record 1 is not a mapping"),
+        ("- term: [BOGEY]\n  description: Contact.\n", "Record 1 has a"),
+        ("- {term: A, description: B}\n- {term: {}}\n", "Record 2 has a"),
+    ],
+)
+def test_read_yaml_invalid(tmp_path, content, message):
+    path = tmp_path / "brevity_terms.yaml"
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match=message):
+        list(read_brevity_terms(path))
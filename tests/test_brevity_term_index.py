@@ -0,0 +1,172 @@
+# Copyright 2026 Niklas Glienke
+
+import pytest
+
+from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
+from cvw22_operations_officer.services.brevity_term_index import (
+    BrevityTermIndex,
+    levenshtein_distance,
+)
+
+
+@pytest.fixture
+def brevity_term_index():
+    return BrevityTermIndex(
+        [
+            (
+                1,
+                "BOGEY",
+                "[A/A] A radar or visual contact of unknown identity.",
+            ),
+            (2, "BANDIT", "[A/A] An identified enemy aircraft."),
+            (3, "BANZAI", "[A/A] Execute launch and decide tactics."),
+            (4, "ANCHOR [location]", "1. Orbit about a specific point."),
+            (5, "WINCHESTER", "No ordnance remaining."),
+            (6, "BAND", "Frequency band of a BANDIT emitter."),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "first, second, distance",
+    [
+        ("", "", 0),
+        ("bogey", "bogey", 0),
+        ("bogey", "bogie", 2),
+        ("", "abc", 3),
+        ("kitten", "sitting", 3),
+    ],
+)
+def test_levenshtein_distance(first, second, distance):
+    assert levenshtein_distance(first, second) == distance
+    assert levenshtein_distance(second, first) == distance
+
+
+def test_len(brevity_term_index):
+    assert len(brevity_term_index) == 6
+
+
+def test_search_exact_match_first(brevity_term_index):
+    result = brevity_term_index.search("band")
+
+    assert [brevity_term.term for brevity_term in result] == [
+        "BAND",
+        "BANDIT",
+    ]
+
+
+def test_search_prefix(brevity_term_index):
+    result = brevity_term_index.search("BAN")
+
+    assert [brevity_term.term for brevity_term in result] == [
+        "BAND",
+        "BANDIT",
+        "BANZAI",
+    ]
+
+
+def test_search_full_text(brevity_term_index):
+    result = brevity_term_index.search("enemy aircraft")
+
+    assert result == [
+        BrevityTerm("BANDIT", "[A/A] An identified enemy aircraft.")
+    ]
+
+
+def test_search_full_text_after_prefix(brevity_term_index):
+    result = brevity_term_index.search("ORBIT")
+
+    assert [brevity_term.term for brevity_term in result] == [
+        "ANCHOR [location]"
+    ]
+
+
+def test_search_limit(brevity_term_index):
+    result = brevity_term_index.search("B", 2)
+
+    assert [brevity_term.term for brevity_term in result] == [
+        "BAND",
+        "BANDIT",
+    ]
+
+
+def test_search_nothing_found(brevity_term_index):
+    assert brevity_term_index.search("NOT EQUAL") == []
+    assert brevity_term_index.search("%") == []
+
+
+def test_suggest(brevity_term_index):
+    assert brevity_term_index.suggest("BOGIE") == ["BOGEY"]
+
+
+def test_suggest_ignores_placeholders(brevity_term_index):
+    assert brevity_term_index.suggest("ANCHR") == ["ANCHOR [location]"]
+
+
+def test_suggest_ordered_by_distance(brevity_term_index):
+    result = brevity_term_index.suggest("BANDI")
+
+    assert result == ["BAND", "BANDIT", "BANZAI"]
+    assert brevity_term_index.suggest("BANDI", max_distance=1, limit=1) == [
+        "BAND"
+    ]
+
+
+def test_suggest_nothing_found(brevity_term_index):
+    assert brevity_term_index.suggest("ZIPLIP") == []
+
+
+def test_complete_prefix(brevity_term_index):
+    assert brevity_term_index.complete("ban") == ["BAND", "BANDIT", "BANZAI"]
+    assert brevity_term_index.complete("  BAN", 2) == ["BAND", "BANDIT"]
+
+
+def test_complete_later_word(brevity_term_index):
+    assert brevity_term_index.complete("loc") == ["ANCHOR [location]"]
+
+
+def test_complete_prefix_before_later_word():
+    brevity_term_index = BrevityTermIndex(
+        [
+            (1, "CHECK PLAY", ""),
+            (2, "PLAYTIME", ""),
+            (3, "PLAY", ""),
+            (4, "A PLAY B", ""),
+        ]
+    )
+
+    assert brevity_term_index.complete("play") == [
+        "PLAY",
+        "PLAYTIME",
+        "CHECK PLAY",
+        "A PLAY B",
+    ]
+    assert brevity_term_index.complete("play", 3) == [
+        "PLAY",
+        "PLAYTIME",
+        "CHECK PLAY",
+    ]
+
+
+def test_complete_empty_prefix(brevity_term_index):
+    assert brevity_term_index.complete("", 2) == ["ANCHOR [location]", "BAND"]
+
+
+def test_complete_nothing_found(brevity_term_index):
+    assert brevity_term_index.complete("ZIPLIP") == []
+
+
+def test_empty_index():
+    brevity_term_index = BrevityTermIndex([])
+
+    assert len(brevity_term_index) == 0
+    assert brevity_term_index.search("BOGEY") == []
+    assert brevity_term_index.suggest("BOGEY") == []
+    assert brevity_term_index.complete("BOGEY") == []
+
+
+def test_search_shares_brevity_terms(brevity_term_index):
+    first_brevity_term = brevity_term_index.search("BOGEY")[0]
+    second_brevity_term = brevity_term_index.search("BOGEY")[0]
+
+    assert first_brevity_term is second_brevity_term
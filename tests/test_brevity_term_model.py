@@ -0,0 +1,111 @@
+# Copyright 2026 Niklas Glienke
+
+import dataclasses
+import gc
+
+import pytest
+
+from cvw22_operations_officer.models.brevity_term_model import (
+    BrevityTerm,
+    BrevityTermColumns,
+    BrevityTermRegistry,
+)
+
+
+def test_descriptions():
+    brevity_term = BrevityTerm("TERM 1", " DESCRIPTION 1 &DESCRIPTION 2 ")
+
+    assert brevity_term.descriptions == ("DESCRIPTION 1", "DESCRIPTION 2")
+
+
+def test_markdown():
+    brevity_term = BrevityTerm("TERM 1", "DESCRIPTION 1 & DESCRIPTION 2")
+
+    assert brevity_term.markdown == (
+        "### Brevity Term: `TERM 1`\n> DESCRIPTION 1\n> DESCRIPTION 2"
+    )
+
+
+def test_markdown_rendered_once():
+    brevity_term = BrevityTerm("TERM 1", "DESCRIPTION 1")
+
+    assert brevity_term.markdown is brevity_term.markdown
+
+
+def test_equality_ignores_rendering():
+    rendered_brevity_term = BrevityTerm("TERM 1", "DESCRIPTION 1")
+    rendered_brevity_term.markdown
+
+    assert rendered_brevity_term == BrevityTerm("TERM 1", "DESCRIPTION 1")
+
+
+def test_immutable_without_dict():
+    brevity_term = BrevityTerm("TERM 1", "DESCRIPTION 1")
+
+    assert not hasattr(brevity_term, "__dict__")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        brevity_term.term = "TERM 2"  # type: ignore[misc]
+
+
+def test_hash_ignores_rendering():
+    rendered_brevity_term = BrevityTerm("TERM 1", "DESCRIPTION 1")
+    rendered_brevity_term.markdown
+
+    assert hash(rendered_brevity_term) == hash(
+        BrevityTerm("TERM 1", "DESCRIPTION 1")
+    )
+
+
+def test_registry_reuses_brevity_term():
+    registry = BrevityTermRegistry()
+    brevity_term = registry.get(1, "TERM 1", "DESCRIPTION 1")
+
+    assert registry.get(1, "TERM 1", "DESCRIPTION 1") is brevity_term
+    assert registry.get(2, "TERM 1", "DESCRIPTION 1") is not brevity_term
+    assert len(registry) == 1
+
+
+def test_registry_replaces_changed_brevity_term():
+    registry = BrevityTermRegistry()
+    brevity_term = registry.get(1, "TERM 1", "DESCRIPTION 1")
+    changed_brevity_term = registry.get(1, "TERM 1", "DESCRIPTION 2")
+
+    assert changed_brevity_term is not brevity_term
+    assert changed_brevity_term.description == "DESCRIPTION 2"
+    assert registry.get(1, "TERM 1", "DESCRIPTION 2") is changed_brevity_term
+
+
+def test_registry_interns_terms():
+    registry = BrevityTermRegistry()
+    first_brevity_term = registry.get(1, "".join(("TERM", " 1")), "")
+    second_brevity_term = registry.get(2, "".join(("TERM", " 1")), "")
+
+    assert first_brevity_term.term is second_brevity_term.term
+
+
+def test_registry_drops_unreferenced_brevity_terms():
+    registry = BrevityTermRegistry()
+    registry.get(1, "TERM 1", "DESCRIPTION 1")
+    gc.collect()
+
+    assert len(registry) == 0
+
+
+def test_columns():
+    brevity_term_columns = BrevityTermColumns()
+    brevity_term_columns.append(1, "TERM 1", "DESCRIPTION 1")
+    brevity_term_columns.append(2, "TERM 2", "DESCRIPTION 2")
+
+    assert len(brevity_term_columns) == 2
+    assert brevity_term_columns.terms == ["TERM 1", "TERM 2"]
+    assert brevity_term_columns[1] == BrevityTerm("TERM 2", "DESCRIPTION 2")
+    assert brevity_term_columns[-1] is brevity_term_columns[1]
+    assert (
+        list(brevity_term_columns)
+        == brevity_term_columns[:]
+        == [
+            BrevityTerm("TERM 1", "DESCRIPTION 1"),
+            BrevityTerm("TERM 2", "DESCRIPTION 2"),
+        ]
+    )
@@ -1,6 +1,8 @@
 # Copyright 2025 Niklas Glienke
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -8,21 +10,16 @@ from cvw22_operations_officer.models.brevity_term_model import BrevityTerm
 from cvw22_operations_officer.services.brevity_term_service import (
     BrevityTermService,
 )
+from cvw22_operations_officer.utils.database import DatabaseManager
+from cvw22_operations_officer.utils.migrations import migrate
 
 
 @pytest.fixture
 def setup(tmp_path):
     db_path = tmp_path / "test.db"
+    migrate(db_path)
 
     with sqlite3.connect(db_path) as connection:
-        connection.execute(
-            "CREATE TABLE brevity_term ("
-            "brevity_term_id INTEGER PRIMARY KEY, "
-            "term TEXT NOT NULL, "
-            "description TEXT NOT NULL, "
-            "used_in_digest INTEGER NOT NULL)"
-        )
-
         connection.executemany(
             "INSERT INTO 'brevity_term' "
             "('term', 'description', 'used_in_digest') VALUES (?, ?, ?)",
@@ -39,47 +36,101 @@ def setup(tmp_path):
     return db_path
 
 
-def test_reset_used_in_digest(setup):
-    db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
+@pytest.fixture
+def overlapping_setup(setup):
+    # Several prefix matches of "b" also match its full-text search.
+    with sqlite3.connect(setup) as connection:
+        connection.executemany(
+            "INSERT INTO 'brevity_term' "
+            "('term', 'description', 'used_in_digest') VALUES (?, ?, ?)",
+            [
+                ("BLUR", "Blurred blips and bandits.", 0),
+                ("BUTTON", "A preset radio button.", 0),
+                ("BINGO", "Fuel state needed for recovery.", 0),
+                ("BLOWING THROUGH", "Continuing straight ahead.", 0),
+                ("BLIND", "No visual contact with a friendly aircraft.", 0),
+                ("BUDDY SPIKE", "Friendly aircraft air to air indication.", 0),
+                ("ABORT", "Cease action, break off the bombing run.", 0),
+                ("ANGELS", "Height of a friendly aircraft in thousands.", 0),
+            ],
+        )
 
-    with sqlite3.connect(db_path) as connection:
-        connection.execute("UPDATE brevity_term SET used_in_digest = 1")
+    return setup
+
+
+@pytest.fixture
+def database_manager(setup):
+    database_manager = DatabaseManager(setup)
 
-    brevity_term_service._reset_used_in_digest()
+    yield database_manager
 
+    database_manager.close()
+
+
+def get_digest_queue(db_path):
     with sqlite3.connect(db_path) as connection:
-        cursor = connection.cursor()
-        response = cursor.execute(
-            "SELECT COUNT(used_in_digest) "
-            "FROM brevity_term "
-            "WHERE used_in_digest = 0"
+        response = connection.execute(
+            "SELECT brevity_term.term FROM digest_queue "
+            "JOIN brevity_term USING (brevity_term_id) "
+            "ORDER BY digest_queue.position"
         )
-        num_of_unused_terms = response.fetchone()
+        return [term for (term,) in response.fetchall()]
 
-    assert num_of_unused_terms[0] == 6
 
+def get_digest_epoch(db_path):
+    with sqlite3.connect(db_path) as connection:
+        response = connection.execute("SELECT epoch FROM digest_state")
+        return response.fetchone()[0]
 
-def test_set_used_in_digest(setup):
-    db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
 
-    brevity_term_service._set_used_in_digest("TERM 6")
+def refill_digest_queue(brevity_term_service):
+    with brevity_term_service.database_manager.write() as connection:
+        brevity_term_service._refill_digest_queue(connection)
 
-    with sqlite3.connect(db_path) as connection:
-        cursor = connection.cursor()
-        response = cursor.execute(
-            "SELECT term FROM brevity_term WHERE used_in_digest = 1"
-        )
-        num_of_used_terms = response.fetchall()
 
-    for term in num_of_used_terms[0]:
-        assert term == "TERM 6"
+def test_refill_digest_queue(setup, database_manager):
+    db_path = setup
+    brevity_term_service = BrevityTermService(database_manager)
+
+    refill_digest_queue(brevity_term_service)
+
+    assert sorted(get_digest_queue(db_path)) == [
+        "TERM 1",
+        "TERM 2 [number]",
+        "TERM 3 EQ",
+        "TERM 6",
+        "TERM EQ 4",
+        "TERM EQ 5",
+    ]
+    assert get_digest_epoch(db_path) == 1
 
 
-def test_get_brevity_terms_by_term_valid(setup):
+def test_refill_digest_queue_shuffles(setup, database_manager):
     db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
+    brevity_term_service = BrevityTermService(database_manager)
+    rotations = set()
+
+    for _ in range(20):
+        refill_digest_queue(brevity_term_service)
+        rotations.add(tuple(get_digest_queue(db_path)))
+
+    assert len(rotations) > 1
+    assert get_digest_epoch(db_path) == 20
+
+
+def test_digest_does_not_notify_change_listeners(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+    listener = MagicMock()
+    brevity_term_service.add_change_listener(listener)
+
+    brevity_term_service.get_brevity_term_for_digest()
+    brevity_term_service.get_brevity_term_for_digest()
+
+    listener.assert_not_called()
+
+
+def test_get_brevity_terms_by_term_valid(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
 
     result = brevity_term_service.get_brevity_terms_by_term("EQ")
 
@@ -89,18 +140,16 @@ def test_get_brevity_terms_by_term_valid(setup):
         assert "EQ" in term.term
 
 
-def test_get_brevity_terms_by_term_invalid(setup):
-    db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
+def test_get_brevity_terms_by_term_invalid(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
 
     result = brevity_term_service.get_brevity_terms_by_term("NOT EQ")
 
     assert len(result) == 0
 
 
-def test_get_brevity_terms_by_term_limit(setup):
-    db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
+def test_get_brevity_terms_by_term_limit(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
 
     result = brevity_term_service.get_brevity_terms_by_term("EQ", 2)
 
@@ -110,22 +159,426 @@ def test_get_brevity_terms_by_term_limit(setup):
         assert term.term in ("TERM 3 EQ", "TERM EQ 4", "TERM EQ 5")
 
 
-def test_brevity_term_for_digest_all_unused(setup):
+def test_get_brevity_terms_by_term_ranking(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    result = brevity_term_service.get_brevity_terms_by_term("term eq")
+
+    assert [brevity_term.term for brevity_term in result] == [
+        "TERM EQ 4",
+        "TERM EQ 5",
+        "TERM 3 EQ",
+    ]
+
+
+def test_get_brevity_terms_by_term_exact_match_first(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    result = brevity_term_service.get_brevity_terms_by_term("TERM 6", 10)
+
+    assert result[0] == BrevityTerm("TERM 6", "DESCRIPTION 5")
+
+
+def test_get_brevity_terms_by_term_description(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    result = brevity_term_service.get_brevity_terms_by_term("[A/G]")
+
+    assert result == [
+        BrevityTerm("TERM 2 [number]", "[A/G] [MAR] DESCRIPTION 2")
+    ]
+
+
+def test_get_brevity_terms_by_term_no_words(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    result = brevity_term_service.get_brevity_terms_by_term("%")
+
+    assert result == []
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+@pytest.mark.parametrize("term", ["TERM", "description", "term eq"])
+def test_search_brevity_terms_pages(database_manager, use_index, term):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    if use_index:
+        brevity_term_service.load_term_index()
+
+    all_brevity_terms = brevity_term_service.get_brevity_terms_by_term(
+        term, 10
+    )
+    paged_brevity_terms = []
+    page = brevity_term_service.search_brevity_terms(term, 2)
+
+    while True:
+        assert len(page.results) <= 2
+        paged_brevity_terms.extend(page.brevity_terms)
+
+        if page.next_cursor is None:
+            break
+
+        page = brevity_term_service.search_brevity_terms(
+            term, 2, page.next_cursor
+        )
+
+    assert len(all_brevity_terms) > 2
+    assert paged_brevity_terms == all_brevity_terms
+
+
+def test_search_shares_brevity_terms(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+    brevity_term_service.load_term_index()
+
+    index_brevity_term = brevity_term_service.get_brevity_terms_by_term(
+        "TERM 1", 1
+    )[0]
+    (database_result,) = brevity_term_service._search_database("TERM 1", 1)
+
+    assert database_result.brevity_term is index_brevity_term
+
+
+def test_search_brevity_terms_last_page(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    page = brevity_term_service.search_brevity_terms("EQ", 3)
+
+    assert len(page.results) == 3
+    assert not page.has_more
+    assert page.next_cursor is None
+
+
+def test_get_brevity_terms_by_term_after_update(setup, database_manager):
     db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
+    brevity_term_service = BrevityTermService(database_manager)
 
-    result = brevity_term_service.get_brevity_term_for_digest()
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "UPDATE brevity_term SET description = 'UPDATED' "
+            "WHERE term = 'TERM 6'"
+        )
 
-    assert isinstance(result, BrevityTerm)
+    result = brevity_term_service.get_brevity_terms_by_term("updated")
+
+    assert result == [BrevityTerm("TERM 6", "UPDATED")]
+
+
+@pytest.mark.parametrize(
+    "term",
+    ["EQ", "term eq", "TERM 6", "[A/G]", "description", "NOT EQ", "b", "bl"],
+)
+@pytest.mark.parametrize("overlapping", [False, True])
+def test_get_brevity_terms_by_term_index_matches_database(
+    request, overlapping, term
+):
+    db_path = request.getfixturevalue(
+        "overlapping_setup" if overlapping else "setup"
+    )
+    database_manager = DatabaseManager(db_path)
+    brevity_term_service = BrevityTermService(database_manager)
+
+    database_result = brevity_term_service.get_brevity_terms_by_term(term, 25)
+    database_page = brevity_term_service.search_brevity_terms(term, 25)
+    brevity_term_service.load_term_index()
+    index_result = brevity_term_service.get_brevity_terms_by_term(term, 25)
+    index_page = brevity_term_service.search_brevity_terms(term, 25)
+    database_manager.close()
+
+    assert index_result == database_result
+    assert [result.cursor[:2] for result in index_page.results] == [
+        result.cursor[:2] for result in database_page.results
+    ]
+
+
+@pytest.mark.parametrize("index_first", [False, True])
+@pytest.mark.parametrize("term", ["b", "a", "friendly"])
+def test_search_brevity_terms_pages_across_backend_switch(
+    overlapping_setup, index_first, term
+):
+    database_manager = DatabaseManager(overlapping_setup)
+    brevity_term_service = BrevityTermService(database_manager)
+    brevity_term_service.load_term_index()
+    all_brevity_terms = brevity_term_service.get_brevity_terms_by_term(
+        term, 25
+    )
+
+    if not index_first:
+        brevity_term_service.mark_term_index_stale()
+
+    paged_brevity_terms = []
+    page = brevity_term_service.search_brevity_terms(term, 2)
+
+    while True:
+        paged_brevity_terms.extend(page.brevity_terms)
+
+        if page.next_cursor is None:
+            break
+
+        # Switch the backend between every page.
+        if brevity_term_service.is_term_index_stale:
+            brevity_term_service.load_term_index()
+        else:
+            brevity_term_service.mark_term_index_stale()
+
+        page = brevity_term_service.search_brevity_terms(
+            term, 2, page.next_cursor
+        )
+
+    database_manager.close()
 
+    assert len(all_brevity_terms) > 2
+    assert paged_brevity_terms == all_brevity_terms
 
-def test_brevity_term_for_digest_all_used(setup):
+
+def test_get_brevity_terms_by_term_stale_index(setup, database_manager):
     db_path = setup
-    brevity_term_service = BrevityTermService(db_path)
+    brevity_term_service = BrevityTermService(database_manager)
+    brevity_term_service.load_term_index()
 
     with sqlite3.connect(db_path) as connection:
-        connection.execute("UPDATE brevity_term SET used_in_digest = 1")
+        connection.execute(
+            "UPDATE brevity_term SET description = 'UPDATED' "
+            "WHERE term = 'TERM 6'"
+        )
+
+    assert brevity_term_service.get_brevity_terms_by_term("updated") == []
+
+    brevity_term_service.mark_term_index_stale()
+
+    assert brevity_term_service.is_term_index_stale
+    assert brevity_term_service.get_brevity_terms_by_term("updated") == [
+        BrevityTerm("TERM 6", "UPDATED")
+    ]
+
+    brevity_term_service.load_term_index()
+
+    assert not brevity_term_service.is_term_index_stale
+    assert brevity_term_service.get_brevity_terms_by_term("updated") == [
+        BrevityTerm("TERM 6", "UPDATED")
+    ]
+
+
+def test_reload_if_changed(setup, database_manager):
+    db_path = setup
+    listener = MagicMock()
+    brevity_term_service = BrevityTermService(database_manager)
+    brevity_term_service.add_change_listener(listener)
+    brevity_term_service.load_term_index()
+
+    assert not brevity_term_service.reload_if_changed()
+
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "UPDATE brevity_term SET description = 'UPDATED' "
+            "WHERE term = 'TERM 6'"
+        )
+
+    assert brevity_term_service.reload_if_changed()
+    assert brevity_term_service.get_brevity_terms_by_term("updated") == [
+        BrevityTerm("TERM 6", "UPDATED")
+    ]
+    listener.assert_called_once()
+    assert not brevity_term_service.reload_if_changed()
+
+
+def test_reload_if_changed_ignores_digest(setup, database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+    brevity_term_service.load_term_index()
+
+    brevity_term_service.get_brevity_term_for_digest()
+
+    assert not brevity_term_service.reload_if_changed()
+
+
+def test_reload_if_changed_stale_index(setup, database_manager):
+    listener = MagicMock()
+    brevity_term_service = BrevityTermService(database_manager)
+    brevity_term_service.add_change_listener(listener)
+
+    assert brevity_term_service.reload_if_changed()
+    assert not brevity_term_service.reload_if_changed()
+    assert brevity_term_service.is_term_index_stale
+    listener.assert_called_once()
+
+
+def test_suggest_brevity_terms(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    assert brevity_term_service.suggest_brevity_terms("TERM 7") == []
+
+    brevity_term_service.load_term_index()
+
+    assert brevity_term_service.suggest_brevity_terms("TERM 7", 1) == [
+        "TERM 1"
+    ]
+
+
+def test_complete_brevity_terms(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    assert brevity_term_service.complete_brevity_terms("TERM") == []
+
+    brevity_term_service.load_term_index()
+
+    assert brevity_term_service.complete_brevity_terms("term", 2) == [
+        "TERM 1",
+        "TERM 2 [number]",
+    ]
+
+
+def test_brevity_term_for_digest_all_unused(database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    result = brevity_term_service.get_brevity_term_for_digest()
+
+    assert isinstance(result, BrevityTerm)
+
+
+def test_brevity_term_for_digest_all_used(setup, database_manager):
+    db_path = setup
+    brevity_term_service = BrevityTermService(database_manager)
+
+    terms = [
+        brevity_term_service.get_brevity_term_for_digest().term
+        for _ in range(6)
+    ]
+
+    assert sorted(terms) == [
+        "TERM 1",
+        "TERM 2 [number]",
+        "TERM 3 EQ",
+        "TERM 6",
+        "TERM EQ 4",
+        "TERM EQ 5",
+    ]
+    assert get_digest_queue(db_path) == []
 
     result = brevity_term_service.get_brevity_term_for_digest()
 
     assert isinstance(result, BrevityTerm)
+    assert len(get_digest_queue(db_path)) == 5
+    assert get_digest_epoch(db_path) == 2
+    assert brevity_term_service._digest_resets.get() == 2
+
+
+def test_brevity_term_for_digest_follows_rotation(setup, database_manager):
+    db_path = setup
+    brevity_term_service = BrevityTermService(database_manager)
+    refill_digest_queue(brevity_term_service)
+    digest_queue = get_digest_queue(db_path)
+
+    result = brevity_term_service.get_brevity_term_for_digest()
+
+    assert result.term == digest_queue[0]
+    assert get_digest_queue(db_path) == digest_queue[1:]
+
+
+def test_brevity_term_for_digest_concurrent_callers(setup, database_manager):
+    db_path = setup
+    other_database_manager = DatabaseManager(db_path)
+    brevity_term_services = [
+        BrevityTermService(database_manager),
+        BrevityTermService(other_database_manager),
+    ]
+    refill_digest_queue(brevity_term_services[0])
+
+    def pick(i):
+        return brevity_term_services[i % 2].get_brevity_term_for_digest()
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(pick, range(6)))
+
+    other_database_manager.close()
+
+    assert len({brevity_term.term for brevity_term in results}) == 6
+    assert get_digest_queue(db_path) == []
+
+
+def test_digest_queue_cascades_deleted_term(setup, database_manager):
+    db_path = setup
+    brevity_term_service = BrevityTermService(database_manager)
+    refill_digest_queue(brevity_term_service)
+
+    with database_manager.write() as connection:
+        connection.execute("DELETE FROM brevity_term WHERE term = 'TERM 6'")
+
+    assert "TERM 6" not in get_digest_queue(db_path)
+
+
+def test_brevity_term_for_digest_no_terms(setup, database_manager):
+    db_path = setup
+    brevity_term_service = BrevityTermService(database_manager)
+
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("DELETE FROM brevity_term")
+
+    with pytest.raises(LookupError):
+        brevity_term_service.get_brevity_term_for_digest()
+
+    assert brevity_term_service._digest_resets.get() == 0
+
+
+def test_import_brevity_terms(setup, database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+    listener = MagicMock()
+    brevity_term_service.add_change_listener(listener)
+    brevity_term_service.load_term_index()
+
+    summary = brevity_term_service.import_brevity_terms(
+        iter(
+            [
+                BrevityTerm("term 1", "NEW DESCRIPTION 1"),
+                BrevityTerm("TERM 6", "DESCRIPTION 5"),
+                BrevityTerm("TERM 7", "DESCRIPTION 7"),
+                BrevityTerm("TERM 8", "OLD DESCRIPTION 8"),
+                BrevityTerm("TERM 8", "DESCRIPTION 8"),
+            ]
+        ),
+        batch_size=3,
+    )
+
+    assert summary == (2, 1)
+    assert summary.inserted == 2
+    assert summary.updated == 1
+    listener.assert_called_once()
+    assert not brevity_term_service.is_term_index_stale
+    assert brevity_term_service.get_brevity_terms_by_term("TERM 1") == [
+        BrevityTerm("term 1", "NEW DESCRIPTION 1")
+    ]
+    assert brevity_term_service.get_brevity_terms_by_term("TERM 8") == [
+        BrevityTerm("TERM 8", "DESCRIPTION 8")
+    ]
+    assert [
+        result.brevity_term
+        for result in brevity_term_service._search_database("NEW", 5)
+    ] == [BrevityTerm("term 1", "NEW DESCRIPTION 1")]
+
+
+def test_import_brevity_terms_unchanged(setup, database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+    listener = MagicMock()
+    brevity_term_service.add_change_listener(listener)
+
+    summary = brevity_term_service.import_brevity_terms(
+        [BrevityTerm("TERM 1", "[A/A] DESCRIPTION 1")]
+    )
+
+    assert summary == (0, 0)
+    listener.assert_not_called()
+    assert brevity_term_service.is_term_index_stale
+
+
+def test_export_brevity_terms(setup, database_manager):
+    brevity_term_service = BrevityTermService(database_manager)
+
+    result = list(brevity_term_service.export_brevity_terms())
+
+    assert [brevity_term.term for brevity_term in result] == [
+        "TERM 1",
+        "TERM 2 [number]",
+        "TERM 3 EQ",
+        "TERM 6",
+        "TERM EQ 4",
+        "TERM EQ 5",
+    ]
+    assert result[0] == BrevityTerm("TERM 1", "[A/A] DESCRIPTION 1")
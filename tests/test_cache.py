@@ -0,0 +1,90 @@
+# Copyright 2026 Niklas Glienke
+
+import pytest
+
+from cvw22_operations_officer.utils.cache import CacheInfo, LRUCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def timer():
+    return FakeTimer()
+
+
+def test_init_invalid_max_size():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
+
+
+def test_get_miss_and_hit(timer):
+    cache = LRUCache(timer=timer)
+
+    assert cache.get("key") is None
+
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.cache_info() == CacheInfo(1, 1, 0, 256, 1)
+
+
+def test_get_expired(timer):
+    cache = LRUCache(ttl_seconds=10.0, timer=timer)
+    cache.set("key", "value")
+
+    timer.now = 10.0
+
+    assert cache.get("key") is None
+    assert cache.cache_info() == CacheInfo(0, 1, 1, 256, 0)
+
+
+def test_set_evicts_least_recently_used(timer):
+    cache = LRUCache(max_size=2, timer=timer)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+    assert cache.cache_info().evictions == 1
+
+
+def test_set_overwrites_value(timer):
+    cache = LRUCache(timer=timer)
+    cache.set("key", "old")
+    cache.set("key", "new")
+
+    assert cache.get("key") == "new"
+    assert cache.cache_info().current_size == 1
+
+
+def test_clear(timer):
+    cache = LRUCache(timer=timer)
+    cache.set("key", "value")
+
+    cache.clear()
+
+    assert cache.get("key") is None
+    assert cache.cache_info().current_size == 0
+
+
+def test_set_skips_value_of_previous_generation(timer):
+    cache = LRUCache(timer=timer)
+    generation = cache.generation
+
+    cache.clear()
+    cache.set("key", "stale", generation)
+
+    assert cache.get("key") is None
+
+    cache.set("key", "value", cache.generation)
+
+    assert cache.get("key") == "value"
@@ -5,17 +5,31 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from cvw22_operations_officer.cogs.config_cog import ConfigCog
+from cvw22_operations_officer.models.config_model import BotConfig
 
 
 @pytest.fixture
-def mock_bot():
-    bot = MagicMock()
-
-    bot.config = {
-        "commands": {"config": True},
+def config_data():
+    return {
+        "commands": {"config": True, "brevity_term": True},
+        "tasks": {
+            "brevity_term_digest": {
+                "enabled": False,
+                "time": "12:00",
+                "timezone": "UTC",
+                "channel_id": 987654321,
+            }
+        },
         "admins": [{"name": "Admin 1", "id": 123456789}],
     }
 
+
+@pytest.fixture
+def mock_bot(config_data):
+    bot = MagicMock()
+
+    bot.config = BotConfig.from_dict(config_data)
+
     bot.get_config = MagicMock()
 
     return bot
@@ -43,9 +57,12 @@ async def test_config_command_invalid_command(mock_bot, mock_ctx):
 
 
 @pytest.mark.asyncio
-async def test_config_command_disabled_by_config(mock_bot, mock_ctx):
+async def test_config_command_disabled_by_config(
+    config_data, mock_bot, mock_ctx
+):
     mock_ctx.author.id = 123456789
-    mock_bot.config["commands"]["config"] = False
+    config_data["commands"]["config"] = False
+    mock_bot.config = BotConfig.from_dict(config_data)
 
     cog = ConfigCog(mock_bot)
 
@@ -88,7 +105,16 @@ async def test_config_command_show_success(mock_bot, mock_ctx):
         sent_message
         == """{
     "commands": {
-        "config": true
+        "config": true,
+        "brevity_term": true
+    },
+    "tasks": {
+        "brevity_term_digest": {
+            "enabled": false,
+            "time": "12:00",
+            "timezone": "UTC",
+            "channel_id": 987654321
+        }
     },
     "admins": [
         {
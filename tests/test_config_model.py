@@ -0,0 +1,242 @@
+# Copyright 2026 Niklas Glienke
+
+import copy
+import datetime
+from textwrap import dedent
+from zoneinfo import ZoneInfo
+
+import pytest
+import yaml
+
+from cvw22_operations_officer.models.config_model import (
+    BotConfig,
+    ConfigWatcherConfig,
+    DigestSchedule,
+    RateLimitConfig,
+    RateLimitsConfig,
+)
+
+CONFIG = {
+    "commands": {"config": True, "brevity_term": False},
+    "tasks": {
+        "brevity_term_digest": {
+            "enabled": True,
+            "channel_id": 1,
+            "time": "12:00",
+            "timezone": "UTC",
+        }
+    },
+    "admins": [
+        {"name": "Admin 1", "id": 10},
+        {"name": "Admin 2", "id": 20},
+    ],
+}
+
+
+@pytest.fixture
+def config_data():
+    return copy.deepcopy(CONFIG)
+
+
+def test_from_dict(config_data):
+    config = BotConfig.from_dict(config_data)
+
+    assert config.commands.config
+    assert not config.commands.brevity_term
+    assert config.admin_ids == frozenset({10, 20})
+    assert config.raw is config_data
+    assert config.commands.brevity_term_render == "markdown"
+    assert config.tasks.config_watcher == ConfigWatcherConfig(False, 5.0)
+    assert config.tasks.brevity_term_digest.schedules == (
+        DigestSchedule(datetime.time(12, 0), ZoneInfo("UTC"), (1,)),
+    )
+
+
+def test_from_dict_is_immutable(config_data):
+    config = BotConfig.from_dict(config_data)
+
+    with pytest.raises(AttributeError):
+        config.admin_ids = frozenset()  # type: ignore
+
+
+def test_digest_schedules_grouped(config_data):
+    config_data["tasks"]["brevity_term_digest"]["targets"] = [
+        {"channel_id": 1, "time": ["08:00", "12:00"]},
+        {"channel_id": 2},
+        {"channel_id": 3, "timezone": "Europe/Zurich"},
+    ]
+
+    schedules = BotConfig.from_dict(
+        config_data
+    ).tasks.brevity_term_digest.schedules
+
+    assert [
+        (schedule.name, schedule.channel_ids) for schedule in schedules
+    ] == [
+        ("08:00@UTC", (1,)),
+        ("12:00@UTC", (1, 2)),
+        ("12:00@Europe/Zurich", (3,)),
+    ]
+    assert schedules[1].timezone is schedules[0].timezone
+
+
+def test_config_watcher(config_data):
+    config_data["tasks"]["config_watcher"] = {
+        "enabled": True,
+        "interval_seconds": 2,
+    }
+
+    config = BotConfig.from_dict(config_data)
+
+    assert config.tasks.config_watcher == ConfigWatcherConfig(True, 2.0)
+
+
+def test_rate_limits(config_data):
+    config_data["rate_limits"] = {
+        "user": {"rate": 5, "per_seconds": 10},
+        "guild": {"rate": 60, "per_seconds": 2.5},
+    }
+
+    config = BotConfig.from_dict(config_data)
+
+    assert config.rate_limits == RateLimitsConfig(
+        user=RateLimitConfig(5, 10.0), guild=RateLimitConfig(60, 2.5)
+    )
+
+
+def test_rate_limits_default(config_data):
+    config = BotConfig.from_dict(config_data)
+
+    assert config.rate_limits == RateLimitsConfig()
+
+
+def test_ids_as_strings(config_data):
+    config_data["tasks"]["brevity_term_digest"]["targets"] = [
+        {"channel_id": "0123456789"}
+    ]
+    config_data["admins"] = [{"name": "Admin", "id": "10"}]
+
+    config = BotConfig.from_dict(config_data)
+
+    assert config.admin_ids == frozenset({10})
+    assert config.tasks.brevity_term_digest.schedules[0].channel_ids == (
+        123456789,
+    )
+
+
+def test_config_command_default(config_data):
+    del config_data["commands"]["config"]
+
+    assert BotConfig.from_dict(config_data).commands.config
+
+
+def test_legacy_admin_command(config_data, caplog):
+    del config_data["commands"]["config"]
+    config_data["commands"]["admin"] = False
+
+    assert not BotConfig.from_dict(config_data).commands.config
+    assert "'commands.admin' is deprecated" in caplog.text
+
+
+def test_legacy_template(caplog):
+    # The config template which was shipped before the config was validated.
+    config_data = yaml.safe_load(
+        dedent(
+            """
+            commands:
+              admin: true
+              brevity_term: true
+
+            tasks:
+              brevity_term_digest:
+                enabled: true
+                channel_id: 0123456789
+                time: "12:00"
+                timezone: "Europe/Zurich"
+
+            admins:
+              - name: "Test User"
+                id: 0123456789
+            """
+        )
+    )
+
+    config = BotConfig.from_dict(config_data)
+
+    assert config.commands.config
+    assert config.admin_ids == frozenset({123456789})
+    assert "'commands.admin' is deprecated" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "path, value, message",
+    [
+        (
+            ("commands",),
+            {"config": True},
+            "'commands.brevity_term' is missing",
+        ),
+        (("commands", "config"), "yes", "'commands.config' has an invalid"),
+        (
+            ("commands", "brevity_term_render"),
+            "html",
+            "must be one of markdown, embed",
+        ),
+        (("admins",), [{"name": "A", "id": True}], "'admins\\[0\\].id'"),
+        (
+            ("admins",),
+            [{"name": "A", "id": "1e3"}],
+            "'admins\\[0\\].id' must be a discord ID made of digits",
+        ),
+        (
+            ("tasks", "brevity_term_digest", "time"),
+            "25:00",
+            "invalid time: '25:00'",
+        ),
+        (
+            ("tasks", "brevity_term_digest", "timezone"),
+            "Mars/Olympus",
+            "unknown timezone: 'Mars/Olympus'",
+        ),
+        (
+            ("tasks", "brevity_term_digest", "targets"),
+            {"channel_id": 1},
+            "'tasks.brevity_term_digest.targets' must be a list",
+        ),
+        (
+            ("rate_limits",),
+            {"member": {"rate": 1, "per_seconds": 1}},
+            "'rate_limits.member' is not one of user, channel, guild",
+        ),
+        (
+            ("rate_limits",),
+            {"user": {"rate": 0, "per_seconds": 1}},
+            "'rate_limits.user.rate' must be positive",
+        ),
+        (
+            ("rate_limits",),
+            {"channel": {"rate": 1, "per_seconds": 0}},
+            "'rate_limits.channel.per_seconds' must be positive",
+        ),
+        (
+            ("tasks", "config_watcher"),
+            {"enabled": True, "interval_seconds": 0},
+            "must be positive",
+        ),
+    ],
+)
+def test_from_dict_invalid(config_data, path, value, message):
+    section = config_data
+
+    for key in path[:-1]:
+        section = section[key]
+
+    section[path[-1]] = value
+
+    with pytest.raises(ValueError, match=message):
+        BotConfig.from_dict(config_data)
+
+
+def test_from_dict_not_a_mapping():
+    with pytest.raises(ValueError, match="must be a mapping"):
+        BotConfig.from_dict(None)
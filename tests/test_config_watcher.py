@@ -0,0 +1,87 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from cvw22_operations_officer.utils.config_watcher import (
+    ConfigWatcher,
+    get_file_signature,
+)
+
+
+def touch(path, content):
+    path.write_text(content)
+    stat_result = os.stat(path)
+    os.utime(
+        path,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000),
+    )
+
+
+def test_get_file_signature(tmp_path):
+    path = tmp_path / "config.yaml"
+
+    assert get_file_signature(path) is None
+
+    path.write_text("test")
+
+    assert get_file_signature(path) == (os.stat(path).st_mtime_ns, 4)
+
+
+def test_check(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("first")
+    callback = MagicMock()
+    config_watcher = ConfigWatcher(path, callback)
+
+    assert not config_watcher.check()
+
+    touch(path, "second")
+
+    assert config_watcher.check()
+    assert not config_watcher.check()
+    callback.assert_called_once()
+
+
+def test_check_deleted_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("first")
+    callback = MagicMock()
+    config_watcher = ConfigWatcher(path, callback)
+
+    path.unlink()
+
+    assert not config_watcher.check()
+
+    path.write_text("second")
+
+    assert config_watcher.check()
+    callback.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("first")
+    callback = MagicMock(side_effect=[RuntimeError("Invalid"), None])
+    config_watcher = ConfigWatcher(path, callback)
+
+    config_watcher.start(0.01)
+    config_watcher.start(0.01)
+
+    assert config_watcher.is_running()
+
+    touch(path, "second")
+    await asyncio.sleep(0.05)
+    touch(path, "third")
+    await asyncio.sleep(0.05)
+
+    assert callback.call_count == 2
+
+    await config_watcher.stop()
+    await config_watcher.stop()
+
+    assert not config_watcher.is_running()
@@ -0,0 +1,357 @@
+# Copyright 2026 Niklas Glienke
+
+import sqlite3
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from cvw22_operations_officer.utils.database import (
+    DatabaseManager,
+    ReplicatedDatabaseManager,
+)
+from cvw22_operations_officer.utils.migrations import migrate
+
+
+@pytest.fixture
+def database_manager(tmp_path):
+    database_manager = DatabaseManager(tmp_path / "test.db", read_pool_size=2)
+
+    with database_manager.write() as connection:
+        connection.execute("CREATE TABLE test (value INTEGER NOT NULL)")
+
+    yield database_manager
+
+    database_manager.close()
+
+
+@pytest.fixture
+def replicated_database_manager(tmp_path):
+    database_manager = ReplicatedDatabaseManager(
+        tmp_path / "test.db", read_pool_size=2, replica_lock_timeout=0.01
+    )
+
+    with database_manager.write() as connection:
+        connection.execute("CREATE TABLE test (value INTEGER NOT NULL)")
+
+    yield database_manager
+
+    database_manager.close()
+
+
+def get_values(database_manager):
+    with database_manager.read() as connection:
+        response = connection.execute("SELECT value FROM test ORDER BY value")
+
+        return response.fetchall()
+
+
+def test_init_invalid_read_pool_size(tmp_path):
+    with pytest.raises(ValueError):
+        DatabaseManager(tmp_path / "test.db", read_pool_size=0)
+
+
+def test_write_enables_wal_mode(database_manager):
+    with database_manager.read() as connection:
+        response = connection.execute("PRAGMA journal_mode")
+        journal_mode = response.fetchone()
+
+    assert journal_mode[0] == "wal"
+
+
+def test_write_commits(database_manager):
+    with database_manager.write() as connection:
+        connection.execute("INSERT INTO test (value) VALUES (1)")
+
+    with database_manager.read() as connection:
+        response = connection.execute("SELECT value FROM test")
+        values = response.fetchall()
+
+    assert values == [(1,)]
+
+
+def test_write_rolls_back_on_exception(database_manager):
+    with pytest.raises(RuntimeError):
+        with database_manager.write() as connection:
+            connection.execute("INSERT INTO test (value) VALUES (1)")
+            raise RuntimeError("Test Error.")
+
+    with database_manager.read() as connection:
+        response = connection.execute("SELECT COUNT(*) FROM test")
+        count = response.fetchone()
+
+    assert count[0] == 0
+
+
+def test_read_is_query_only(database_manager):
+    with pytest.raises(sqlite3.OperationalError):
+        with database_manager.read() as connection:
+            connection.execute("INSERT INTO test (value) VALUES (1)")
+
+
+def test_read_reuses_pooled_connection(database_manager):
+    with database_manager.read() as connection:
+        first_connection = connection
+
+    with database_manager.read() as connection:
+        second_connection = connection
+
+    assert first_connection is second_connection
+
+
+def test_close(database_manager):
+    with database_manager.read() as connection:
+        pooled_connection = connection
+
+    database_manager.close()
+    database_manager.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        pooled_connection.execute("SELECT 1")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with database_manager.read():
+            pass
+
+
+def test_close_borrowed_connection(database_manager):
+    with database_manager.read() as connection:
+        database_manager.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+
+
+def test_replica_reads_from_memory(replicated_database_manager):
+    with replicated_database_manager.read() as connection:
+        response = connection.execute("PRAGMA database_list")
+        (_, _, file), *_ = response.fetchall()
+
+    assert file == ""
+
+
+def test_replica_write_commits(replicated_database_manager, tmp_path):
+    with replicated_database_manager.write() as connection:
+        connection.execute("INSERT INTO test (value) VALUES (1)")
+
+    assert get_values(replicated_database_manager) == [(1,)]
+
+    with sqlite3.connect(tmp_path / "test.db") as connection:
+        values = connection.execute("SELECT value FROM test").fetchall()
+
+    assert values == [(1,)]
+
+
+def test_replica_write_rolls_back_on_exception(replicated_database_manager):
+    assert get_values(replicated_database_manager) == []
+    generation = replicated_database_manager.generation
+
+    with pytest.raises(RuntimeError):
+        with replicated_database_manager.write() as connection:
+            connection.execute("INSERT INTO test (value) VALUES (1)")
+            raise RuntimeError("Test Error.")
+
+    assert get_values(replicated_database_manager) == []
+    assert replicated_database_manager.generation == generation
+
+
+def test_replica_read_is_query_only(replicated_database_manager):
+    with pytest.raises(sqlite3.OperationalError):
+        with replicated_database_manager.read() as connection:
+            connection.execute("INSERT INTO test (value) VALUES (1)")
+
+
+def test_replica_reuses_generation(replicated_database_manager):
+    with replicated_database_manager.read() as connection:
+        first_connection = connection
+
+    with replicated_database_manager.read() as connection:
+        second_connection = connection
+
+    assert first_connection is second_connection
+    assert replicated_database_manager.generation == 1
+
+
+def test_replica_syncs_changes_of_other_processes(
+    replicated_database_manager, tmp_path
+):
+    assert get_values(replicated_database_manager) == []
+
+    with sqlite3.connect(tmp_path / "test.db") as connection:
+        connection.execute("INSERT INTO test (value) VALUES (2)")
+
+    connection.close()
+
+    assert get_values(replicated_database_manager) == [(2,)]
+    assert replicated_database_manager.generation == 2
+
+
+def test_replica_applies_writes_incrementally(replicated_database_manager):
+    assert get_values(replicated_database_manager) == []
+
+    with replicated_database_manager.write() as connection:
+        connection.executemany(
+            "INSERT INTO test (value) VALUES (?)", [(1,), (2,), (3,)]
+        )
+
+    with replicated_database_manager.write() as connection:
+        connection.execute("UPDATE test SET value = 4 WHERE value = 1")
+        connection.execute("DELETE FROM test WHERE value = 2")
+
+    assert get_values(replicated_database_manager) == [(3,), (4,)]
+    assert replicated_database_manager.generation == 1
+
+
+def test_replica_fires_triggers(replicated_database_manager):
+    with replicated_database_manager.write() as connection:
+        connection.executescript(
+            """
+            CREATE TABLE total (value INTEGER NOT NULL);
+            INSERT INTO total (value) VALUES (0);
+            CREATE TRIGGER test_insert AFTER INSERT ON test BEGIN
+                UPDATE total SET value = value + new.value;
+            END;
+            CREATE TABLE pair (
+                first INTEGER, second INTEGER, PRIMARY KEY (first, second)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    assert get_values(replicated_database_manager) == []
+
+    with replicated_database_manager.write() as connection:
+        connection.execute("INSERT INTO test (value) VALUES (2)")
+        connection.execute("INSERT INTO pair (first, second) VALUES (1, 2)")
+
+    with replicated_database_manager.read() as connection:
+        total = connection.execute("SELECT value FROM total").fetchone()
+        pairs = connection.execute("SELECT * FROM pair").fetchall()
+
+    assert total == (2,)
+    assert pairs == [(1, 2)]
+    assert replicated_database_manager.generation == 1
+
+
+def test_replica_copies_new_generation_if_locked(replicated_database_manager):
+    assert get_values(replicated_database_manager) == []
+
+    with replicated_database_manager.read() as connection:
+        # An open read transaction locks the tables of the shared cache.
+        connection.execute("BEGIN")
+        assert connection.execute("SELECT value FROM test").fetchall() == []
+
+        with replicated_database_manager.write() as write_connection:
+            write_connection.execute("INSERT INTO test (value) VALUES (1)")
+
+        # The borrowed connection keeps reading the previous generation.
+        assert connection.execute("SELECT value FROM test").fetchall() == []
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+
+    assert get_values(replicated_database_manager) == [(1,)]
+    assert replicated_database_manager.generation == 2
+
+
+@pytest.mark.parametrize(
+    "apply_changes",
+    [
+        MagicMock(return_value=False),
+        MagicMock(side_effect=sqlite3.OperationalError("Test Error.")),
+    ],
+)
+def test_replica_copies_new_generation_if_not_applied(
+    replicated_database_manager, monkeypatch, apply_changes
+):
+    assert get_values(replicated_database_manager) == []
+    monkeypatch.setattr(
+        replicated_database_manager, "_apply_changes", apply_changes
+    )
+
+    with replicated_database_manager.write() as connection:
+        connection.execute("INSERT INTO test (value) VALUES (1)")
+
+    assert get_values(replicated_database_manager) == [(1,)]
+    assert replicated_database_manager.generation == 2
+
+
+def test_replica_reads_while_writes_are_applied(tmp_path):
+    migrate(tmp_path / "test.db")
+    database_manager = ReplicatedDatabaseManager(tmp_path / "test.db")
+    errors = []
+    is_writing = threading.Event()
+    is_writing.set()
+
+    def write():
+        try:
+            for i in range(200):
+                with database_manager.write() as connection:
+                    connection.execute(
+                        "INSERT INTO brevity_term "
+                        "(term, description, used_in_digest) "
+                        "VALUES (?, ?, 0)",
+                        (f"BOGEY {i}", "Unknown contact."),
+                    )
+                    connection.execute(
+                        "UPDATE brevity_term SET description = ? "
+                        "WHERE term = ?",
+                        ("Unidentified contact.", f"BOGEY {i // 2}"),
+                    )
+        finally:
+            is_writing.clear()
+
+    def read():
+        while is_writing.is_set():
+            try:
+                with database_manager.read() as connection:
+                    connection.execute(
+                        "SELECT term FROM brevity_term WHERE term LIKE 'BO%'"
+                    ).fetchall()
+                    connection.execute(
+                        "SELECT rowid FROM brevity_term_fts "
+                        "WHERE brevity_term_fts MATCH 'bogey'"
+                    ).fetchall()
+            except sqlite3.Error as e:
+                errors.append(e)
+
+            time.sleep(0)
+
+    # Load the replica, so the writes are applied to it.
+    with database_manager.read():
+        pass
+
+    threads = [threading.Thread(target=write)] + [
+        threading.Thread(target=read) for _ in range(3)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    with database_manager.read() as connection:
+        count = connection.execute(
+            "SELECT COUNT(*) FROM brevity_term WHERE term LIKE 'BOGEY %'"
+        ).fetchone()
+
+    database_manager.close()
+
+    assert errors == []
+    assert count == (200,)
+
+
+def test_replica_close(replicated_database_manager):
+    with replicated_database_manager.read() as connection:
+        pooled_connection = connection
+
+    replicated_database_manager.close()
+    replicated_database_manager.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        pooled_connection.execute("SELECT 1")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with replicated_database_manager.read():
+            pass
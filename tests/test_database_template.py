@@ -0,0 +1,108 @@
+# Copyright 2026 Niklas Glienke
+
+import shutil
+import sqlite3
+
+import pytest
+
+from cvw22_operations_officer.utils.database_template import (
+    MIGRATIONS_DIR,
+    SEED_PATH,
+    TEMPLATE_PATH,
+    build_database_template,
+    get_checksum_path,
+    get_source_checksum,
+    restore_database_template,
+)
+from cvw22_operations_officer.utils.migrations import get_migrations
+
+
+@pytest.fixture
+def sources(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    shutil.copytree(MIGRATIONS_DIR, migrations_dir)
+    seed_path = tmp_path / "brevity_term.sql"
+    seed_path.write_text(
+        "INSERT INTO brevity_term (term, description, used_in_digest) "
+        "VALUES ('BOGEY', 'Unknown contact.', 0), "
+        "('BANDIT', 'Enemy aircraft.', 0);"
+    )
+
+    return migrations_dir, seed_path
+
+
+def get_terms(db_path):
+    with sqlite3.connect(db_path) as connection:
+        response = connection.execute(
+            "SELECT term FROM brevity_term ORDER BY term"
+        )
+        return [term for (term,) in response.fetchall()]
+
+
+def test_shipped_template_matches_sources():
+    # Rebuild an outdated template with:
+    # python -m cvw22_operations_officer.utils.database_template
+    checksum = get_checksum_path(TEMPLATE_PATH).read_text().strip()
+
+    assert checksum == get_source_checksum()
+
+
+def test_get_source_checksum_changes_with_sources(sources):
+    migrations_dir, seed_path = sources
+    checksum = get_source_checksum(migrations_dir, seed_path)
+
+    assert get_source_checksum(migrations_dir, seed_path) == checksum
+
+    seed_path.write_text(seed_path.read_text() + "\n")
+
+    assert get_source_checksum(migrations_dir, seed_path) != checksum
+
+
+def test_build_and_restore_database_template(tmp_path, sources):
+    migrations_dir, seed_path = sources
+    template_path = tmp_path / "template.db"
+    db_path = tmp_path / "new.db"
+
+    checksum = build_database_template(
+        template_path, migrations_dir, seed_path
+    )
+
+    assert get_checksum_path(template_path).read_text() == f"{checksum}\n"
+    assert restore_database_template(
+        db_path, template_path, migrations_dir, seed_path
+    )
+    assert get_terms(db_path) == ["BANDIT", "BOGEY"]
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("PRAGMA user_version").fetchone() == (
+            len(get_migrations(migrations_dir)),
+        )
+        assert connection.execute(
+            "SELECT term FROM brevity_term_fts WHERE brevity_term_fts "
+            "MATCH 'enemy'"
+        ).fetchall() == [("BANDIT",)]
+
+    assert not (tmp_path / "new.db.restore").exists()
+
+
+def test_restore_database_template_outdated(tmp_path, sources):
+    migrations_dir, seed_path = sources
+    template_path = tmp_path / "template.db"
+    db_path = tmp_path / "new.db"
+    build_database_template(template_path, migrations_dir, seed_path)
+
+    seed_path.write_text(seed_path.read_text() + "\n")
+
+    assert not restore_database_template(
+        db_path, template_path, migrations_dir, seed_path
+    )
+    assert not db_path.exists()
+
+
+def test_restore_database_template_missing(tmp_path):
+    db_path = tmp_path / "new.db"
+
+    assert not restore_database_template(
+        db_path, tmp_path / "template.db", MIGRATIONS_DIR, SEED_PATH
+    )
+    assert not db_path.exists()
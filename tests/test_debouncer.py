@@ -0,0 +1,57 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+
+import pytest
+
+from cvw22_operations_officer.utils.debouncer import Debouncer
+
+
+@pytest.mark.asyncio
+async def test_wait_lets_latest_call_through():
+    debouncer = Debouncer(0.01)
+
+    first_task = asyncio.create_task(debouncer.wait("key"))
+    await asyncio.sleep(0)
+    second_task = asyncio.create_task(debouncer.wait("key"))
+
+    assert await asyncio.gather(first_task, second_task) == [False, True]
+    assert debouncer.superseded_calls == 1
+    assert len(debouncer) == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_separates_keys():
+    debouncer = Debouncer(0.01)
+
+    results = await asyncio.gather(
+        debouncer.wait("first"), debouncer.wait("second")
+    )
+
+    assert results == [True, True]
+    assert debouncer.superseded_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_after_delay():
+    debouncer = Debouncer(0)
+
+    assert await debouncer.wait("key")
+    assert await debouncer.wait("key")
+
+
+@pytest.mark.asyncio
+async def test_wait_cancelled_releases_key():
+    debouncer = Debouncer(1)
+
+    task = asyncio.create_task(debouncer.wait("key"))
+    await asyncio.sleep(0)
+
+    assert len(debouncer) == 1
+
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(debouncer) == 0
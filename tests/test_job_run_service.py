@@ -0,0 +1,78 @@
+# Copyright 2026 Niklas Glienke
+
+import datetime
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from cvw22_operations_officer.services.job_run_service import JobRunService
+from cvw22_operations_officer.utils.database import DatabaseManager
+from cvw22_operations_officer.utils.migrations import migrate
+
+DUE_AT = datetime.datetime(2025, 1, 1, 11, 0, tzinfo=datetime.UTC)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    db_path = tmp_path / "test.db"
+    migrate(db_path)
+
+    return db_path
+
+
+@pytest.fixture
+def database_manager(db_path):
+    database_manager = DatabaseManager(db_path)
+
+    yield database_manager
+
+    database_manager.close()
+
+
+def test_claim_job_run_once(database_manager):
+    job_run_service = JobRunService(database_manager)
+
+    assert job_run_service.claim_job_run("job", DUE_AT)
+    assert not job_run_service.claim_job_run(
+        "job", DUE_AT.astimezone(ZoneInfo("Europe/Zurich"))
+    )
+    assert job_run_service.claim_job_run("other job", DUE_AT)
+    assert job_run_service.claim_job_run(
+        "job", DUE_AT + datetime.timedelta(days=1)
+    )
+
+
+def test_claim_job_run_across_managers(db_path, database_manager):
+    other_database_manager = DatabaseManager(db_path)
+    job_run_services = [
+        JobRunService(database_manager),
+        JobRunService(other_database_manager),
+    ]
+
+    with ThreadPoolExecutor(2) as executor:
+        results = list(
+            executor.map(
+                lambda service: service.claim_job_run("job", DUE_AT),
+                job_run_services,
+            )
+        )
+
+    other_database_manager.close()
+
+    assert sorted(results) == [False, True]
+
+
+def test_claim_job_run_removes_old_claims(db_path, database_manager):
+    job_run_service = JobRunService(
+        database_manager, retention=datetime.timedelta(days=1)
+    )
+
+    job_run_service.claim_job_run("job", DUE_AT)
+    job_run_service.claim_job_run("job", DUE_AT + datetime.timedelta(days=2))
+
+    with sqlite3.connect(db_path) as connection:
+        count = connection.execute("SELECT COUNT(*) FROM job_run").fetchone()
+
+    assert count == (1,)
@@ -0,0 +1,143 @@
+# Copyright 2026 Niklas Glienke
+
+import json
+import logging
+import sys
+import threading
+
+import pytest
+
+from cvw22_operations_officer.utils.log_handlers import (
+    JsonFormatter,
+    RateLimitFilter,
+    SuppressedFormatter,
+    start_queue_logging,
+)
+
+
+def make_record(level=logging.INFO, lineno=1, msg="Test %s.", args=("a",)):
+    return logging.LogRecord(
+        "cvw22_operations_officer.test",
+        level,
+        "/test/module.py",
+        lineno,
+        msg,
+        args,
+        None,
+    )
+
+
+class Timer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limit_filter():
+    timer = Timer()
+    rate_limit_filter = RateLimitFilter(rate=2, period_seconds=10, timer=timer)
+
+    assert rate_limit_filter.filter(make_record())
+    assert rate_limit_filter.filter(make_record())
+    assert not rate_limit_filter.filter(make_record())
+    assert not rate_limit_filter.filter(make_record())
+    assert rate_limit_filter.filter(make_record(lineno=2))
+
+    timer.now = 10.0
+    record = make_record()
+
+    assert rate_limit_filter.filter(record)
+    assert record.suppressed == 2
+
+
+def test_rate_limit_filter_never_drops_errors():
+    rate_limit_filter = RateLimitFilter(rate=1, timer=Timer())
+
+    assert rate_limit_filter.filter(make_record(logging.ERROR))
+    assert rate_limit_filter.filter(make_record(logging.ERROR))
+    assert rate_limit_filter.filter(make_record(logging.CRITICAL))
+
+
+def test_suppressed_formatter():
+    formatter = SuppressedFormatter("%(levelname)s: %(message)s")
+    record = make_record()
+
+    assert formatter.format(record) == "INFO: Test a."
+
+    record.suppressed = 3
+
+    assert formatter.format(record) == (
+        "INFO: Test a. (3 similar messages suppressed)"
+    )
+
+
+def test_json_formatter():
+    record = make_record(logging.WARNING)
+    record.suppressed = 2
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "cvw22_operations_officer.test"
+    assert entry["file"] == "module.py"
+    assert entry["line"] == 1
+    assert entry["message"] == "Test a."
+    assert entry["suppressed"] == 2
+    assert entry["time"].endswith("+00:00")
+
+
+def test_json_formatter_exception():
+    try:
+        raise RuntimeError("Test Error.")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "test", logging.ERROR, "test.py", 1, "Failed.", (), None
+        )
+        record.exc_info = sys.exc_info()
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert "RuntimeError: Test Error." in entry["exception"]
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.threads.add(threading.get_ident())
+        self.records.append(self.format(record))
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("cvw22_operations_officer.test_queue")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    yield logger
+
+    logger.handlers.clear()
+
+
+def test_start_queue_logging(logger):
+    handler = RecordingHandler()
+    handler.setFormatter(SuppressedFormatter("%(message)s"))
+
+    listener = start_queue_logging(
+        logger, handler, RateLimitFilter(rate=1, timer=Timer())
+    )
+
+    for number in range(3):
+        logger.info("Message %d.", number)
+
+    logger.error("Error.")
+    listener.stop()
+    listener.stop()
+
+    assert handler.records == ["Message 0.", "Error."]
+    assert threading.get_ident() not in handler.threads
@@ -4,7 +4,12 @@ import sqlite3
 
 import pytest
 
-from cvw22_operations_officer.__main__ import setup_config_dir
+from cvw22_operations_officer.__main__ import (
+    export_brevity_terms,
+    get_shard_ranges,
+    import_brevity_terms,
+    setup_config_dir,
+)
 
 
 def test_setup_config_dir_success(tmp_path):
@@ -39,9 +44,59 @@ def test_setup_config_dir_db_path_exists(tmp_path):
 
     with sqlite3.connect(db_path) as connection:
         cursor = connection.cursor()
-        response = cursor.execute(
-            "SELECT * FROM sqlite_master WHERE type='table';"
+        response = cursor.execute("SELECT COUNT(*) FROM brevity_term")
+
+        assert response.fetchone() == (0,)
+
+
+def test_setup_config_dir_seeds_new_db_once(tmp_path):
+    setup_config_dir(tmp_path)
+
+    with sqlite3.connect(tmp_path / "cvw22_operations_officer.db") as con:
+        count = con.execute("SELECT COUNT(*) FROM brevity_term").fetchone()
+
+    setup_config_dir(tmp_path)
+
+    with sqlite3.connect(tmp_path / "cvw22_operations_officer.db") as con:
+        assert con.execute("SELECT COUNT(*) FROM brevity_term").fetchone() == (
+            count
         )
-        tables = response.fetchall()
+        assert count[0] > 0
 
-        assert tables == []
+
+def test_import_and_export_brevity_terms(tmp_path):
+    setup_config_dir(tmp_path)
+    import_path = tmp_path / "import.jsonl"
+    import_path.write_text(
+        '{"term": "BOGEY", "description": "Updated."}\n'
+        '{"term": "NEW TERM", "description": "New."}\n'
+    )
+    export_path = tmp_path / "export.csv"
+
+    summary = import_brevity_terms(tmp_path, import_path, batch_size=1)
+    count = export_brevity_terms(tmp_path, export_path)
+
+    assert summary == (1, 1)
+    lines = export_path.read_text().splitlines()
+    assert count == len(lines) - 1
+    assert "BOGEY,Updated." in lines
+    assert "NEW TERM,New." in lines
+
+
+@pytest.mark.parametrize(
+    "shard_count, processes, shard_ranges",
+    [
+        (1, 1, [[0]]),
+        (4, 2, [[0, 1], [2, 3]]),
+        (5, 3, [[0, 1], [2, 3], [4]]),
+        (3, 3, [[0], [1], [2]]),
+    ],
+)
+def test_get_shard_ranges(shard_count, processes, shard_ranges):
+    assert get_shard_ranges(shard_count, processes) == shard_ranges
+
+
+@pytest.mark.parametrize("shard_count, processes", [(2, 3), (2, 0)])
+def test_get_shard_ranges_invalid(shard_count, processes):
+    with pytest.raises(ValueError, match="Cannot split"):
+        get_shard_ranges(shard_count, processes)
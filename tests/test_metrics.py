@@ -0,0 +1,165 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import math
+
+import pytest
+
+from cvw22_operations_officer.utils.metrics import (
+    MetricsRegistry,
+    MetricsServer,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter(registry):
+    counter = registry.counter("test_events", "Test events.", ("kind",))
+
+    counter.inc("a")
+    counter.inc("a", amount=2)
+    counter.inc("b")
+
+    assert counter.get("a") == 3
+    assert registry.render() == (
+        "# HELP test_events_total Test events.\n"
+        "# TYPE test_events_total counter\n"
+        'test_events_total{kind="a"} 3.0\n'
+        'test_events_total{kind="b"} 1.0\n'
+    )
+
+
+def test_counter_function(registry):
+    counter = registry.counter("test_events", "Test events.")
+    counter.set_function(lambda: 5)
+
+    assert counter.get() == 5
+    assert registry.render().endswith("test_events_total 5.0\n")
+
+
+def test_counter_only_increases(registry):
+    counter = registry.counter("test_events", "Test events.")
+
+    with pytest.raises(ValueError):
+        counter.inc(amount=-1)
+
+
+def test_wrong_label_values(registry):
+    counter = registry.counter("test_events", "Test events.", ("kind",))
+
+    with pytest.raises(ValueError, match="expects the labels"):
+        counter.inc()
+
+
+def test_gauge(registry):
+    gauge = registry.gauge("test_value", "Test value.", ("kind",))
+
+    gauge.set(1.5, "set")
+    gauge.set_function(lambda: math.inf, "function")
+
+    assert gauge.get("set") == 1.5
+    assert gauge.get("function") == math.inf
+    assert registry.render() == (
+        "# HELP test_value Test value.\n"
+        "# TYPE test_value gauge\n"
+        'test_value{kind="function"} +Inf\n'
+        'test_value{kind="set"} 1.5\n'
+    )
+
+
+def test_histogram(registry):
+    histogram = registry.histogram(
+        "test_duration_seconds", "Test duration.", buckets=(0.1, 1.0)
+    )
+
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(5.0)
+
+    assert histogram.get_count() == 3
+    assert registry.render() == (
+        "# HELP test_duration_seconds Test duration.\n"
+        "# TYPE test_duration_seconds histogram\n"
+        'test_duration_seconds_bucket{le="0.1"} 2.0\n'
+        'test_duration_seconds_bucket{le="1.0"} 2.0\n'
+        'test_duration_seconds_bucket{le="+Inf"} 3.0\n'
+        "test_duration_seconds_sum 5.15\n"
+        "test_duration_seconds_count 3.0\n"
+    )
+
+
+def test_histogram_time(registry):
+    histogram = registry.histogram("test_duration_seconds", "", ("kind",))
+
+    with pytest.raises(RuntimeError):
+        with histogram.time("failed"):
+            raise RuntimeError
+
+    assert histogram.get_count("failed") == 1
+    assert histogram.get_count("other") == 0
+
+
+def test_histogram_unsorted_buckets(registry):
+    with pytest.raises(ValueError):
+        registry.histogram("test_duration_seconds", "", buckets=(1.0, 0.1))
+
+
+def test_register_existing_metric(registry):
+    counter = registry.counter("test_events", "Test events.", ("kind",))
+
+    assert registry.counter("test_events", "Test events.", ("kind",)) is (
+        counter
+    )
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("test_events", "Test events.", ("kind",))
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("test_events", "Test events.")
+
+
+def test_escape_label_values(registry):
+    counter = registry.counter("test_events", "Test events.", ("kind",))
+
+    counter.inc('a"b\\c\nd')
+
+    assert 'test_events_total{kind="a\\"b\\\\c\\nd"} 1.0' in (
+        registry.render()
+    )
+
+
+async def request(server, request_line):
+    host, port = server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"{request_line}\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    return response.decode()
+
+
+@pytest.mark.asyncio
+async def test_metrics_server(registry):
+    registry.counter("test_events", "Test events.").inc()
+    server = MetricsServer(registry, "127.0.0.1", 0)
+    await server.start()
+
+    try:
+        response = await request(server, "GET /metrics HTTP/1.1")
+        not_found = await request(server, "GET / HTTP/1.1")
+        not_allowed = await request(server, "POST /metrics HTTP/1.1")
+    finally:
+        await server.stop()
+        await server.stop()
+
+    assert response.startswith("HTTP/1.0 200 OK\r\n")
+    assert "Content-Type: text/plain; version=0.0.4" in response
+    assert response.endswith("test_events_total 1.0\n")
+    assert not_found.startswith("HTTP/1.0 404 Not Found\r\n")
+    assert not_allowed.startswith("HTTP/1.0 405 Method Not Allowed\r\n")
+    assert server.sockets == ()
@@ -0,0 +1,162 @@
+# Copyright 2026 Niklas Glienke
+
+import sqlite3
+
+import pytest
+
+from cvw22_operations_officer.utils.migrations import (
+    get_migrations,
+    migrate,
+)
+
+
+def get_user_version(db_path):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / "0001_first.sql").write_text(
+        "CREATE TABLE first (value TEXT);"
+    )
+    (migrations_dir / "0002_second.sql").write_text(
+        "INSERT INTO first (value) VALUES ('second');"
+    )
+    (migrations_dir / "README.md").write_text("Not a migration.")
+
+    return migrations_dir
+
+
+def test_get_migrations(migrations_dir):
+    migrations = get_migrations(migrations_dir)
+
+    assert [migration.version for migration in migrations] == [1, 2]
+    assert [migration.path.name for migration in migrations] == [
+        "0001_first.sql",
+        "0002_second.sql",
+    ]
+
+
+def test_get_migrations_gap(migrations_dir):
+    (migrations_dir / "0004_fourth.sql").write_text("SELECT 1;")
+
+    with pytest.raises(ValueError, match="0004_fourth.sql"):
+        get_migrations(migrations_dir)
+
+
+def test_migrate(tmp_path, migrations_dir):
+    db_path = tmp_path / "test.db"
+
+    assert migrate(db_path, migrations_dir) == 2
+    assert get_user_version(db_path) == 2
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT value FROM first").fetchall() == [
+            ("second",)
+        ]
+
+
+def test_migrate_is_idempotent(tmp_path, migrations_dir):
+    db_path = tmp_path / "test.db"
+    migrate(db_path, migrations_dir)
+
+    assert migrate(db_path, migrations_dir) == 2
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM first").fetchone() == (
+            1,
+        )
+
+
+def test_migrate_only_pending(tmp_path, migrations_dir):
+    db_path = tmp_path / "test.db"
+    migrate(db_path, migrations_dir)
+    (migrations_dir / "0003_third.sql").write_text(
+        "INSERT INTO first (value) VALUES ('third');"
+    )
+
+    assert migrate(db_path, migrations_dir) == 3
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT value FROM first").fetchall() == [
+            ("second",),
+            ("third",),
+        ]
+
+
+def test_migrate_rolls_back_failed_migration(tmp_path, migrations_dir):
+    db_path = tmp_path / "test.db"
+    (migrations_dir / "0003_broken.sql").write_text(
+        "INSERT INTO first (value) VALUES ('third');\n"
+        "INSERT INTO missing (value) VALUES ('broken');"
+    )
+
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(db_path, migrations_dir)
+
+    assert get_user_version(db_path) == 2
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM first").fetchone() == (
+            1,
+        )
+
+
+def test_migrate_newer_database(tmp_path, migrations_dir):
+    db_path = tmp_path / "test.db"
+
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("PRAGMA user_version = 3")
+
+    with pytest.raises(RuntimeError, match="newer"):
+        migrate(db_path, migrations_dir)
+
+
+def test_migrate_unversioned_database(tmp_path, caplog):
+    db_path = tmp_path / "test.db"
+
+    with sqlite3.connect(db_path) as connection:
+        connection.executescript(
+            """
+            CREATE TABLE brevity_term (
+                brevity_term_id INTEGER PRIMARY KEY,
+                term TEXT NOT NULL,
+                description TEXT NOT NULL,
+                used_in_digest INTEGER NOT NULL
+            );
+            INSERT INTO brevity_term (term, description, used_in_digest)
+            VALUES
+                ('BOGEY', 'Unknown contact.', 0),
+                ('Bogey', 'Duplicate.', 1),
+                ('BANDIT', 'Enemy aircraft.', 0);
+            """
+        )
+
+    assert migrate(db_path) == len(get_migrations())
+
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute(
+            "SELECT term FROM brevity_term ORDER BY brevity_term_id"
+        ).fetchall() == [("BOGEY",), ("BANDIT",)]
+        assert connection.execute(
+            "SELECT brevity_term_id, term, description, kept_brevity_term_id "
+            "FROM brevity_term_duplicate"
+        ).fetchall() == [(2, "Bogey", "Duplicate.", 1)]
+        assert connection.execute(
+            "SELECT term FROM brevity_term_fts WHERE brevity_term_fts "
+            "MATCH 'enemy'"
+        ).fetchall() == [("BANDIT",)]
+        assert connection.execute(
+            "SELECT epoch FROM digest_state"
+        ).fetchall() == [(0,)]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            connection.execute(
+                "INSERT INTO brevity_term (term, description, used_in_digest) "
+                "VALUES ('bandit', 'Duplicate.', 0)"
+            )
+
+    assert "duplicate brevity term 'Bogey' of 'BOGEY'" in caplog.text
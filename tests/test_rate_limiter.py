@@ -0,0 +1,74 @@
+# Copyright 2026 Niklas Glienke
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from cvw22_operations_officer.models.config_model import (
+    RateLimitConfig,
+    RateLimitsConfig,
+)
+from cvw22_operations_officer.utils.rate_limiter import (
+    CommandRateLimiter,
+    RateLimitExceeded,
+)
+
+
+def get_message(author_id, channel_id=1, guild_id=1):
+    message = MagicMock()
+    message.author.id = author_id
+    message.channel.id = channel_id
+    message.guild.id = guild_id
+
+    return message
+
+
+def test_check_within_rate():
+    rate_limiter = CommandRateLimiter(
+        RateLimitsConfig(user=RateLimitConfig(2, 60))
+    )
+
+    rate_limiter.check(get_message(1))
+    rate_limiter.check(get_message(1))
+    rate_limiter.check(get_message(2))
+
+
+def test_check_rate_exceeded():
+    rate_limiter = CommandRateLimiter(
+        RateLimitsConfig(user=RateLimitConfig(1, 60))
+    )
+    rate_limiter.check(get_message(1))
+
+    with pytest.raises(RateLimitExceeded) as first_error:
+        rate_limiter.check(get_message(1))
+
+    with pytest.raises(RateLimitExceeded) as second_error:
+        rate_limiter.check(get_message(1))
+
+    assert first_error.value.scope == "user"
+    assert 0 < first_error.value.retry_after <= 60
+    assert first_error.value.is_first
+    assert not second_error.value.is_first
+
+
+def test_check_channel_shared_by_users():
+    rate_limiter = CommandRateLimiter(
+        RateLimitsConfig(
+            user=RateLimitConfig(5, 60), channel=RateLimitConfig(2, 60)
+        )
+    )
+    rate_limiter.check(get_message(1))
+    rate_limiter.check(get_message(2))
+    rate_limiter.check(get_message(3, channel_id=2))
+
+    with pytest.raises(RateLimitExceeded) as error:
+        rate_limiter.check(get_message(3))
+
+    assert error.value.scope == "channel"
+
+
+def test_check_unlimited():
+    rate_limiter = CommandRateLimiter(RateLimitsConfig())
+
+    for _ in range(100):
+        rate_limiter.check(get_message(1))
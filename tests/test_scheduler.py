@@ -0,0 +1,194 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+import datetime
+from unittest.mock import AsyncMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from cvw22_operations_officer.utils.scheduler import (
+    Scheduler,
+    get_next_run_time,
+    utc_now,
+)
+
+ZURICH = ZoneInfo("Europe/Zurich")
+UTC = datetime.UTC
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(datetime.datetime(2025, 1, 1, 10, 0, tzinfo=UTC))
+
+
+def test_utc_now():
+    assert utc_now().tzinfo == UTC
+
+
+@pytest.mark.parametrize(
+    "after, next_run",
+    [
+        (
+            datetime.datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+            datetime.datetime(2025, 1, 1, 11, 0, tzinfo=UTC),
+        ),
+        (
+            datetime.datetime(2025, 1, 1, 11, 0, tzinfo=UTC),
+            datetime.datetime(2025, 1, 2, 11, 0, tzinfo=UTC),
+        ),
+        (
+            datetime.datetime(2025, 7, 1, 9, 0, tzinfo=UTC),
+            datetime.datetime(2025, 7, 1, 10, 0, tzinfo=UTC),
+        ),
+        (
+            datetime.datetime(2025, 3, 29, 12, 0, tzinfo=UTC),
+            datetime.datetime(2025, 3, 30, 10, 0, tzinfo=UTC),
+        ),
+    ],
+)
+def test_get_next_run_time(after, next_run):
+    assert get_next_run_time(datetime.time(12, 0), ZURICH, after) == next_run
+
+
+def test_get_next_run_time_nonexistent_local_time():
+    after = datetime.datetime(2025, 3, 29, 12, 0, tzinfo=UTC)
+
+    next_run = get_next_run_time(datetime.time(2, 30), ZURICH, after)
+
+    assert next_run == datetime.datetime(2025, 3, 30, 1, 30, tzinfo=UTC)
+
+
+def test_get_next_run_time_ambiguous_local_time():
+    after = datetime.datetime(2025, 10, 25, 12, 0, tzinfo=UTC)
+
+    first_run = get_next_run_time(datetime.time(2, 30), ZURICH, after)
+    second_run = get_next_run_time(datetime.time(2, 30), ZURICH, first_run)
+
+    assert first_run == datetime.datetime(2025, 10, 26, 0, 30, tzinfo=UTC)
+    assert second_run == datetime.datetime(2025, 10, 27, 1, 30, tzinfo=UTC)
+
+
+def test_schedule_and_unschedule(clock):
+    scheduler = Scheduler(clock=clock)
+
+    job = scheduler.schedule("job", datetime.time(12, 0), ZURICH, AsyncMock())
+
+    assert job.next_run == datetime.datetime(2025, 1, 1, 11, 0, tzinfo=UTC)
+    assert scheduler.jobs == {"job": job}
+
+    scheduler.unschedule("job")
+    scheduler.unschedule("job")
+
+    assert scheduler.jobs == {}
+
+
+@pytest.mark.asyncio
+async def test_run_due_jobs(clock):
+    callback = AsyncMock()
+    scheduler = Scheduler(clock=clock)
+    job = scheduler.schedule("job", datetime.time(12, 0), ZURICH, callback)
+
+    scheduler._run_due_jobs()
+    await asyncio.sleep(0)
+
+    callback.assert_not_called()
+
+    clock.now = datetime.datetime(2025, 1, 1, 11, 30, tzinfo=UTC)
+    scheduler._run_due_jobs()
+    await asyncio.sleep(0)
+
+    callback.assert_awaited_once()
+    assert job.next_run == datetime.datetime(2025, 1, 2, 11, 0, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_run_due_jobs_skips_after_catch_up_window(clock):
+    callback = AsyncMock()
+    scheduler = Scheduler(catch_up_window=datetime.timedelta(0), clock=clock)
+    job = scheduler.schedule("job", datetime.time(12, 0), ZURICH, callback)
+
+    clock.now = datetime.datetime(2025, 1, 1, 11, 30, tzinfo=UTC)
+    scheduler._run_due_jobs()
+    await asyncio.sleep(0)
+
+    callback.assert_not_called()
+    assert job.next_run == datetime.datetime(2025, 1, 2, 11, 0, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_run_job_logs_exception(clock):
+    callback = AsyncMock(side_effect=RuntimeError("Test Error."))
+    scheduler = Scheduler(clock=clock)
+    job = scheduler.schedule("job", datetime.time(12, 0), ZURICH, callback)
+
+    await scheduler._run_job(job)
+
+    callback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_due_jobs_claims_run(clock):
+    callback = AsyncMock()
+    claim = AsyncMock(side_effect=[True, False])
+    scheduler = Scheduler(clock=clock, claim=claim)
+    scheduler.schedule("job", datetime.time(12, 0), ZURICH, callback)
+
+    clock.now = datetime.datetime(2025, 1, 1, 11, 30, tzinfo=UTC)
+    scheduler._run_due_jobs()
+    await asyncio.sleep(0)
+
+    claim.assert_awaited_once_with(
+        "job", datetime.datetime(2025, 1, 1, 11, 0, tzinfo=UTC)
+    )
+    callback.assert_awaited_once()
+
+    clock.now = datetime.datetime(2025, 1, 2, 11, 30, tzinfo=UTC)
+    scheduler._run_due_jobs()
+    await asyncio.sleep(0)
+
+    assert claim.await_count == 2
+    callback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_runs_due_job(clock):
+    callback = AsyncMock()
+    scheduler = Scheduler(clock=clock)
+    scheduler.schedule("job", datetime.time(12, 0), ZURICH, callback)
+    clock.now = datetime.datetime(2025, 1, 1, 11, 0, tzinfo=UTC)
+
+    scheduler.start()
+    scheduler.start()
+    await asyncio.sleep(0.01)
+
+    assert scheduler.is_running()
+    callback.assert_awaited_once()
+
+    await scheduler.stop()
+
+    assert not scheduler.is_running()
+
+
+@pytest.mark.asyncio
+async def test_schedule_wakes_up_running_scheduler(clock):
+    callback = AsyncMock()
+    scheduler = Scheduler(clock=clock)
+    scheduler.start()
+    await asyncio.sleep(0)
+
+    scheduler.schedule("job", datetime.time(12, 0), ZURICH, callback)
+    clock.now = datetime.datetime(2025, 1, 1, 11, 0, tzinfo=UTC)
+    await asyncio.sleep(0.01)
+
+    callback.assert_awaited_once()
+
+    await scheduler.stop()
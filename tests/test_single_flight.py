@@ -0,0 +1,112 @@
+# Copyright 2026 Niklas Glienke
+
+import asyncio
+
+import pytest
+
+from cvw22_operations_officer.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_run_shares_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def function():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    tasks = [
+        asyncio.create_task(single_flight.run("key", function))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    assert len(single_flight) == 1
+
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [1, 1, 1]
+    assert calls == 1
+    assert single_flight.shared_calls == 2
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_run_starts_new_call_after_completion():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def function():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await single_flight.run("key", function) == 1
+    assert await single_flight.run("key", function) == 2
+    assert single_flight.shared_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_run_separates_keys():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def function(value):
+        await release.wait()
+        return value
+
+    tasks = [
+        asyncio.create_task(single_flight.run(key, lambda k=key: function(k)))
+        for key in ("first", "second")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_run_shares_exception():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def function():
+        await release.wait()
+        raise LookupError("Not found")
+
+    tasks = [
+        asyncio.create_task(single_flight.run("key", function))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, LookupError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_run_cancelled_caller_keeps_call():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def function():
+        await release.wait()
+        return "result"
+
+    first_task = asyncio.create_task(single_flight.run("key", function))
+    second_task = asyncio.create_task(single_flight.run("key", function))
+    await asyncio.sleep(0)
+
+    first_task.cancel()
+    release.set()
+
+    assert await second_task == "result"
+
+    with pytest.raises(asyncio.CancelledError):
+        await first_task
@@ -0,0 +1,60 @@
+# Copyright 2026 Niklas Glienke
+
+import pytest
+
+from cvw22_operations_officer.utils.startup_profile import (
+    StartupPhase,
+    StartupProfile,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_phase():
+    clock = FakeClock()
+    startup_profile = StartupProfile(clock)
+    clock.now += 0.5
+
+    with startup_profile.phase("imports"):
+        clock.now += 0.25
+
+    assert startup_profile.phases == [StartupPhase("imports", 0.5, 0.25)]
+
+
+def test_phase_records_failed_phase():
+    clock = FakeClock()
+    startup_profile = StartupProfile(clock)
+
+    with pytest.raises(RuntimeError):
+        with startup_profile.phase("login"):
+            clock.now += 1
+            raise RuntimeError("Test Error.")
+
+    assert startup_profile.phases == [StartupPhase("login", 0.0, 1.0)]
+
+
+def test_mark_and_report():
+    clock = FakeClock()
+    startup_profile = StartupProfile(clock)
+
+    with startup_profile.phase("outer"):
+        clock.now += 0.001
+
+        with startup_profile.phase("inner"):
+            clock.now += 0.002
+
+    startup_profile.mark("ready")
+
+    assert startup_profile.elapsed == pytest.approx(0.003)
+    assert startup_profile.report().splitlines() == [
+        "phase                          start ms  duration ms",
+        "outer                               0.0          3.0",
+        "inner                               1.0          2.0",
+        "ready                               3.0          0.0",
+    ]